@@ -1 +1,2 @@
+from meilisearch.aio.client import AsyncClient as AsyncClient
 from meilisearch.client import Client as Client
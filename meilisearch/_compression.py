@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import zlib
+from collections.abc import Iterator
+from io import BufferedIOBase, RawIOBase
+from typing import Protocol
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    _HAS_ZSTD = False
+else:
+    _HAS_ZSTD = True
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    _HAS_BROTLI = False
+else:
+    _HAS_BROTLI = True
+
+CONTENT_ENCODINGS = ("gzip", "zstd", "br")
+
+
+class _Compressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+
+class _BrotliCompressor:
+    def __init__(self) -> None:
+        self._compressor = brotli.Compressor()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+
+def check_content_encoding(encoding: str) -> None:
+    """Raise if request bodies cannot be compressed with `encoding` in this environment."""
+    if encoding not in CONTENT_ENCODINGS:
+        raise ValueError(f"Unsupported compression {encoding!r}, use one of {CONTENT_ENCODINGS}.")
+    if encoding == "zstd" and not _HAS_ZSTD:
+        raise ImportError("zstd compression requires zstandard: `pip install zstandard`.")
+    if encoding == "br" and not _HAS_BROTLI:
+        raise ImportError("br compression requires brotli: `pip install brotli`.")
+
+
+def _new_compressor(encoding: str) -> _Compressor:
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor().compressobj()
+    if encoding == "br":
+        return _BrotliCompressor()
+    # wbits=31 makes zlib write a gzip header and trailer.
+    return zlib.compressobj(6, zlib.DEFLATED, 31)
+
+
+class CompressedBody:
+    """Request body compressed block by block while it is being sent.
+
+    Iterating it reads `body` (bytes or a binary file) in blocks of `block_size` bytes, so
+    neither the body nor its compressed form is ever copied as a whole. `body_size` and
+    `sent_size` count the bytes read and produced so far. A CompressedBody can only be iterated
+    once.
+    """
+
+    def __init__(
+        self,
+        encoding: str,
+        body: bytes | BufferedIOBase | RawIOBase,
+        block_size: int = 65_536,
+    ) -> None:
+        self.encoding = encoding
+        self.body = body
+        self.block_size = block_size
+        self.body_size = 0
+        self.sent_size = 0
+        self._compressor = _new_compressor(encoding)
+
+    def __iter__(self) -> Iterator[bytes]:
+        if isinstance(self.body, bytes):
+            blocks: Iterator[bytes] = (
+                self.body[start : start + self.block_size]
+                for start in range(0, len(self.body), self.block_size)
+            )
+        else:
+            reader = self.body
+            blocks = iter(lambda: reader.read(self.block_size), b"")
+
+        for block in blocks:
+            chunk = self.compress(block)
+            if chunk:
+                yield chunk
+        chunk = self.finish()
+        if chunk:
+            yield chunk
+
+    def compress(self, block: bytes) -> bytes:
+        """Compress one block of the body."""
+        self.body_size += len(block)
+        chunk = self._compressor.compress(block)
+        self.sent_size += len(chunk)
+        return chunk
+
+    def finish(self) -> bytes:
+        """Return the end of the compressed stream."""
+        chunk = self._compressor.flush()
+        self.sent_size += len(chunk)
+        return chunk
+
+    def read_all(self) -> bytes:
+        """Compress the whole body at once, for bodies already held in memory."""
+        return b"".join(self)
@@ -1,24 +1,54 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
 from collections.abc import Callable, Mapping, Sequence
-from functools import lru_cache
-from typing import Any
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import lru_cache, partial
+from io import IOBase
+from typing import Any, BinaryIO
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
 
+from meilisearch._compression import CompressedBody
+from meilisearch._single_flight import SingleFlight
+from meilisearch.circuit_breaker import CircuitBreaker, is_failure
 from meilisearch.config import Config
 from meilisearch.errors import (
     MeilisearchApiError,
+    MeilisearchCircuitOpenError,
     MeilisearchCommunicationError,
     MeilisearchTimeoutError,
 )
+from meilisearch.hedging import HedgingPolicy, is_hedgeable
+from meilisearch.json_codec import JsonCodec
+from meilisearch.load_balancer import LoadBalancer, is_balanced_read
+from meilisearch.metrics import RequestMetrics
 from meilisearch.models.index import PrefixSearch, ProximityPrecision
+from meilisearch.retry import RetryPolicy, is_idempotent
+from meilisearch.search_batching import SearchBatcher, batchable_query
+from meilisearch.search_cache import search_request_key
 from meilisearch.version import qualified_version
 
+_DEFAULT_CODEC = JsonCodec()
+
 
 class HttpRequests:
-    def __init__(self, config: Config, custom_headers: Mapping[str, str] | None = None) -> None:
+    """Send requests to Meilisearch over a pooled HTTP session.
+
+    An instance can be shared between threads: `headers` is only read while sending and each
+    request gets its own copy with the matching Content-Type.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        custom_headers: Mapping[str, str] | None = None,
+        session: requests.Session | None = None,
+    ) -> None:
         self.config = config
         self.headers = {
             "Authorization": f"Bearer {self.config.api_key}",
@@ -28,6 +58,25 @@ class HttpRequests:
         if custom_headers is not None:
             self.headers.update(custom_headers)
 
+        self.session = session if session is not None else _build_session(config)
+        # Identical searches in flight, shared by the threads sending them.
+        self._in_flight = SingleFlight() if config.coalesce_searches else None
+        self._batcher = (
+            SearchBatcher(config.search_batching, self._multi_search)
+            if config.search_batching is not None
+            else None
+        )
+        # Threads sending hedged searches, started on the first one.
+        self._executor: ThreadPoolExecutor | None = None
+        self._hedging_slots = threading.BoundedSemaphore(2 * config.pool_maxsize)
+        self._executor_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the pooled connections held by the underlying session."""
+        self.session.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
     def send_request(
         self,
         http_method: Callable,
@@ -37,6 +86,7 @@ class HttpRequests:
         | list[str]
         | bool
         | bytes
+        | BinaryIO
         | str
         | int
         | ProximityPrecision
@@ -44,40 +94,52 @@ class HttpRequests:
         content_type: str | None = None,
         *,
         serializer: type[json.JSONEncoder] | None = None,
+        after_task_uid: int | None = None,
     ) -> Any:
-        if content_type:
-            self.headers["Content-Type"] = content_type
-        else:
-            self.headers.pop("Content-Type", None)
+        headers = self._request_headers(content_type)
+        method = http_method.__name__
+        payload: Any = None
+        if method != "get":
+            # A binary file is streamed by requests in blocks, with its Content-Length.
+            payload = (
+                body
+                if isinstance(body, (bytes, IOBase))
+                else _serialize_body(body, serializer, self.config.json_codec)
+            )
+        data, compressed = self._compress(method, path, payload, headers)
+
+        policy = self.config.retry
+        # A file is consumed while it is sent, so it can only be sent again if it can be rewound.
+        rewind = payload.tell() if isinstance(payload, IOBase) and payload.seekable() else None
+        if isinstance(payload, IOBase) and rewind is None:
+            policy = None
+        idempotent = policy is not None and is_idempotent(self.config, method, path)
+
+        started = time.perf_counter()
+        status_code = None
+        attempt = 0
         try:
-            request_path = self.config.url + "/" + path
-            if http_method.__name__ == "get":
-                request = http_method(
-                    request_path,
-                    timeout=self.config.timeout,
-                    headers=self.headers,
-                )
-            elif isinstance(body, bytes):
-                request = http_method(
-                    request_path,
-                    timeout=self.config.timeout,
-                    headers=self.headers,
-                    data=body,
-                )
-            else:
-                serialize_body = isinstance(body, dict) or body
-                data = (
-                    json.dumps(body, cls=serializer)
-                    if isinstance(body, bool) or serialize_body
-                    else ""
-                    if body == ""
-                    else "null"
-                )
+            while True:
+                attempt += 1
+                if attempt > 1 and rewind is not None:
+                    payload.seek(rewind)
+                    data, compressed = self._compress(method, path, payload, headers)
+                try:
+                    request = self._send(http_method, path, headers, data, after_task_uid)
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as err:
+                    delay = _retry_delay(policy, attempt, idempotent or _not_sent(err))
+                    if delay is None:
+                        raise
+                    time.sleep(delay)
+                    continue
 
-                request = http_method(
-                    request_path, timeout=self.config.timeout, headers=self.headers, data=data
+                status_code = request.status_code
+                delay = _retry_delay(
+                    policy, attempt, idempotent, request.status_code, request.headers
                 )
-            return self.__validate(request)
+                if delay is None:
+                    return self.__validate(request)
+                time.sleep(delay)
 
         except requests.exceptions.Timeout as err:
             raise MeilisearchTimeoutError(str(err)) from err
@@ -93,9 +155,13 @@ class HttpRequests:
                 ) from err
 
             raise MeilisearchCommunicationError(str(err)) from err
+        finally:
+            _report_metrics(
+                self.config, method, path, status_code, started, data, compressed, attempt
+            )
 
-    def get(self, path: str) -> Any:
-        return self.send_request(requests.get, path)
+    def get(self, path: str, *, after_task_uid: int | None = None) -> Any:
+        return self.send_request(self.session.get, path, after_task_uid=after_task_uid)
 
     def post(
         self,
@@ -104,13 +170,61 @@ class HttpRequests:
         | Sequence[Mapping[str, Any]]
         | list[str]
         | bytes
+        | BinaryIO
         | str
         | None = None,
         content_type: str | None = "application/json",
         *,
         serializer: type[json.JSONEncoder] | None = None,
+        after_task_uid: int | None = None,
     ) -> Any:
-        return self.send_request(requests.post, path, body, content_type, serializer=serializer)
+        send = partial(
+            self.send_request,
+            self.session.post,
+            path,
+            body,
+            content_type,
+            serializer=serializer,
+            after_task_uid=after_task_uid,
+        )
+        # A read after a write must reach Meilisearch to see it.
+        if after_task_uid is not None:
+            return send()
+        query = (
+            batchable_query(self.config, path, body)
+            if self._batcher is not None and serializer is None
+            else None
+        )
+        if self._batcher is not None and query is not None:
+            send = partial(self._batcher.search, query, send)
+        shareable = self.config.search_cache is not None or self._in_flight is not None
+        key = search_request_key(self.config, path, body, self.headers) if shareable else None
+        if key is None:
+            return send()
+        return self._search(*key, send)
+
+    def _multi_search(self, queries: list[dict[str, Any]]) -> Any:
+        return self.send_request(
+            self.session.post, self.config.paths.multi_search, {"queries": queries}
+        )
+
+    def _search(self, key: str, index_uids: frozenset[str], send: Callable[[], Any]) -> Any:
+        """Answer a search from the cache, or along with the identical ones in flight."""
+        cache = self.config.search_cache
+        generation = 0
+        if cache is not None:
+            response = cache.get(key)
+            if response is not None:
+                return response
+            generation = cache.generation
+        if self._in_flight is not None:
+            # Searches sent after an invalidation must not share a response sent before it.
+            response = self._in_flight.do(f"{generation} {key}", send)
+        else:
+            response = send()
+        if cache is not None:
+            cache.put(key, index_uids, response, generation)
+        return response
 
     def patch(
         self,
@@ -123,7 +237,7 @@ class HttpRequests:
         | None = None,
         content_type: str | None = "application/json",
     ) -> Any:
-        return self.send_request(requests.patch, path, body, content_type)
+        return self.send_request(self.session.patch, path, body, content_type)
 
     def put(
         self,
@@ -133,6 +247,7 @@ class HttpRequests:
         | list[str]
         | bool
         | bytes
+        | BinaryIO
         | str
         | int
         | PrefixSearch
@@ -142,14 +257,14 @@ class HttpRequests:
         *,
         serializer: type[json.JSONEncoder] | None = None,
     ) -> Any:
-        return self.send_request(requests.put, path, body, content_type, serializer=serializer)
+        return self.send_request(self.session.put, path, body, content_type, serializer=serializer)
 
     def delete(
         self,
         path: str,
         body: Mapping[str, Any] | Sequence[Mapping[str, Any]] | list[str] | None = None,
     ) -> Any:
-        return self.send_request(requests.delete, path, body)
+        return self.send_request(self.session.delete, path, body)
 
     def post_stream(
         self,
@@ -168,35 +283,25 @@ class HttpRequests:
 
         Returns the raw response object for streaming consumption.
         """
-        if content_type:
-            self.headers["Content-Type"] = content_type
-        else:
-            self.headers.pop("Content-Type", None)
+        headers = self._request_headers(content_type)
         try:
             request_path = self.config.url + "/" + path
 
             if isinstance(body, bytes):
-                response = requests.post(
+                response = self.session.post(
                     request_path,
                     timeout=self.config.timeout,
-                    headers=self.headers,
+                    headers=headers,
                     data=body,
                     stream=True,
                 )
             else:
-                serialize_body = isinstance(body, dict) or body
-                data = (
-                    json.dumps(body, cls=serializer)
-                    if isinstance(body, bool) or serialize_body
-                    else ""
-                    if body == ""
-                    else "null"
-                )
+                data = _serialize_body(body, serializer, self.config.json_codec)
 
-                response = requests.post(
+                response = self.session.post(
                     request_path,
                     timeout=self.config.timeout,
-                    headers=self.headers,
+                    headers=headers,
                     data=data,
                     stream=True,
                 )
@@ -224,21 +329,315 @@ class HttpRequests:
 
             raise MeilisearchCommunicationError(str(err)) from err
 
-    @staticmethod
-    def __to_json(request: requests.Response) -> Any:
+    def _send(
+        self,
+        http_method: Callable,
+        path: str,
+        headers: dict[str, str],
+        data: Any,
+        after_task_uid: int | None = None,
+    ) -> requests.Response:
+        hedging = self.config.hedging
+        if hedging is None or not is_hedgeable(self.config, http_method.__name__, path):
+            return self._send_balanced(http_method, path, headers, data, after_task_uid)
+        return self._send_hedged(
+            hedging, partial(self._send_balanced, http_method, path, headers, data, after_task_uid)
+        )
+
+    def _send_hedged(
+        self, hedging: HedgingPolicy, send: Callable[[], requests.Response]
+    ) -> requests.Response:
+        def timed_send(sending: threading.Event | None = None) -> requests.Response:
+            if sending is not None:
+                sending.set()
+            started = time.monotonic()
+            response = send()
+            hedging.record(time.monotonic() - started)
+            return response
+
+        delay = hedging.hedge_delay()
+        if delay is None:
+            return timed_send()
+        sending = threading.Event()
+        original = self._submit_hedged(partial(timed_send, sending))
+        if original is None:
+            # Every thread is busy: hedging now would double the load when it is highest.
+            return timed_send()
+        # The delay starts when the request is sent, not when it is queued.
+        sending.wait()
+        if wait([original], timeout=delay).done:
+            return original.result()
+
+        hedge = self._submit_hedged(timed_send)
+        if hedge is None:
+            return original.result()
+        hedging.record_fired()
+        pending = {original, hedge}
+        errors: list[BaseException] = []
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                if error is not None:
+                    errors.append(error)
+                    continue
+                # A request in flight cannot be interrupted: the loser's response is dropped.
+                for loser in pending:
+                    if not loser.cancel():
+                        loser.add_done_callback(_close_response)
+                if future is hedge:
+                    hedging.record_won()
+                return future.result()
+        raise errors[0]
+
+    def _submit_hedged(
+        self, call: Callable[[], requests.Response]
+    ) -> Future[requests.Response] | None:
+        # Run call in a thread of the hedging executor, None if none is free.
+        if not self._hedging_slots.acquire(blocking=False):
+            return None
+        try:
+            future = self._hedging_executor().submit(call)
+        except BaseException:
+            self._hedging_slots.release()
+            raise
+        future.add_done_callback(lambda _: self._hedging_slots.release())
+        return future
+
+    def _hedging_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=2 * self.config.pool_maxsize, thread_name_prefix="meilisearch-hedge"
+                )
+            return self._executor
+
+    def _send_balanced(
+        self,
+        http_method: Callable,
+        path: str,
+        headers: dict[str, str],
+        data: Any,
+        after_task_uid: int | None = None,
+    ) -> requests.Response:
+        balancer = self.config.load_balancer
+        if balancer is None or not is_balanced_read(self.config, http_method.__name__, path):
+            return self._send_to(self.config.url, http_method, path, headers, data)
+
+        url = (
+            balancer.acquire()
+            if after_task_uid is None
+            else self._consistent_node(balancer, after_task_uid)
+        )
+        started = time.monotonic()
+        elapsed = None
+        try:
+            response = self._send_to(url, http_method, path, headers, data)
+            elapsed = time.monotonic() - started
+            return response
+        finally:
+            balancer.release(url, elapsed)
+
+    def _consistent_node(self, balancer: LoadBalancer, task_uid: int) -> str:
+        # Pick the best node that already ran the write the read must see, or the primary.
+        for url in balancer.candidates():
+            if url == balancer.primary or balancer.has_applied(url, task_uid):
+                return balancer.claim(url)
+            try:
+                response = self.session.get(
+                    f"{url}/{self.config.paths.task}/{task_uid}",
+                    timeout=self.config.timeout,
+                    headers=self.headers,
+                )
+            except requests.exceptions.RequestException:
+                continue
+            task = self.config.json_codec.decode(response.content) if response.ok else {}
+            if task.get("status") == "succeeded":
+                balancer.record_applied(url, task_uid)
+                return balancer.claim(url)
+        return balancer.claim(balancer.primary)
+
+    def _send_to(
+        self, url: str, http_method: Callable, path: str, headers: dict[str, str], data: Any
+    ) -> requests.Response:
+        breaker = self.config.circuit_breaker
+        if breaker is not None and breaker.acquire(url):
+            self._probe(breaker, url)
+
+        request_path = url + "/" + path
+        started = time.monotonic()
+        try:
+            if http_method.__name__ == "get":
+                response = http_method(request_path, timeout=self.config.timeout, headers=headers)
+            else:
+                response = http_method(
+                    request_path, timeout=self.config.timeout, headers=headers, data=data
+                )
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if breaker is not None:
+                breaker.record(url, time.monotonic() - started, failed=True)
+            raise
+        if breaker is not None:
+            breaker.record(url, time.monotonic() - started, is_failure(response.status_code))
+        return response
+
+    def _probe(self, breaker: CircuitBreaker, url: str) -> None:
+        # The circuit is half-open: check Meilisearch is back before letting requests through.
+        try:
+            response = self.session.get(
+                url + "/" + self.config.paths.health,
+                timeout=self.config.timeout,
+                headers=self.headers,
+            )
+            healthy = response.ok
+        except requests.exceptions.RequestException:
+            healthy = False
+        breaker.record_probe(url, healthy)
+        if not healthy:
+            raise MeilisearchCircuitOpenError(url, breaker.open_timeout)
+
+    def _compress(
+        self, method: str, path: str, payload: Any, headers: dict[str, str]
+    ) -> tuple[Any, CompressedBody | None]:
+        compressed = _compressed_body(self.config, method, path, payload)
+        if compressed is None:
+            return payload, None
+        headers["Content-Encoding"] = compressed.encoding
+        # In-memory bodies are compressed at once to keep a Content-Length, files on the fly.
+        return (compressed if isinstance(payload, IOBase) else compressed.read_all()), compressed
+
+    def _request_headers(self, content_type: str | None) -> dict[str, str]:
+        # Headers are built per request so a shared instance never leaks the Content-Type of
+        # one call into a concurrent one.
+        headers = dict(self.headers)
+        if content_type:
+            headers["Content-Type"] = content_type
+        else:
+            headers.pop("Content-Type", None)
+        return headers
+
+    def __to_json(self, request: requests.Response) -> Any:
         if request.content == b"":
             return request
-        return request.json()
+        return self.config.json_codec.decode(request.content)
 
-    @staticmethod
-    def __validate(request: requests.Response) -> Any:
+    def __validate(self, request: requests.Response) -> Any:
         try:
             request.raise_for_status()
-            return HttpRequests.__to_json(request)
+            return self.__to_json(request)
         except requests.exceptions.HTTPError as err:
             raise MeilisearchApiError(str(err), request) from err
 
 
+def _serialize_body(
+    body: Any,
+    serializer: type[json.JSONEncoder] | None = None,
+    codec: JsonCodec | None = None,
+) -> bytes:
+    serialize_body = isinstance(body, (bool, dict)) or body
+    if not serialize_body:
+        return b"" if body == "" else b"null"
+    if serializer is not None:
+        return json.dumps(body, cls=serializer).encode("utf-8")
+    return (codec or _DEFAULT_CODEC).encode(body)
+
+
+def _compressed_body(config: Config, method: str, path: str, data: Any) -> CompressedBody | None:
+    # Only the bodies sent to the documents and settings routes are worth compressing.
+    if config.compression is None or method.lower() == "get" or data is None:
+        return None
+    segments = path.split("?", 1)[0].strip("/").split("/")
+    if (
+        len(segments) < 3
+        or segments[0] != config.paths.index
+        or segments[2] not in (config.paths.document, config.paths.setting)
+    ):
+        return None
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if isinstance(data, bytes) and len(data) < config.compression_min_size:
+        return None
+    return CompressedBody(config.compression, data)
+
+
+def _retry_delay(
+    policy: RetryPolicy | None,
+    attempt: int,
+    retryable: bool,
+    status_code: int | None = None,
+    headers: Mapping[str, str] | None = None,
+) -> float | None:
+    # Return how long to wait before sending the request again, or None to stop there. Without
+    # a status code the attempt failed before a response was received.
+    if policy is None:
+        return None
+    if status_code is not None and status_code not in policy.retry_statuses:
+        policy.record_success()
+        return None
+    if not retryable:
+        return None
+    return policy.next_delay(attempt, headers)
+
+
+def _close_response(future: Future[requests.Response]) -> None:
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+def _not_sent(err: requests.exceptions.RequestException) -> bool:
+    # True when the connection could not be established, so the server never saw the request.
+    if isinstance(err, requests.exceptions.ConnectTimeout):
+        return True
+    reason = getattr(err.args[0], "reason", None) if err.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+def _report_metrics(
+    config: Config,
+    method: str,
+    path: str,
+    status_code: int | None,
+    started: float,
+    data: Any,
+    compressed: CompressedBody | None,
+    attempts: int = 1,
+) -> None:
+    if config.on_request_metrics is None:
+        return
+    encoding: str | None = None
+    body_size: int | None = len(data) if isinstance(data, (bytes, str)) else None
+    sent_size = body_size
+    if compressed is not None:
+        encoding = compressed.encoding
+        body_size, sent_size = compressed.body_size, compressed.sent_size
+    config.on_request_metrics(
+        RequestMetrics(
+            method=method.upper(),
+            path=path,
+            status_code=status_code,
+            elapsed=time.perf_counter() - started,
+            content_encoding=encoding,
+            body_size=body_size,
+            sent_size=sent_size,
+            attempts=attempts,
+        )
+    )
+
+
+def _build_session(config: Config) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=config.pool_connections,
+        pool_maxsize=config.pool_maxsize,
+        pool_block=config.pool_block,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if not config.keep_alive:
+        session.headers["Connection"] = "close"
+    return session
+
+
 @lru_cache(maxsize=1)
 def _build_user_agent(client_agents: tuple[str, ...] | None = None) -> str:
     user_agent = qualified_version()
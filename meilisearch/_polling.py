@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from time import monotonic
+from typing import Any
+
+from meilisearch.errors import (
+    MeilisearchApiError,
+    MeilisearchCommunicationError,
+    MeilisearchError,
+    MeilisearchTimeoutError,
+)
+
+MIN_INTERVAL_IN_MS = 10
+BACKOFF_FACTOR = 2
+
+
+class PollingSchedule:
+    """Decide how long to sleep between two polls of an unfinished task.
+
+    With a fixed `interval_in_ms` every sleep lasts that long. Otherwise sleeps start at
+    MIN_INTERVAL_IN_MS and double after every poll up to `max_interval_in_ms`, so short tasks
+    are seen finished quickly and long ones are not polled thousands of times. When the
+    progress of the task's batch is reported, the remaining time is estimated from the rate
+    at which it advances and the next poll is scheduled for then, within the same bounds.
+    """
+
+    def __init__(
+        self,
+        interval_in_ms: int | None = None,
+        max_interval_in_ms: int = 1000,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.interval_in_ms = interval_in_ms
+        self.clock = clock
+        self.max_interval_in_ms = max(max_interval_in_ms, MIN_INTERVAL_IN_MS)
+        self._backoff_in_ms = float(MIN_INTERVAL_IN_MS)
+        # First (time, percentage) progress observation of the batch.
+        self._progress_start: tuple[float, float] | None = None
+
+    @property
+    def adaptive(self) -> bool:
+        return self.interval_in_ms is None
+
+    def next_delay(self, percentage: float | None = None) -> float:
+        """Return the number of seconds to sleep before the next poll.
+
+        `percentage` is the progress of the task's batch, between 0 and 100, if known.
+        """
+        if self.interval_in_ms is not None:
+            return self.interval_in_ms / 1000
+
+        delay_in_ms = self._backoff_in_ms
+        self._backoff_in_ms = min(self._backoff_in_ms * BACKOFF_FACTOR, self.max_interval_in_ms)
+        remaining_in_ms = self._remaining_in_ms(percentage)
+        if remaining_in_ms is not None:
+            delay_in_ms = min(max(remaining_in_ms, MIN_INTERVAL_IN_MS), self.max_interval_in_ms)
+        return delay_in_ms / 1000
+
+    def _remaining_in_ms(self, percentage: float | None) -> float | None:
+        if percentage is None:
+            return None
+        now = self.clock()
+        if self._progress_start is None:
+            self._progress_start = (now, percentage)
+            return None
+        started, start_percentage = self._progress_start
+        if now <= started:
+            return None
+        rate = (percentage - start_percentage) / (now - started)
+        if rate <= 0:
+            return None
+        return (100 - percentage) / rate * 1000
+
+
+def batch_percentage(progress: dict[str, Any] | None) -> float | None:
+    """Return the completion percentage reported in the `progress` of a batch, if any."""
+    if not progress:
+        return None
+    percentage = progress.get("percentage")
+    return float(percentage) if isinstance(percentage, (int, float)) else None
+
+
+def is_transient(error: MeilisearchError) -> bool:
+    """Return True for the errors a later poll may not get: Meilisearch unreachable, too slow,
+    overloaded or failing, as opposed to a definitive answer such as a task not found."""
+    if isinstance(error, (MeilisearchCommunicationError, MeilisearchTimeoutError)):
+        return True
+    return isinstance(error, MeilisearchApiError) and (
+        error.status_code == 429 or error.status_code >= 500
+    )
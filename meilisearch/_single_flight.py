@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from typing import Any, Generic, TypeVar
+
+_F = TypeVar("_F", Future[Any], asyncio.Future[Any])
+
+
+class _Call(Generic[_F]):
+    def __init__(self, future: _F) -> None:
+        self.future: _F = future
+        self.followers = 0
+
+
+class SingleFlight:
+    """Share one call between the threads making an identical one while it is in flight.
+
+    The first caller of a key sends the request, the ones arriving before it completes wait
+    for its response. Everyone gets their own copy of the response when it was shared, and
+    the error is raised to everyone if it failed.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, _Call[Future[Any]]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, call: Callable[[], Any]) -> Any:
+        with self._lock:
+            shared = self._calls.get(key)
+            if shared is None:
+                leader = self._calls[key] = _Call(Future())
+            else:
+                shared.followers += 1
+        if shared is not None:
+            return copy.deepcopy(shared.future.result())
+
+        try:
+            result = call()
+        except BaseException as err:
+            leader.future.set_exception(err)
+            raise
+        else:
+            leader.future.set_result(result)
+        finally:
+            with self._lock:
+                del self._calls[key]
+        # Followers copy the response, so the leader must not change it while they do.
+        return copy.deepcopy(result) if leader.followers else result
+
+
+class AsyncSingleFlight:
+    """Asyncio counterpart of SingleFlight. The request runs in its own task, so that it goes
+    on for the other callers when the first one is cancelled."""
+
+    def __init__(self) -> None:
+        self._calls: dict[str, _Call[asyncio.Future[Any]]] = {}
+
+    async def do(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        shared = self._calls.get(key)
+        if shared is not None:
+            shared.followers += 1
+            return copy.deepcopy(await asyncio.shield(shared.future))
+
+        leader = self._calls[key] = _Call(asyncio.ensure_future(call()))
+        # Registered before anyone awaits the task, so no follower can join once it is done.
+        leader.future.add_done_callback(lambda _: self._calls.pop(key, None))
+        result = await asyncio.shield(leader.future)
+        return copy.deepcopy(result) if leader.followers else result
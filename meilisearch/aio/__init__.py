@@ -0,0 +1,3 @@
+from meilisearch.aio.client import AsyncClient as AsyncClient
+from meilisearch.aio.index import AsyncIndex as AsyncIndex
+from meilisearch.aio.task import AsyncTaskHandler as AsyncTaskHandler
@@ -0,0 +1,443 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from functools import partial
+from io import BufferedIOBase, RawIOBase
+from typing import Any
+
+from meilisearch._compression import CompressedBody
+from meilisearch._httprequests import (
+    _build_user_agent,
+    _compressed_body,
+    _report_metrics,
+    _retry_delay,
+    _serialize_body,
+)
+from meilisearch._single_flight import AsyncSingleFlight
+from meilisearch.circuit_breaker import CircuitBreaker, is_failure
+from meilisearch.config import Config
+from meilisearch.errors import (
+    MeilisearchApiError,
+    MeilisearchCircuitOpenError,
+    MeilisearchCommunicationError,
+    MeilisearchTimeoutError,
+)
+from meilisearch.hedging import HedgingPolicy, is_hedgeable
+from meilisearch.load_balancer import LoadBalancer, is_balanced_read
+from meilisearch.retry import is_idempotent
+from meilisearch.search_batching import AsyncSearchBatcher, batchable_query
+from meilisearch.search_cache import search_request_key
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    _HAS_HTTPX = False
+else:
+    _HAS_HTTPX = True
+
+
+class AsyncHttpRequests:
+    """Send requests to Meilisearch over a pooled asyncio HTTP client (httpx).
+
+    Like HttpRequests, an instance can be shared by any number of concurrent tasks: headers are
+    built per request.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        custom_headers: Mapping[str, str] | None = None,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self.config = config
+        self.headers = {
+            "Authorization": f"Bearer {self.config.api_key}",
+            "User-Agent": _build_user_agent(config.client_agents),
+        }
+
+        if custom_headers is not None:
+            self.headers.update(custom_headers)
+
+        self.client = client if client is not None else _build_async_client(config)
+        self._in_flight = AsyncSingleFlight() if config.coalesce_searches else None
+        self._batcher = (
+            AsyncSearchBatcher(config.search_batching, self._multi_search)
+            if config.search_batching is not None
+            else None
+        )
+
+    async def aclose(self) -> None:
+        """Close the pooled connections held by the underlying httpx client."""
+        await self.client.aclose()
+
+    async def send_request(
+        self,
+        http_method: str,
+        path: str,
+        body: Any = None,
+        content_type: str | None = None,
+        *,
+        serializer: type[json.JSONEncoder] | None = None,
+        after_task_uid: int | None = None,
+    ) -> Any:
+        headers = self._request_headers(content_type)
+
+        data: Any = None
+        if http_method != "GET":
+            is_file = isinstance(body, (BufferedIOBase, RawIOBase))
+            data = (
+                body
+                if isinstance(body, bytes) or is_file
+                else _serialize_body(body, serializer, self.config.json_codec)
+            )
+        policy = self.config.retry
+        is_file = isinstance(data, (BufferedIOBase, RawIOBase))
+        # A file is consumed while it is sent, so it can only be sent again if it can be rewound.
+        rewind = data.tell() if is_file and data.seekable() else None
+        if is_file and rewind is None:
+            policy = None
+        idempotent = policy is not None and is_idempotent(self.config, http_method, path)
+
+        compressed, content = self._prepare_body(http_method, path, data, headers)
+
+        started = time.perf_counter()
+        status_code = None
+        attempt = 0
+        try:
+            while True:
+                attempt += 1
+                if attempt > 1 and rewind is not None:
+                    data.seek(rewind)
+                    compressed, content = self._prepare_body(http_method, path, data, headers)
+                try:
+                    response = await self._send(http_method, path, content, headers, after_task_uid)
+                except (
+                    httpx.TimeoutException,
+                    httpx.NetworkError,
+                    httpx.RemoteProtocolError,
+                ) as err:
+                    delay = _retry_delay(policy, attempt, idempotent or _not_sent(err))
+                    if delay is None:
+                        raise
+                    await asyncio.sleep(delay)
+                    continue
+
+                status_code = response.status_code
+                delay = _retry_delay(policy, attempt, idempotent, status_code, response.headers)
+                if delay is None:
+                    break
+                await asyncio.sleep(delay)
+        except httpx.TimeoutException as err:
+            raise MeilisearchTimeoutError(str(err)) from err
+        except httpx.UnsupportedProtocol as err:
+            if "://" not in self.config.url:
+                raise MeilisearchCommunicationError(
+                    f"""
+                    Invalid URL {self.config.url}, no scheme/protocol supplied.
+                    Did you mean https://{self.config.url}?
+                    """
+                ) from err
+
+            raise MeilisearchCommunicationError(str(err)) from err
+        except httpx.TransportError as err:
+            raise MeilisearchCommunicationError(str(err)) from err
+        finally:
+            _report_metrics(
+                self.config, http_method, path, status_code, started, data, compressed, attempt
+            )
+
+        return self.__validate(response)
+
+    async def get(self, path: str, *, after_task_uid: int | None = None) -> Any:
+        return await self.send_request("GET", path, after_task_uid=after_task_uid)
+
+    async def post(
+        self,
+        path: str,
+        body: Any = None,
+        content_type: str | None = "application/json",
+        *,
+        serializer: type[json.JSONEncoder] | None = None,
+        after_task_uid: int | None = None,
+    ) -> Any:
+        send = partial(
+            self.send_request,
+            "POST",
+            path,
+            body,
+            content_type,
+            serializer=serializer,
+            after_task_uid=after_task_uid,
+        )
+        if after_task_uid is not None:
+            return await send()
+        query = (
+            batchable_query(self.config, path, body)
+            if self._batcher is not None and serializer is None
+            else None
+        )
+        if self._batcher is not None and query is not None:
+            send = partial(self._batcher.search, query, send)
+        shareable = self.config.search_cache is not None or self._in_flight is not None
+        key = search_request_key(self.config, path, body, self.headers) if shareable else None
+        if key is None:
+            return await send()
+        return await self._search(*key, send)
+
+    async def _multi_search(self, queries: list[dict[str, Any]]) -> Any:
+        return await self.send_request("POST", self.config.paths.multi_search, {"queries": queries})
+
+    async def _search(
+        self, key: str, index_uids: frozenset[str], send: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        cache = self.config.search_cache
+        generation = 0
+        if cache is not None:
+            response = cache.get(key)
+            if response is not None:
+                return response
+            generation = cache.generation
+        if self._in_flight is not None:
+            response = await self._in_flight.do(f"{generation} {key}", send)
+        else:
+            response = await send()
+        if cache is not None:
+            cache.put(key, index_uids, response, generation)
+        return response
+
+    async def patch(
+        self,
+        path: str,
+        body: Any = None,
+        content_type: str | None = "application/json",
+    ) -> Any:
+        return await self.send_request("PATCH", path, body, content_type)
+
+    async def put(
+        self,
+        path: str,
+        body: Any = None,
+        content_type: str | None = "application/json",
+        *,
+        serializer: type[json.JSONEncoder] | None = None,
+    ) -> Any:
+        return await self.send_request("PUT", path, body, content_type, serializer=serializer)
+
+    async def delete(self, path: str, body: Any = None) -> Any:
+        return await self.send_request("DELETE", path, body)
+
+    async def _send(
+        self,
+        http_method: str,
+        path: str,
+        content: Any,
+        headers: dict[str, str],
+        after_task_uid: int | None = None,
+    ) -> httpx.Response:
+        hedging = self.config.hedging
+        if hedging is None or not is_hedgeable(self.config, http_method, path):
+            return await self._send_balanced(http_method, path, content, headers, after_task_uid)
+        return await self._send_hedged(
+            hedging,
+            partial(self._send_balanced, http_method, path, content, headers, after_task_uid),
+        )
+
+    async def _send_hedged(
+        self, hedging: HedgingPolicy, send: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        async def timed_send() -> httpx.Response:
+            started = time.monotonic()
+            response = await send()
+            hedging.record(time.monotonic() - started)
+            return response
+
+        delay = hedging.hedge_delay()
+        if delay is None:
+            return await timed_send()
+        original = asyncio.ensure_future(timed_send())
+        pending = {original}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return original.result()
+
+            hedging.record_fired()
+            hedge = asyncio.ensure_future(timed_send())
+            pending.add(hedge)
+            errors: list[BaseException] = []
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    error = task.exception()
+                    if error is not None:
+                        errors.append(error)
+                        continue
+                    if task is hedge:
+                        hedging.record_won()
+                    return task.result()
+            raise errors[0]
+        finally:
+            # The losing request is cancelled, closing its connection.
+            for task in pending:
+                task.cancel()
+
+    async def _send_balanced(
+        self,
+        http_method: str,
+        path: str,
+        content: Any,
+        headers: dict[str, str],
+        after_task_uid: int | None = None,
+    ) -> httpx.Response:
+        balancer = self.config.load_balancer
+        if balancer is None or not is_balanced_read(self.config, http_method, path):
+            return await self._send_to(self.config.url, http_method, path, content, headers)
+
+        url = (
+            balancer.acquire()
+            if after_task_uid is None
+            else await self._consistent_node(balancer, after_task_uid)
+        )
+        started = time.monotonic()
+        elapsed = None
+        try:
+            response = await self._send_to(url, http_method, path, content, headers)
+            elapsed = time.monotonic() - started
+            return response
+        finally:
+            balancer.release(url, elapsed)
+
+    async def _consistent_node(self, balancer: LoadBalancer, task_uid: int) -> str:
+        # Pick the best node that already ran the write the read must see, or the primary.
+        for url in balancer.candidates():
+            if url == balancer.primary or balancer.has_applied(url, task_uid):
+                return balancer.claim(url)
+            try:
+                response = await self.client.get(
+                    f"{url}/{self.config.paths.task}/{task_uid}",
+                    headers=self.headers,
+                    timeout=self.config.timeout,
+                )
+            except httpx.HTTPError:
+                continue
+            task = self.config.json_codec.decode(response.content) if response.is_success else {}
+            if task.get("status") == "succeeded":
+                balancer.record_applied(url, task_uid)
+                return balancer.claim(url)
+        return balancer.claim(balancer.primary)
+
+    async def _send_to(
+        self, url: str, http_method: str, path: str, content: Any, headers: dict[str, str]
+    ) -> httpx.Response:
+        breaker = self.config.circuit_breaker
+        if breaker is not None and breaker.acquire(url):
+            await self._probe(breaker, url)
+
+        started = time.monotonic()
+        try:
+            response = await self.client.request(
+                http_method,
+                url + "/" + path,
+                content=content,
+                headers=headers,
+                timeout=self.config.timeout,
+            )
+        except (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError):
+            if breaker is not None:
+                breaker.record(url, time.monotonic() - started, failed=True)
+            raise
+        if breaker is not None:
+            breaker.record(url, time.monotonic() - started, is_failure(response.status_code))
+        return response
+
+    async def _probe(self, breaker: CircuitBreaker, url: str) -> None:
+        # The circuit is half-open: check Meilisearch is back before letting requests through.
+        try:
+            response = await self.client.get(
+                url + "/" + self.config.paths.health,
+                headers=self.headers,
+                timeout=self.config.timeout,
+            )
+            healthy = not response.is_error
+        except httpx.HTTPError:
+            healthy = False
+        breaker.record_probe(url, healthy)
+        if not healthy:
+            raise MeilisearchCircuitOpenError(url, breaker.open_timeout)
+
+    def _request_headers(self, content_type: str | None) -> dict[str, str]:
+        headers = dict(self.headers)
+        if content_type:
+            headers["Content-Type"] = content_type
+        else:
+            headers.pop("Content-Type", None)
+        return headers
+
+    def _prepare_body(
+        self, http_method: str, path: str, data: Any, headers: dict[str, str]
+    ) -> tuple[CompressedBody | None, bytes | str | AsyncIterator[bytes] | None]:
+        compressed = _compressed_body(self.config, http_method, path, data)
+        return compressed, _prepare_content(data, compressed, headers)
+
+    def __validate(self, response: httpx.Response) -> Any:
+        if response.is_error:
+            raise MeilisearchApiError(
+                f"{response.status_code} Error: {response.reason_phrase} for url: {response.url}",
+                response,
+            )
+        if response.content == b"":
+            return response
+        return self.config.json_codec.decode(response.content)
+
+
+def _build_async_client(config: Config) -> httpx.AsyncClient:
+    if not _HAS_HTTPX:  # pragma: no cover
+        raise ImportError(
+            "The asyncio client requires httpx. Install it with `pip install meilisearch[async]`."
+        )
+
+    limits = httpx.Limits(
+        max_connections=config.pool_maxsize,
+        max_keepalive_connections=config.pool_maxsize if config.keep_alive else 0,
+    )
+    return httpx.AsyncClient(limits=limits)
+
+
+def _not_sent(err: httpx.TransportError) -> bool:
+    # True when no connection was available, so the server never saw the request.
+    return isinstance(err, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+
+
+def _prepare_content(
+    data: Any, compressed: CompressedBody | None, headers: dict[str, str]
+) -> bytes | str | AsyncIterator[bytes] | None:
+    if compressed is not None:
+        headers["Content-Encoding"] = compressed.encoding
+    if isinstance(data, (BufferedIOBase, RawIOBase)):
+        if compressed is not None:
+            return _read_file(data, compressed)
+        # Without a Content-Length httpx would send the file with chunked encoding.
+        headers["Content-Length"] = str(os.fstat(data.fileno()).st_size - data.tell())
+        return _read_file(data)
+    if compressed is not None:
+        return compressed.read_all()
+    return data
+
+
+async def _read_file(
+    file: BufferedIOBase | RawIOBase,
+    compressed: CompressedBody | None = None,
+    chunk_size: int = 65_536,
+) -> AsyncIterator[bytes]:
+    # Reads happen in a worker thread so a slow disk never blocks the event loop.
+    while chunk := await asyncio.to_thread(file.read, chunk_size):
+        if compressed is None:
+            yield chunk
+        elif chunk := compressed.compress(chunk):
+            yield chunk
+    if compressed is not None and (chunk := compressed.finish()):
+        yield chunk
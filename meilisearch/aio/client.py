@@ -0,0 +1,499 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterable, Mapping, MutableMapping, Sequence
+from typing import TYPE_CHECKING, Any
+from urllib import parse
+
+from meilisearch.aio._httprequests import AsyncHttpRequests
+from meilisearch.aio.index import AsyncIndex
+from meilisearch.aio.task import AsyncTaskHandler, AsyncTaskPoller
+from meilisearch.client import _query_error, _split_queries
+from meilisearch.config import Config
+from meilisearch.errors import MeilisearchApiError, MeilisearchError
+from meilisearch.models.index import SizeFormat
+from meilisearch.models.task import Batch, BatchResults, Task, TaskInfo, TaskResults
+from meilisearch.webhook_receiver import TaskWebhookReceiver
+
+if TYPE_CHECKING:
+    from meilisearch.circuit_breaker import CircuitBreaker
+    from meilisearch.hedging import HedgingPolicy
+    from meilisearch.json_codec import JsonCodec
+    from meilisearch.metrics import RequestMetrics
+    from meilisearch.retry import RetryPolicy
+    from meilisearch.search_batching import SearchBatching
+    from meilisearch.search_cache import SearchCache
+
+
+class AsyncClient:
+    """
+    An asyncio client for the Meilisearch API
+
+    Mirrors Client for use from an event loop. All the AsyncIndex and AsyncTaskHandler instances
+    created by a client share its pooled connections, so many concurrent searches can be in
+    flight from one process. Close it with `await client.aclose()` or use it as an
+    `async with` context manager.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        url: str | Sequence[str],
+        api_key: str | None = None,
+        timeout: int | None = None,
+        client_agents: tuple[str, ...] | None = None,
+        custom_headers: Mapping[str, str] | None = None,
+        *,
+        pool_maxsize: int = 100,
+        keep_alive: bool = True,
+        compression: str | None = None,
+        compression_min_size: int = 1024,
+        on_request_metrics: Callable[[RequestMetrics], None] | None = None,
+        json_codec: JsonCodec | str = "stdlib",
+        retry: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        load_balancing: str = "least_outstanding",
+        health_check_interval: float | None = 5.0,
+        read_from_primary: bool = True,
+        hedging: HedgingPolicy | None = None,
+        search_cache: SearchCache | None = None,
+        coalesce_searches: bool = False,
+        search_batching: SearchBatching | None = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        url:
+            The url to the Meilisearch API (ex: http://localhost:7700), or the urls of several
+            nodes serving the same data: documents and settings are written to the first one
+            while searches and document reads are spread over all of them.
+        api_key:
+            The optional API key for Meilisearch
+        timeout (optional):
+            The amount of time in seconds that the client will wait for a response before timing
+            out.
+        client_agents (optional):
+            Used to send additional client agent information for clients extending the functionality
+            of this client.
+        custom_headers (optional):
+            Custom headers to add when sending data to Meilisearch.
+        pool_maxsize (optional):
+            Maximum number of concurrent connections to Meilisearch. Default = 100
+        keep_alive (optional):
+            If False, connections are closed after every request. Default = True
+        compression (optional):
+            Content-Encoding used to compress the bodies sent to the documents and settings
+            routes, see Client. Default = None
+        compression_min_size (optional):
+            In-memory bodies smaller than this many bytes are sent uncompressed. Default = 1024
+        on_request_metrics (optional):
+            Called with a RequestMetrics after every request. Default = None
+        json_codec (optional):
+            JsonCodec used to encode request bodies and decode responses, or the name of one:
+            'stdlib', 'orjson', 'msgspec' or 'auto' (the fastest one installed). Default = 'stdlib'
+        retry (optional):
+            RetryPolicy used to resend requests that failed with a transient error.
+            Default = None (requests are sent once)
+        circuit_breaker (optional):
+            CircuitBreaker rejecting requests at once while Meilisearch keeps failing or
+            answering slowly, instead of waiting for the timeout. Default = None
+        load_balancing (optional):
+            How reads are spread over several nodes: 'least_outstanding' (fewest requests in
+            flight) or 'ewma' (lowest average latency). Default = 'least_outstanding'
+        health_check_interval (optional):
+            Seconds between two background health checks of the nodes, None to disable them.
+            Unhealthy nodes receive no reads until they recover. Default = 5.0
+        read_from_primary (optional):
+            If False, the first node only receives writes and reads go to the other nodes,
+            unless none of them is healthy. Default = True
+        hedging (optional):
+            HedgingPolicy sending a duplicate of the searches that are slower than usual and
+            keeping the first response. Default = None
+        search_cache (optional):
+            SearchCache answering identical searches, facet searches and multi-searches from
+            memory until their index changes. Default = None
+        coalesce_searches (optional):
+            If True, identical searches, facet searches and multi-searches sent concurrently
+            share a single request, and each caller gets its own copy of the response.
+            Default = False
+        search_batching (optional):
+            SearchBatching gathering the index searches made concurrently, from threads or
+            tasks, into multi-search requests. Default = None
+        """
+        self.config = Config(
+            url,
+            api_key,
+            timeout=timeout,
+            client_agents=client_agents,
+            pool_maxsize=pool_maxsize,
+            keep_alive=keep_alive,
+            compression=compression,
+            compression_min_size=compression_min_size,
+            on_request_metrics=on_request_metrics,
+            json_codec=json_codec,
+            retry=retry,
+            circuit_breaker=circuit_breaker,
+            load_balancing=load_balancing,
+            health_check_interval=health_check_interval,
+            read_from_primary=read_from_primary,
+            hedging=hedging,
+            search_cache=search_cache,
+            coalesce_searches=coalesce_searches,
+            search_batching=search_batching,
+        )
+
+        self._custom_headers = custom_headers
+
+        self.http = AsyncHttpRequests(self.config, custom_headers)
+
+        self.task_handler = AsyncTaskHandler(self.config, custom_headers, http=self.http)
+
+        self.task_poller = AsyncTaskPoller(self.task_handler)
+
+    async def __aenter__(self) -> AsyncClient:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections of the client."""
+        await self.stop_listening_for_tasks()
+        await self.task_poller.aclose()
+        await self.http.aclose()
+        if self.config.load_balancer is not None:
+            await asyncio.to_thread(self.config.load_balancer.close)
+
+    def index(self, uid: str) -> AsyncIndex:
+        """Create a local reference to an index identified by UID, without doing an HTTP call.
+
+        Parameters
+        ----------
+        uid:
+            UID of the index.
+
+        Returns
+        -------
+        index:
+            An AsyncIndex instance.
+        """
+        if uid is not None:
+            return AsyncIndex(
+                self.config,
+                uid=uid,
+                custom_headers=self._custom_headers,
+                http=self.http,
+                task_poller=self.task_poller,
+            )
+        raise ValueError("The index UID should not be None")
+
+    async def create_index(
+        self,
+        uid: str,
+        options: Mapping[str, Any] | None = None,
+        *,
+        metadata: str | None = None,
+    ) -> TaskInfo:
+        """Create an index.
+
+        Parameters
+        ----------
+        uid: str
+            UID of the index.
+        options (optional): dict
+            Options passed during index creation (ex: primaryKey).
+        metadata (optional):
+            Custom metadata string to attach to the task.
+        """
+        return await AsyncIndex.create(
+            self.config,
+            uid,
+            options,
+            custom_headers=self._custom_headers,
+            metadata=metadata,
+            http=self.http,
+        )
+
+    async def delete_index(self, uid: str, *, metadata: str | None = None) -> TaskInfo:
+        """Deletes an index."""
+        url = f"{self.config.paths.index}/{uid}"
+        if metadata is not None:
+            url += f"?{parse.urlencode({'customMetadata': metadata})}"
+        task = await self.http.delete(url)
+
+        return TaskInfo(**task)
+
+    async def get_indexes(
+        self, parameters: Mapping[str, Any] | None = None
+    ) -> dict[str, list[AsyncIndex]]:
+        """Get all indexes.
+
+        Returns
+        -------
+        indexes:
+            Dictionary with limit, offset, total and results a list of AsyncIndex instances.
+        """
+        response = await self.get_raw_indexes(parameters)
+        response["results"] = [
+            AsyncIndex(
+                self.config,
+                index["uid"],
+                index["primaryKey"],
+                index["createdAt"],
+                index["updatedAt"],
+                custom_headers=self._custom_headers,
+                http=self.http,
+                task_poller=self.task_poller,
+            )
+            for index in response["results"]
+        ]
+        return response
+
+    async def get_raw_indexes(self, parameters: Mapping[str, Any] | None = None) -> Any:
+        """Get all indexes in dictionary format."""
+        if parameters is None:
+            parameters = {}
+        return await self.http.get(f"{self.config.paths.index}?{parse.urlencode(parameters)}")
+
+    async def get_index(self, uid: str) -> AsyncIndex:
+        """Get the index. This index should already exist."""
+        return await self.index(uid).fetch_info()
+
+    async def get_raw_index(self, uid: str) -> dict[str, Any]:
+        """Get the index as a dictionary. This index should already exist."""
+        return await self.http.get(f"{self.config.paths.index}/{uid}")
+
+    async def multi_search(
+        self,
+        queries: Sequence[Mapping[str, Any]],
+        federation: dict[str, Any] | None = None,
+        *,
+        after_task_uid: int | None = None,
+        chunk_size: int | None = None,
+        max_concurrency: int = 4,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Multi-index search.
+
+        Parameters
+        ----------
+        queries:
+            List of dictionaries containing the specified indexes and their search queries
+            https://www.meilisearch.com/docs/reference/api/search#search-in-an-index
+        federation: (optional):
+            Dictionary containing offset and limit for federated search.
+            https://www.meilisearch.com/docs/reference/api/multi_search
+        after_task_uid (optional):
+            task_uid of a write this read must see, see Index.search. Default = None
+        chunk_size (optional):
+            Number of queries sent at most in one request, see Client.multi_search.
+            Default = None (all the queries in one request)
+        max_concurrency (optional):
+            Number of requests sent at the same time when the queries are split. Default = 4
+
+        Returns
+        -------
+        results:
+            Dictionary of results for each search query
+        """
+        if chunk_size is None:
+            return await self.http.post(
+                f"{self.config.paths.multi_search}",
+                body={"queries": queries, "federation": federation},
+                after_task_uid=after_task_uid,
+            )
+        if federation is not None:
+            raise ValueError("A federated multi-search cannot be split into chunks.")
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        parts = await asyncio.gather(
+            *(
+                self._multi_search_chunk(chunk, after_task_uid, semaphore)
+                for chunk in _split_queries(queries, chunk_size)
+            )
+        )
+        return {"results": [result for part in parts for result in part]}
+
+    async def _multi_search_chunk(
+        self,
+        queries: Sequence[Mapping[str, Any]],
+        after_task_uid: int | None,
+        semaphore: asyncio.Semaphore,
+    ) -> list[dict[str, Any]]:
+        """See Client._multi_search_chunk."""
+        try:
+            async with semaphore:
+                response = await self.http.post(
+                    f"{self.config.paths.multi_search}",
+                    body={"queries": queries, "federation": None},
+                    after_task_uid=after_task_uid,
+                )
+        except MeilisearchApiError as err:
+            if err.type != "invalid_request":
+                # Not caused by a query, every query would fail alike.
+                raise
+            if len(queries) == 1:
+                return [_query_error(queries[0], err)]
+            middle = len(queries) // 2
+            first = await self._multi_search_chunk(queries[:middle], after_task_uid, semaphore)
+            return first + await self._multi_search_chunk(
+                queries[middle:], after_task_uid, semaphore
+            )
+        return response["results"]
+
+    async def get_all_stats(
+        self,
+        *,
+        show_internal_database_sizes: bool | None = None,
+        size_format: SizeFormat | str | None = None,
+    ) -> dict[str, Any]:
+        """Get all stats of Meilisearch.
+
+        https://www.meilisearch.com/docs/reference/api/stats
+        """
+        params: dict[str, Any] = {}
+        if show_internal_database_sizes is not None:
+            params["showInternalDatabaseSizes"] = str(show_internal_database_sizes).lower()
+        if size_format is not None:
+            params["sizeFormat"] = (
+                size_format.value if isinstance(size_format, SizeFormat) else size_format
+            )
+
+        path = self.config.paths.stat
+        if params:
+            path = f"{path}?{parse.urlencode(params)}"
+        return await self.http.get(path)
+
+    async def health(self) -> dict[str, str]:
+        """Get health of the Meilisearch server."""
+        return await self.http.get(self.config.paths.health)
+
+    async def is_healthy(self) -> bool:
+        """Get health of the Meilisearch server."""
+        try:
+            await self.health()
+        except MeilisearchError:
+            return False
+        return True
+
+    async def get_version(self) -> dict[str, str]:
+        """Get version Meilisearch."""
+        return await self.http.get(self.config.paths.version)
+
+    async def version(self) -> dict[str, str]:
+        """Alias for get_version."""
+        return await self.get_version()
+
+    async def get_tasks(self, parameters: MutableMapping[str, Any] | None = None) -> TaskResults:
+        """Get all tasks."""
+        return await self.task_handler.get_tasks(parameters=parameters)
+
+    async def get_task(self, uid: int) -> Task:
+        """Get one task."""
+        return await self.task_handler.get_task(uid)
+
+    async def cancel_tasks(
+        self, parameters: MutableMapping[str, Any], *, metadata: str | None = None
+    ) -> TaskInfo:
+        """Cancel a list of enqueued or processing tasks."""
+        return await self.task_handler.cancel_tasks(parameters=parameters, metadata=metadata)
+
+    async def delete_tasks(
+        self, parameters: MutableMapping[str, Any], *, metadata: str | None = None
+    ) -> TaskInfo:
+        """Delete a list of finished tasks."""
+        return await self.task_handler.delete_tasks(parameters=parameters, metadata=metadata)
+
+    async def wait_for_task(
+        self,
+        uid: int,
+        timeout_in_ms: int = 5000,
+        interval_in_ms: int | None = None,
+        *,
+        max_interval_in_ms: int = 1000,
+    ) -> Task:
+        """Wait until Meilisearch processes a task until it fails or succeeds.
+
+        Parameters
+        ----------
+        uid:
+            Identifier of the task to wait for being processed.
+        timeout_in_ms (optional):
+            Time the method should wait before raising a MeilisearchTimeoutError
+        interval_in_ms (optional):
+            Fixed time interval the method should wait (sleep) between requests
+            Default = None (starts at 10ms and doubles after each request)
+        max_interval_in_ms (optional):
+            Longest time interval between requests when the interval is adaptive. Default = 1000
+        """
+        return await self.task_handler.wait_for_task(
+            uid, timeout_in_ms, interval_in_ms, max_interval_in_ms=max_interval_in_ms
+        )
+
+    def wait_for_tasks(
+        self,
+        uids: Iterable[int],
+        timeout_in_ms: int = 5000,
+        interval_in_ms: int | None = None,
+        *,
+        max_interval_in_ms: int = 1000,
+        fail_fast: bool = False,
+    ) -> AsyncIterator[Task]:
+        """Wait until Meilisearch processes several tasks, yielding each one once it fails or
+        succeeds. See Client.wait_for_tasks."""
+        return self.task_handler.wait_for_tasks(
+            uids,
+            timeout_in_ms,
+            interval_in_ms,
+            max_interval_in_ms=max_interval_in_ms,
+            fail_fast=fail_fast,
+        )
+
+    def watch_task(self, task: TaskInfo | int) -> asyncio.Future[Task]:
+        """Return a future resolved once Meilisearch processed the task. See Client.watch_task."""
+        return self.task_poller.watch(task)
+
+    async def listen_for_tasks(
+        self, receiver: TaskWebhookReceiver | None = None
+    ) -> TaskWebhookReceiver:
+        """Start a webhook receiver and register it in Meilisearch, so that waiting for tasks
+        is resolved by Meilisearch notifications instead of polling. See
+        Client.listen_for_tasks."""
+        await self.stop_listening_for_tasks()
+        receiver = receiver if receiver is not None else TaskWebhookReceiver()
+        await asyncio.to_thread(receiver.start)
+        try:
+            webhook = await self.http.post(
+                self.config.paths.webhooks,
+                {"url": receiver.url, "headers": {"Authorization": f"Bearer {receiver.token}"}},
+            )
+        except MeilisearchError:
+            await asyncio.to_thread(receiver.close)
+            raise
+        receiver.webhook_uuid = webhook["uuid"]
+        loop = asyncio.get_running_loop()
+        receiver.add_listener(lambda task: loop.call_soon_threadsafe(self.task_poller.notify, task))
+        if self.config.search_cache is not None:
+            receiver.add_listener(self.config.search_cache.observe)
+        self.config.task_webhook = receiver
+        return receiver
+
+    async def stop_listening_for_tasks(self) -> None:
+        """Delete the webhook registered by listen_for_tasks and stop its receiver."""
+        receiver = self.config.task_webhook
+        if receiver is None:
+            return
+        self.config.task_webhook = None
+        try:
+            if receiver.webhook_uuid is not None:
+                await self.http.delete(f"{self.config.paths.webhooks}/{receiver.webhook_uuid}")
+        except MeilisearchError:
+            pass
+        finally:
+            await asyncio.to_thread(receiver.close)
+
+    async def get_batches(self, parameters: MutableMapping[str, Any] | None = None) -> BatchResults:
+        """Get all batches."""
+        return await self.task_handler.get_batches(parameters=parameters)
+
+    async def get_batch(self, uid: int) -> Batch:
+        """Get one tasks batch."""
+        return await self.task_handler.get_batch(uid)
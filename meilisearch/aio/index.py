@@ -0,0 +1,1435 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Mapping,
+    MutableMapping,
+    Sequence,
+)
+from datetime import datetime
+from os import PathLike
+from typing import TYPE_CHECKING, Any, TypeVar
+from urllib import parse
+
+from camel_converter import to_snake
+
+from meilisearch._utils import iso_to_date_time
+from meilisearch.aio._httprequests import AsyncHttpRequests
+from meilisearch.aio.task import AsyncTaskHandler, AsyncTaskPoller
+from meilisearch.config import Config
+from meilisearch.index import (
+    Index,
+    _build_documents_url,
+    _documents_pages,
+    _encode_ndjson_record,
+    _guess_content_type,
+    _next_page,
+    _page_limit,
+    _parse_embedder,
+    _parse_settings,
+    _RecordPacker,
+    _search_pages,
+    _serialize_embedders,
+)
+from meilisearch.models.document import Document, DocumentsResults, FieldsResults
+from meilisearch.models.embedders import Embedders
+from meilisearch.models.index import (
+    Faceting,
+    IndexStats,
+    LocalizedAttributes,
+    Pagination,
+    PrefixSearch,
+    ProximityPrecision,
+    SizeFormat,
+    TypoTolerance,
+)
+from meilisearch.models.task import Task, TaskInfo, TaskResults
+
+if TYPE_CHECKING:
+    from json import JSONEncoder
+
+_T = TypeVar("_T")
+
+
+class AsyncIndex:
+    """
+    Asyncio counterpart of Index.
+
+    Every method mirrors the Index method of the same name and returns the same models, but
+    must be awaited. https://www.meilisearch.com/docs/reference/api/indexes
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        uid: str,
+        primary_key: str | None = None,
+        created_at: datetime | str | None = None,
+        updated_at: datetime | str | None = None,
+        custom_headers: Mapping[str, str] | None = None,
+        http: AsyncHttpRequests | None = None,
+        task_poller: AsyncTaskPoller | None = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        config:
+            Config object containing permission and location of Meilisearch.
+        uid:
+            UID of the index on which to perform the index actions.
+        primary_key:
+            Primary-key of the index.
+        http (optional):
+            AsyncHttpRequests instance to share, so that the connection pool of the client is reused.
+        task_poller (optional):
+            AsyncTaskPoller to share, so that the tasks of the client are polled together.
+        """
+        self.config = config
+        self.http = http if http is not None else AsyncHttpRequests(config, custom_headers)
+        self.task_handler = AsyncTaskHandler(config, custom_headers, http=self.http)
+        self.task_poller = (
+            task_poller if task_poller is not None else AsyncTaskPoller(self.task_handler)
+        )
+        self.uid = uid
+        self.primary_key = primary_key
+        self.created_at = iso_to_date_time(created_at)
+        self.updated_at = iso_to_date_time(updated_at)
+
+    async def delete(self, *, metadata: str | None = None) -> TaskInfo:
+        """Delete the index.
+
+        Parameters
+        ----------
+        metadata (optional):
+            Custom metadata string to attach to the task.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+        """
+        url = f"{self.config.paths.index}/{self.uid}"
+        if metadata is not None:
+            url += f"?{parse.urlencode({'customMetadata': metadata})}"
+        task = await self.http.delete(url)
+
+        return TaskInfo(**task)
+
+    async def update(
+        self,
+        primary_key: str | None = None,
+        new_uid: str | None = None,
+        *,
+        metadata: str | None = None,
+    ) -> TaskInfo:
+        """Update the index primary-key or rename the index.
+
+        Parameters
+        ----------
+        primary_key:
+            The primary key to use for the index.
+        new_uid : str, optional
+            The new UID to rename the index.
+        metadata (optional):
+            Custom metadata string to attach to the task.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+        """
+        if primary_key is None and new_uid is None:
+            raise ValueError(
+                "You must provide either 'primary_key' or 'new_uid' to update the index."
+            )
+
+        payload = {}
+        if primary_key is not None:
+            payload["primaryKey"] = primary_key
+        if new_uid is not None:
+            payload["uid"] = new_uid
+
+        url = f"{self.config.paths.index}/{self.uid}"
+        if metadata is not None:
+            url += f"?{parse.urlencode({'customMetadata': metadata})}"
+        task = await self.http.patch(url, payload)
+
+        return TaskInfo(**task)
+
+    async def fetch_info(self) -> AsyncIndex:
+        """Fetch the info of the index."""
+        index_dict = await self.http.get(f"{self.config.paths.index}/{self.uid}")
+        self.primary_key = index_dict["primaryKey"]
+        self.created_at = iso_to_date_time(index_dict["createdAt"])
+        self.updated_at = iso_to_date_time(index_dict["updatedAt"])
+        return self
+
+    async def get_primary_key(self) -> str | None:
+        """Get the primary key."""
+        return (await self.fetch_info()).primary_key
+
+    @staticmethod
+    async def create(
+        config: Config,
+        uid: str,
+        options: Mapping[str, Any] | None = None,
+        custom_headers: Mapping[str, str] | None = None,
+        *,
+        metadata: str | None = None,
+        http: AsyncHttpRequests | None = None,
+    ) -> TaskInfo:
+        """Create the index.
+
+        Parameters
+        ----------
+        uid:
+            UID of the index.
+        options:
+            Options passed during index creation (ex: { 'primaryKey': 'name' }).
+        metadata (optional):
+            Custom metadata string to attach to the task.
+        http (optional):
+            AsyncHttpRequests instance to send the request with. A new one is created if omitted.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+        """
+        if options is None:
+            options = {}
+        payload = {**options, "uid": uid}
+        url = config.paths.index
+        if metadata is not None:
+            url += f"?{parse.urlencode({'customMetadata': metadata})}"
+        if http is None:
+            http = AsyncHttpRequests(config, custom_headers)
+        task = await http.post(url, payload)
+
+        return TaskInfo(**task)
+
+    async def get_tasks(self, parameters: MutableMapping[str, Any] | None = None) -> TaskResults:
+        """Get all tasks of a specific index from the last one.
+
+        Parameters
+        ----------
+        parameters (optional):
+            parameters accepted by the get tasks route: https://www.meilisearch.com/docs/reference/api/tasks#get-tasks.
+        """
+        if parameters is not None:
+            parameters.setdefault("indexUids", []).append(self.uid)
+        else:
+            parameters = {"indexUids": [self.uid]}
+
+        return await self.task_handler.get_tasks(parameters=parameters)
+
+    async def get_task(self, uid: int) -> Task:
+        """Get one task through the route of a specific index."""
+        return await self.task_handler.get_task(uid)
+
+    async def wait_for_task(
+        self,
+        uid: int,
+        timeout_in_ms: int = 5000,
+        interval_in_ms: int | None = None,
+        *,
+        max_interval_in_ms: int = 1000,
+    ) -> Task:
+        """Wait until Meilisearch processes a task until it fails or succeeds.
+
+        Parameters
+        ----------
+        uid:
+            identifier of the task to wait for being processed.
+        timeout_in_ms (optional):
+            time the method should wait before raising a MeilisearchTimeoutError.
+        interval_in_ms (optional):
+            fixed time interval the method should wait (sleep) between requests.
+            Default = None (starts at 10ms and doubles after each request)
+        max_interval_in_ms (optional):
+            longest time interval between requests when the interval is adaptive. Default = 1000
+        """
+        return await self.task_handler.wait_for_task(
+            uid, timeout_in_ms, interval_in_ms, max_interval_in_ms=max_interval_in_ms
+        )
+
+    def wait_for_tasks(
+        self,
+        uids: Iterable[int],
+        timeout_in_ms: int = 5000,
+        interval_in_ms: int | None = None,
+        *,
+        max_interval_in_ms: int = 1000,
+        fail_fast: bool = False,
+    ) -> AsyncIterator[Task]:
+        """Wait until Meilisearch processes several tasks, yielding each one once it fails or
+        succeeds. See Client.wait_for_tasks."""
+        return self.task_handler.wait_for_tasks(
+            uids,
+            timeout_in_ms,
+            interval_in_ms,
+            max_interval_in_ms=max_interval_in_ms,
+            fail_fast=fail_fast,
+        )
+
+    def watch_task(self, task: TaskInfo | int) -> asyncio.Future[Task]:
+        """Return a future resolved once Meilisearch processed the task. See Client.watch_task."""
+        return self.task_poller.watch(task)
+
+    async def get_stats(
+        self,
+        *,
+        show_internal_database_sizes: bool | None = None,
+        size_format: SizeFormat | str | None = None,
+    ) -> IndexStats:
+        """Get stats of the index.
+
+        https://www.meilisearch.com/docs/reference/api/stats
+        """
+        params: dict[str, Any] = {}
+        if show_internal_database_sizes is not None:
+            params["showInternalDatabaseSizes"] = str(show_internal_database_sizes).lower()
+        if size_format is not None:
+            params["sizeFormat"] = (
+                size_format.value if isinstance(size_format, SizeFormat) else size_format
+            )
+
+        path = f"{self.config.paths.index}/{self.uid}/{self.config.paths.stat}"
+        if params:
+            path = f"{path}?{parse.urlencode(params)}"
+        stats = await self.http.get(path)
+        return IndexStats(**stats)
+
+    async def search(
+        self,
+        query: str,
+        opt_params: Mapping[str, Any] | None = None,
+        *,
+        after_task_uid: int | None = None,
+    ) -> dict[str, Any]:
+        """Search in the index.
+
+        https://www.meilisearch.com/docs/reference/api/search
+
+        Parameters
+        ----------
+        query:
+            String containing the searched word(s)
+        opt_params (optional):
+            Dictionary containing optional query parameters.
+        after_task_uid (optional):
+            task_uid of a write this read must see, see Index.search. Default = None
+
+        Returns
+        -------
+        results:
+            Dictionary with hits, offset, limit, processingTime and initial query.
+        """
+        if opt_params is None:
+            opt_params = {}
+
+        body = {"q": query, **opt_params}
+
+        return await self.http.post(
+            f"{self.config.paths.index}/{self.uid}/{self.config.paths.search}",
+            body=body,
+            after_task_uid=after_task_uid,
+        )
+
+    async def iter_search(
+        self,
+        query: str,
+        opt_params: Mapping[str, Any] | None = None,
+        *,
+        page_size: int = 100,
+        prefetch: bool = True,
+        after_task_uid: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Search in the index and yield the hits one by one, see Index.iter_search.
+
+        The next page is fetched by a task while the hits of the current one are consumed.
+        """
+        params, offset, end = _search_pages(opt_params, page_size)
+
+        async def search_page(
+            page: tuple[int, int],
+        ) -> tuple[list[dict[str, Any]], tuple[int, int] | None]:
+            response = await self.search(
+                query,
+                {**params, "offset": page[0], "limit": page[1]},
+                after_task_uid=after_task_uid,
+            )
+            total = response.get("estimatedTotalHits", response.get("totalHits"))
+            return response["hits"], _next_page(page, len(response["hits"]), total, end)
+
+        async for hit in _aiter_pages(
+            search_page, (offset, _page_limit(offset, page_size, end)), prefetch
+        ):
+            yield hit
+
+    async def facet_search(
+        self,
+        facet_name: str,
+        facet_query: str | None = None,
+        opt_params: Mapping[str, Any] | None = None,
+        *,
+        after_task_uid: int | None = None,
+    ) -> dict[str, Any]:
+        """Perform a facet search based on the given facet query and facet name.
+
+        Returns
+        -------
+        results:
+            Dictionary with facetHits, processingTime and initial facet query
+        """
+        if opt_params is None:
+            opt_params = {}
+        body = {"facetName": facet_name, "facetQuery": facet_query, **opt_params}
+        return await self.http.post(
+            f"{self.config.paths.index}/{self.uid}/{self.config.paths.facet_search}",
+            body=body,
+            after_task_uid=after_task_uid,
+        )
+
+    async def get_similar_documents(self, parameters: Mapping[str, Any]) -> dict[str, Any]:
+        """Get the documents similar to a document.
+
+        https://www.meilisearch.com/docs/reference/api/similar#body
+        """
+        return await self.http.post(
+            f"{self.config.paths.index}/{self.uid}/{self.config.paths.similar}",
+            body=parameters,
+        )
+
+    async def get_document(
+        self,
+        document_id: str | int,
+        parameters: MutableMapping[str, Any] | None = None,
+        *,
+        after_task_uid: int | None = None,
+    ) -> Document:
+        """Get one document with given document identifier.
+
+        Returns
+        -------
+        document:
+            Document instance containing the documents information.
+        """
+        if parameters is None:
+            parameters = {}
+        elif "fields" in parameters and isinstance(parameters["fields"], (list, tuple)):
+            parameters["fields"] = ",".join(parameters["fields"])
+
+        document = await self.http.get(
+            f"{self.config.paths.index}/{self.uid}/{self.config.paths.document}/{document_id}?{parse.urlencode(parameters)}",
+            after_task_uid=after_task_uid,
+        )
+        return Document(document)
+
+    async def get_documents(
+        self,
+        parameters: MutableMapping[str, Any] | None = None,
+        *,
+        after_task_uid: int | None = None,
+    ) -> DocumentsResults:
+        """Get a set of documents from the index.
+
+        Parameters
+        ----------
+        parameters (optional):
+            parameters accepted by the get documents route: https://www.meilisearch.com/docs/reference/api/documents#get-documents
+        after_task_uid (optional):
+            task_uid of a write this read must see, see Index.search. Default = None
+
+        Returns
+        -------
+        documents:
+            DocumentsResults instance with total, offset, limit and results.
+        """
+        if parameters is None:
+            parameters = {}
+
+        sort = parameters.get("sort")
+        if isinstance(sort, str):
+            parameters["sort"] = [s.strip() for s in sort.split(",") if s.strip()]
+
+        response = await self.http.post(
+            f"{self.config.paths.index}/{self.uid}/{self.config.paths.document}/fetch",
+            body=parameters,
+            after_task_uid=after_task_uid,
+        )
+        return DocumentsResults(response)
+
+    async def iter_documents(
+        self,
+        *,
+        fields: Sequence[str] | None = None,
+        filter: str | list[str | list[str]] | None = None,
+        page_size: int = 1000,
+        raw: bool = False,
+        prefetch: bool = True,
+        after_task_uid: int | None = None,
+    ) -> AsyncIterator[Any]:
+        """Yield every document of the index, see Index.iter_documents.
+
+        The next page is fetched by a task while the documents of the current one are consumed.
+        """
+        parameters = _documents_pages(fields, filter, page_size)
+
+        async def documents_page(page: tuple[int, int]) -> tuple[list[Any], tuple[int, int] | None]:
+            response = await self.http.post(
+                f"{self.config.paths.index}/{self.uid}/{self.config.paths.document}/fetch",
+                body={**parameters, "offset": page[0], "limit": page[1]},
+                after_task_uid=after_task_uid,
+            )
+            documents = response["results"]
+            next_page = _next_page(page, len(documents), response["total"], None)
+            return (documents if raw else [Document(doc) for doc in documents]), next_page
+
+        async for document in _aiter_pages(documents_page, (0, page_size), prefetch):
+            yield document
+
+    async def add_documents(
+        self,
+        documents: Sequence[Mapping[str, Any]],
+        primary_key: str | None = None,
+        *,
+        serializer: type[JSONEncoder] | None = None,
+        skip_creation: bool | None = None,
+        metadata: str | None = None,
+    ) -> TaskInfo:
+        """Add documents to the index.
+
+        Parameters
+        ----------
+        documents:
+            List of documents. Each document should be a dictionary.
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up.
+        serializer (optional):
+            A custom JSONEncode to handle serializing fields that the build in json.dumps
+            cannot handle, for example UUID and datetime.
+        skip_creation (optional):
+            If True, documents that don't exist in the index are silently ignored rather
+            than created.
+        metadata (optional):
+            Custom metadata string to attach to the task.
+        """
+        url = self._build_url(primary_key, skip_creation=skip_creation, metadata=metadata)
+        task = await self.http.post(url, documents, serializer=serializer)
+        return TaskInfo(**task)
+
+    async def add_documents_in_batches(
+        self,
+        documents: Sequence[Mapping[str, Any]],
+        batch_size: int = 1000,
+        primary_key: str | None = None,
+        *,
+        serializer: type[JSONEncoder] | None = None,
+        skip_creation: bool | None = None,
+        metadata: str | None = None,
+    ) -> list[TaskInfo]:
+        """Add documents to the index in batches of batch_size documents."""
+        tasks: list[TaskInfo] = []
+
+        for document_batch in Index._batch(documents, batch_size):  # pylint: disable=protected-access
+            task = await self.add_documents(
+                document_batch,
+                primary_key,
+                serializer=serializer,
+                skip_creation=skip_creation,
+                metadata=metadata,
+            )
+            tasks.append(task)
+
+        return tasks
+
+    async def add_documents_stream(
+        self,
+        documents: Iterable[Mapping[str, Any]] | AsyncIterable[Mapping[str, Any]],
+        primary_key: str | None = None,
+        *,
+        max_payload_size: int = 10_485_760,
+        serializer: type[JSONEncoder] | None = None,
+        skip_creation: bool | None = None,
+        metadata: str | None = None,
+    ) -> AsyncGenerator[TaskInfo, None]:
+        """Add documents from an iterable or async iterable, yielding each TaskInfo once enqueued.
+
+        Documents are encoded as NDJSON into payloads of at most max_payload_size bytes, see
+        Index.add_documents_stream.
+        """
+        packer = _RecordPacker(max_payload_size)
+        async for document in _aiter(documents):
+            payload = packer.add(
+                _encode_ndjson_record(document, serializer, self.config.json_codec)
+            )
+            if payload is not None:
+                yield await self.add_documents_ndjson(
+                    payload, primary_key, skip_creation=skip_creation, metadata=metadata
+                )
+        payload = packer.flush()
+        if payload is not None:
+            yield await self.add_documents_ndjson(
+                payload, primary_key, skip_creation=skip_creation, metadata=metadata
+            )
+
+    async def add_documents_from_file(
+        self,
+        path: str | PathLike[str],
+        primary_key: str | None = None,
+        content_type: str | None = None,
+        csv_delimiter: str | None = None,
+        *,
+        skip_creation: bool | None = None,
+        metadata: str | None = None,
+    ) -> TaskInfo:
+        """Add documents from a JSON, NDJSON or CSV file, streamed in chunks with its Content-Length."""
+        url = self._build_url(
+            primary_key=primary_key,
+            csv_delimiter=csv_delimiter,
+            skip_creation=skip_creation,
+            metadata=metadata,
+        )
+        content_type = content_type or _guess_content_type(path)
+        with open(path, "rb") as document_file:
+            response = await self.http.post(url, document_file, content_type)
+        return TaskInfo(**response)
+
+    async def add_documents_json(
+        self,
+        str_documents: bytes,
+        primary_key: str | None = None,
+        *,
+        serializer: type[JSONEncoder] | None = None,
+        skip_creation: bool | None = None,
+        metadata: str | None = None,
+    ) -> TaskInfo:
+        """Add documents to the index from a byte-encoded JSON string."""
+        return await self.add_documents_raw(
+            str_documents,
+            primary_key,
+            "application/json",
+            serializer=serializer,
+            skip_creation=skip_creation,
+            metadata=metadata,
+        )
+
+    async def add_documents_csv(
+        self,
+        str_documents: bytes,
+        primary_key: str | None = None,
+        csv_delimiter: str | None = None,
+        *,
+        skip_creation: bool | None = None,
+        metadata: str | None = None,
+    ) -> TaskInfo:
+        """Add documents to the index from a byte-encoded CSV string."""
+        return await self.add_documents_raw(
+            str_documents,
+            primary_key,
+            "text/csv",
+            csv_delimiter,
+            skip_creation=skip_creation,
+            metadata=metadata,
+        )
+
+    async def add_documents_ndjson(
+        self,
+        str_documents: bytes,
+        primary_key: str | None = None,
+        *,
+        skip_creation: bool | None = None,
+        metadata: str | None = None,
+    ) -> TaskInfo:
+        """Add documents to the index from a byte-encoded NDJSON string."""
+        return await self.add_documents_raw(
+            str_documents,
+            primary_key,
+            "application/x-ndjson",
+            skip_creation=skip_creation,
+            metadata=metadata,
+        )
+
+    async def add_documents_raw(
+        self,
+        str_documents: bytes,
+        primary_key: str | None = None,
+        content_type: str | None = None,
+        csv_delimiter: str | None = None,
+        *,
+        serializer: type[JSONEncoder] | None = None,
+        skip_creation: bool | None = None,
+        metadata: str | None = None,
+    ) -> TaskInfo:
+        """Add documents to the index from a byte-encoded string.
+
+        Parameters
+        ----------
+        str_documents:
+            Byte-encoded string.
+        content_type:
+            The content MIME type: 'application/json', 'application/x-dnjson', or 'text/csv'.
+        """
+        url = self._build_url(
+            primary_key=primary_key,
+            csv_delimiter=csv_delimiter,
+            skip_creation=skip_creation,
+            metadata=metadata,
+        )
+        response = await self.http.post(url, str_documents, content_type, serializer=serializer)
+        return TaskInfo(**response)
+
+    async def update_documents(
+        self,
+        documents: Sequence[Mapping[str, Any]],
+        primary_key: str | None = None,
+        *,
+        serializer: type[JSONEncoder] | None = None,
+        skip_creation: bool | None = None,
+        metadata: str | None = None,
+    ) -> TaskInfo:
+        """Update documents in the index."""
+        url = self._build_url(primary_key, skip_creation=skip_creation, metadata=metadata)
+        response = await self.http.put(url, documents, serializer=serializer)
+        return TaskInfo(**response)
+
+    async def update_documents_in_batches(
+        self,
+        documents: Sequence[Mapping[str, Any]],
+        batch_size: int = 1000,
+        primary_key: str | None = None,
+        *,
+        serializer: type[JSONEncoder] | None = None,
+        skip_creation: bool | None = None,
+        metadata: str | None = None,
+    ) -> list[TaskInfo]:
+        """Update documents in the index in batches of batch_size documents."""
+        tasks: list[TaskInfo] = []
+
+        for document_batch in Index._batch(documents, batch_size):  # pylint: disable=protected-access
+            task = await self.update_documents(
+                document_batch,
+                primary_key,
+                serializer=serializer,
+                skip_creation=skip_creation,
+                metadata=metadata,
+            )
+            tasks.append(task)
+
+        return tasks
+
+    async def update_documents_stream(
+        self,
+        documents: Iterable[Mapping[str, Any]] | AsyncIterable[Mapping[str, Any]],
+        primary_key: str | None = None,
+        *,
+        max_payload_size: int = 10_485_760,
+        serializer: type[JSONEncoder] | None = None,
+        skip_creation: bool | None = None,
+        metadata: str | None = None,
+    ) -> AsyncGenerator[TaskInfo, None]:
+        """Update documents from an iterable or async iterable, yielding each TaskInfo once enqueued.
+
+        Documents are encoded as NDJSON into payloads of at most max_payload_size bytes, see
+        Index.update_documents_stream.
+        """
+        packer = _RecordPacker(max_payload_size)
+        async for document in _aiter(documents):
+            payload = packer.add(
+                _encode_ndjson_record(document, serializer, self.config.json_codec)
+            )
+            if payload is not None:
+                yield await self.update_documents_ndjson(
+                    payload, primary_key, skip_creation=skip_creation, metadata=metadata
+                )
+        payload = packer.flush()
+        if payload is not None:
+            yield await self.update_documents_ndjson(
+                payload, primary_key, skip_creation=skip_creation, metadata=metadata
+            )
+
+    async def update_documents_from_file(
+        self,
+        path: str | PathLike[str],
+        primary_key: str | None = None,
+        content_type: str | None = None,
+        csv_delimiter: str | None = None,
+        *,
+        skip_creation: bool | None = None,
+        metadata: str | None = None,
+    ) -> TaskInfo:
+        """Update documents from a JSON, NDJSON or CSV file, streamed in chunks with its Content-Length."""
+        url = self._build_url(
+            primary_key=primary_key,
+            csv_delimiter=csv_delimiter,
+            skip_creation=skip_creation,
+            metadata=metadata,
+        )
+        content_type = content_type or _guess_content_type(path)
+        with open(path, "rb") as document_file:
+            response = await self.http.put(url, document_file, content_type)
+        return TaskInfo(**response)
+
+    async def update_documents_json(
+        self,
+        str_documents: str,
+        primary_key: str | None = None,
+        *,
+        serializer: type[JSONEncoder] | None = None,
+        skip_creation: bool | None = None,
+        metadata: str | None = None,
+    ) -> TaskInfo:
+        """Update documents as a json string in the index."""
+        return await self.update_documents_raw(
+            str_documents,
+            primary_key,
+            "application/json",
+            serializer=serializer,
+            skip_creation=skip_creation,
+            metadata=metadata,
+        )
+
+    async def update_documents_csv(
+        self,
+        str_documents: str,
+        primary_key: str | None = None,
+        csv_delimiter: str | None = None,
+        *,
+        skip_creation: bool | None = None,
+        metadata: str | None = None,
+    ) -> TaskInfo:
+        """Update documents as a csv string in the index."""
+        return await self.update_documents_raw(
+            str_documents,
+            primary_key,
+            "text/csv",
+            csv_delimiter,
+            skip_creation=skip_creation,
+            metadata=metadata,
+        )
+
+    async def update_documents_ndjson(
+        self,
+        str_documents: str | bytes,
+        primary_key: str | None = None,
+        *,
+        skip_creation: bool | None = None,
+        metadata: str | None = None,
+    ) -> TaskInfo:
+        """Update documents as a ndjson string in the index."""
+        return await self.update_documents_raw(
+            str_documents,
+            primary_key,
+            "application/x-ndjson",
+            skip_creation=skip_creation,
+            metadata=metadata,
+        )
+
+    async def update_documents_raw(
+        self,
+        str_documents: str | bytes,
+        primary_key: str | None = None,
+        content_type: str | None = None,
+        csv_delimiter: str | None = None,
+        *,
+        serializer: type[JSONEncoder] | None = None,
+        skip_creation: bool | None = None,
+        metadata: str | None = None,
+    ) -> TaskInfo:
+        """Update documents as a string in the index."""
+        url = self._build_url(
+            primary_key=primary_key,
+            csv_delimiter=csv_delimiter,
+            skip_creation=skip_creation,
+            metadata=metadata,
+        )
+        response = await self.http.put(url, str_documents, content_type, serializer=serializer)
+        return TaskInfo(**response)
+
+    async def delete_document(
+        self, document_id: str | int, *, metadata: str | None = None
+    ) -> TaskInfo:
+        """Delete one document from the index."""
+        url = f"{self.config.paths.index}/{self.uid}/{self.config.paths.document}/{document_id}"
+        if metadata is not None:
+            url += f"?{parse.urlencode({'customMetadata': metadata})}"
+        response = await self.http.delete(url)
+        return TaskInfo(**response)
+
+    async def delete_documents(
+        self,
+        *,
+        filter: str | list[str | list[str]] | None = None,
+        metadata: str | None = None,
+    ) -> TaskInfo:
+        """Delete multiple documents from the index by filter.
+
+        Deleting by ids is deprecated in Index.delete_documents and is not available here.
+        """
+        url = f"{self.config.paths.index}/{self.uid}/{self.config.paths.document}/delete"
+        if metadata is not None:
+            url += f"?{parse.urlencode({'customMetadata': metadata})}"
+        response = await self.http.post(url, body={"filter": filter})
+        return TaskInfo(**response)
+
+    async def delete_all_documents(self, *, metadata: str | None = None) -> TaskInfo:
+        """Delete all documents from the index."""
+        url = f"{self.config.paths.index}/{self.uid}/{self.config.paths.document}"
+        if metadata is not None:
+            url += f"?{parse.urlencode({'customMetadata': metadata})}"
+        response = await self.http.delete(url)
+        return TaskInfo(**response)
+
+    async def get_settings(self) -> dict[str, Any]:
+        """Get settings of the index.
+
+        https://www.meilisearch.com/docs/reference/api/settings
+        """
+        settings = await self.http.get(
+            f"{self.config.paths.index}/{self.uid}/{self.config.paths.setting}"
+        )
+        return _parse_settings(settings)
+
+    async def update_settings(
+        self, body: MutableMapping[str, Any], *, metadata: str | None = None
+    ) -> TaskInfo:
+        """Update settings of the index.
+
+        https://www.meilisearch.com/docs/reference/api/settings#update-settings
+        """
+        if body.get("embedders"):
+            for _, v in body["embedders"].items():
+                if "documentTemplateMaxBytes" in v and v["documentTemplateMaxBytes"] is None:
+                    del v["documentTemplateMaxBytes"]
+
+        url = f"{self.config.paths.index}/{self.uid}/{self.config.paths.setting}"
+        if metadata is not None:
+            url += f"?{parse.urlencode({'customMetadata': metadata})}"
+        task = await self.http.patch(url, body)
+
+        return TaskInfo(**task)
+
+    async def reset_settings(self, *, metadata: str | None = None) -> TaskInfo:
+        """Reset settings of the index to default values.
+
+        https://www.meilisearch.com/docs/reference/api/settings#reset-settings
+        """
+        url = f"{self.config.paths.index}/{self.uid}/{self.config.paths.setting}"
+        if metadata is not None:
+            url += f"?{parse.urlencode({'customMetadata': metadata})}"
+        task = await self.http.delete(url)
+
+        return TaskInfo(**task)
+
+    async def get_ranking_rules(self) -> list[str]:
+        """Get ranking rules of the index."""
+        return await self.http.get(self._settings_url_for(self.config.paths.ranking_rules))
+
+    async def update_ranking_rules(self, body: list[str] | None) -> TaskInfo:
+        """Update ranking rules of the index."""
+        task = await self.http.put(self._settings_url_for(self.config.paths.ranking_rules), body)
+
+        return TaskInfo(**task)
+
+    async def reset_ranking_rules(self) -> TaskInfo:
+        """Reset ranking rules of the index to default values."""
+        task = await self.http.delete(
+            self._settings_url_for(self.config.paths.ranking_rules),
+        )
+
+        return TaskInfo(**task)
+
+    async def get_distinct_attribute(self) -> str | None:
+        """Get distinct attribute of the index."""
+        return await self.http.get(self._settings_url_for(self.config.paths.distinct_attribute))
+
+    async def update_distinct_attribute(self, body: str) -> TaskInfo:
+        """Update distinct attribute of the index."""
+        task = await self.http.put(
+            self._settings_url_for(self.config.paths.distinct_attribute), body
+        )
+
+        return TaskInfo(**task)
+
+    async def reset_distinct_attribute(self) -> TaskInfo:
+        """Reset distinct attribute of the index to default values."""
+        task = await self.http.delete(
+            self._settings_url_for(self.config.paths.distinct_attribute),
+        )
+
+        return TaskInfo(**task)
+
+    async def get_searchable_attributes(self) -> list[str]:
+        """Get searchable attributes of the index."""
+        return await self.http.get(self._settings_url_for(self.config.paths.searchable_attributes))
+
+    async def update_searchable_attributes(self, body: list[str] | None) -> TaskInfo:
+        """Update searchable attributes of the index."""
+        task = await self.http.put(
+            self._settings_url_for(self.config.paths.searchable_attributes), body
+        )
+
+        return TaskInfo(**task)
+
+    async def reset_searchable_attributes(self) -> TaskInfo:
+        """Reset searchable attributes of the index to default values."""
+        task = await self.http.delete(
+            self._settings_url_for(self.config.paths.searchable_attributes),
+        )
+
+        return TaskInfo(**task)
+
+    async def get_displayed_attributes(self) -> list[str]:
+        """Get displayed attributes of the index."""
+        return await self.http.get(self._settings_url_for(self.config.paths.displayed_attributes))
+
+    async def update_displayed_attributes(self, body: list[str] | None) -> TaskInfo:
+        """Update displayed attributes of the index."""
+        task = await self.http.put(
+            self._settings_url_for(self.config.paths.displayed_attributes), body
+        )
+
+        return TaskInfo(**task)
+
+    async def reset_displayed_attributes(self) -> TaskInfo:
+        """Reset displayed attributes of the index to default values."""
+        task = await self.http.delete(
+            self._settings_url_for(self.config.paths.displayed_attributes),
+        )
+
+        return TaskInfo(**task)
+
+    async def get_stop_words(self) -> list[str]:
+        """Get stop words of the index."""
+        return await self.http.get(self._settings_url_for(self.config.paths.stop_words))
+
+    async def update_stop_words(self, body: list[str] | None) -> TaskInfo:
+        """Update stop words of the index."""
+        task = await self.http.put(self._settings_url_for(self.config.paths.stop_words), body)
+
+        return TaskInfo(**task)
+
+    async def reset_stop_words(self) -> TaskInfo:
+        """Reset stop words of the index to default values."""
+        task = await self.http.delete(
+            self._settings_url_for(self.config.paths.stop_words),
+        )
+
+        return TaskInfo(**task)
+
+    async def get_synonyms(self) -> dict[str, list[str]]:
+        """Get synonyms of the index."""
+        return await self.http.get(self._settings_url_for(self.config.paths.synonyms))
+
+    async def update_synonyms(self, body: dict[str, list[str]] | None) -> TaskInfo:
+        """Update synonyms of the index."""
+        task = await self.http.put(self._settings_url_for(self.config.paths.synonyms), body)
+
+        return TaskInfo(**task)
+
+    async def reset_synonyms(self) -> TaskInfo:
+        """Reset synonyms of the index to default values."""
+        task = await self.http.delete(
+            self._settings_url_for(self.config.paths.synonyms),
+        )
+
+        return TaskInfo(**task)
+
+    async def get_filterable_attributes(self) -> list[str]:
+        """Get filterable attributes of the index."""
+        return await self.http.get(self._settings_url_for(self.config.paths.filterable_attributes))
+
+    async def update_filterable_attributes(self, body: list[str] | None) -> TaskInfo:
+        """Update filterable attributes of the index."""
+        task = await self.http.put(
+            self._settings_url_for(self.config.paths.filterable_attributes), body
+        )
+
+        return TaskInfo(**task)
+
+    async def reset_filterable_attributes(self) -> TaskInfo:
+        """Reset filterable attributes of the index to default values."""
+        task = await self.http.delete(
+            self._settings_url_for(self.config.paths.filterable_attributes),
+        )
+
+        return TaskInfo(**task)
+
+    async def get_foreign_keys(self) -> list[dict[str, str]]:
+        """Get foreign keys of the index."""
+        return await self.http.get(self._settings_url_for(self.config.paths.foreign_keys))
+
+    async def update_foreign_keys(self, body: list[dict[str, str]] | None) -> TaskInfo:
+        """Update foreign keys of the index."""
+        task = await self.http.put(self._settings_url_for(self.config.paths.foreign_keys), body)
+
+        return TaskInfo(**task)
+
+    async def reset_foreign_keys(self) -> TaskInfo:
+        """Reset foreign keys of the index to default values."""
+        task = await self.http.delete(
+            self._settings_url_for(self.config.paths.foreign_keys),
+        )
+
+        return TaskInfo(**task)
+
+    async def get_sortable_attributes(self) -> list[str]:
+        """Get sortable attributes of the index."""
+        return await self.http.get(self._settings_url_for(self.config.paths.sortable_attributes))
+
+    async def update_sortable_attributes(self, body: list[str] | None) -> TaskInfo:
+        """Update sortable attributes of the index."""
+        task = await self.http.put(
+            self._settings_url_for(self.config.paths.sortable_attributes), body
+        )
+
+        return TaskInfo(**task)
+
+    async def reset_sortable_attributes(self) -> TaskInfo:
+        """Reset sortable attributes of the index to default values."""
+        task = await self.http.delete(
+            self._settings_url_for(self.config.paths.sortable_attributes),
+        )
+
+        return TaskInfo(**task)
+
+    async def get_typo_tolerance(self) -> TypoTolerance:
+        """Get typo tolerance of the index."""
+        typo_tolerance = await self.http.get(
+            self._settings_url_for(self.config.paths.typo_tolerance)
+        )
+
+        return TypoTolerance(**typo_tolerance)
+
+    async def update_typo_tolerance(self, body: Mapping[str, Any] | None) -> TaskInfo:
+        """Update typo tolerance of the index."""
+        task = await self.http.patch(self._settings_url_for(self.config.paths.typo_tolerance), body)
+
+        return TaskInfo(**task)
+
+    async def reset_typo_tolerance(self) -> TaskInfo:
+        """Reset typo tolerance of the index to default values."""
+        task = await self.http.delete(
+            self._settings_url_for(self.config.paths.typo_tolerance),
+        )
+
+        return TaskInfo(**task)
+
+    async def get_pagination_settings(self) -> Pagination:
+        """Get pagination settngs of the index."""
+        pagination = await self.http.get(self._settings_url_for(self.config.paths.pagination))
+
+        return Pagination(**pagination)
+
+    async def update_pagination_settings(self, body: dict[str, Any] | None) -> TaskInfo:
+        """Update the pagination settings of the index."""
+        task = await self.http.patch(
+            path=self._settings_url_for(self.config.paths.pagination), body=body
+        )
+
+        return TaskInfo(**task)
+
+    async def reset_pagination_settings(self) -> TaskInfo:
+        """Reset pagination settings of the index to default values."""
+        task = await self.http.delete(self._settings_url_for(self.config.paths.pagination))
+
+        return TaskInfo(**task)
+
+    async def get_facet_search_settings(self) -> bool:
+        """Get the facet search settings of an index."""
+        return await self.http.get(self._settings_url_for(self.config.paths.facet_search))
+
+    async def update_facet_search_settings(self, body: bool | None) -> TaskInfo:
+        """Update the facet search settings of the index."""
+        task = await self.http.put(
+            self._settings_url_for(self.config.paths.facet_search), body=body
+        )
+
+        return TaskInfo(**task)
+
+    async def reset_facet_search_settings(self) -> TaskInfo:
+        """Reset facet search settings of the index to default values."""
+        task = await self.http.delete(self._settings_url_for(self.config.paths.facet_search))
+
+        return TaskInfo(**task)
+
+    async def get_faceting_settings(self) -> Faceting:
+        """Get the faceting settings of an index."""
+        faceting = await self.http.get(self._settings_url_for(self.config.paths.faceting))
+
+        return Faceting(**faceting)
+
+    async def update_faceting_settings(self, body: Mapping[str, Any] | None) -> TaskInfo:
+        """Update the faceting settings of the index."""
+        task = await self.http.patch(
+            path=self._settings_url_for(self.config.paths.faceting), body=body
+        )
+
+        return TaskInfo(**task)
+
+    async def reset_faceting_settings(self) -> TaskInfo:
+        """Reset faceting settings of the index to default values."""
+        task = await self.http.delete(self._settings_url_for(self.config.paths.faceting))
+
+        return TaskInfo(**task)
+
+    async def get_dictionary(self) -> list[str]:
+        """Get the dictionary entries of the index."""
+        return await self.http.get(self._settings_url_for(self.config.paths.dictionary))
+
+    async def update_dictionary(self, body: list[str] | None) -> TaskInfo:
+        """Update the dictionary of the index."""
+        task = await self.http.put(self._settings_url_for(self.config.paths.dictionary), body)
+
+        return TaskInfo(**task)
+
+    async def reset_dictionary(self) -> TaskInfo:
+        """Clear all entries in dictionary"""
+        task = await self.http.delete(
+            self._settings_url_for(self.config.paths.dictionary),
+        )
+
+        return TaskInfo(**task)
+
+    async def get_separator_tokens(self) -> list[str]:
+        """Get the additional text separator tokens set on this index."""
+        return await self.http.get(self._settings_url_for(self.config.paths.separator_tokens))
+
+    async def get_non_separator_tokens(self) -> list[str]:
+        """Get the list of disabled text separator tokens on this index."""
+        return await self.http.get(self._settings_url_for(self.config.paths.non_separator_tokens))
+
+    async def update_separator_tokens(self, body: list[str] | None) -> TaskInfo:
+        """Update the additional separator tokens of the index."""
+        task = await self.http.put(self._settings_url_for(self.config.paths.separator_tokens), body)
+
+        return TaskInfo(**task)
+
+    async def update_non_separator_tokens(self, body: list[str] | None) -> TaskInfo:
+        """Update the disabled separator tokens of the index."""
+        task = await self.http.put(
+            self._settings_url_for(self.config.paths.non_separator_tokens), body
+        )
+
+        return TaskInfo(**task)
+
+    async def reset_separator_tokens(self) -> TaskInfo:
+        """Clear all additional separator tokens"""
+        task = await self.http.delete(
+            self._settings_url_for(self.config.paths.separator_tokens),
+        )
+
+        return TaskInfo(**task)
+
+    async def reset_non_separator_tokens(self) -> TaskInfo:
+        """Clear all disabled separator tokens"""
+        task = await self.http.delete(
+            self._settings_url_for(self.config.paths.non_separator_tokens),
+        )
+
+        return TaskInfo(**task)
+
+    async def get_embedders(self) -> Embedders | None:
+        """Get embedders of the index."""
+        response = await self.http.get(self._settings_url_for(self.config.paths.embedders))
+
+        if not response:
+            return None
+
+        return Embedders(embedders={k: _parse_embedder(v) for k, v in response.items()})
+
+    async def update_embedders(self, body: MutableMapping[str, Any] | None) -> TaskInfo:
+        """Update embedders of the index."""
+        if body is not None and body.get("embedders"):
+            body = _serialize_embedders(body["embedders"])
+
+        task = await self.http.patch(self._settings_url_for(self.config.paths.embedders), body)
+
+        return TaskInfo(**task)
+
+    async def reset_embedders(self) -> TaskInfo:
+        """Reset embedders of the index to default values."""
+        task = await self.http.delete(
+            self._settings_url_for(self.config.paths.embedders),
+        )
+
+        return TaskInfo(**task)
+
+    async def get_search_cutoff_ms(self) -> int | None:
+        """Get the search cutoff in ms of the index."""
+        return await self.http.get(self._settings_url_for(self.config.paths.search_cutoff_ms))
+
+    async def update_search_cutoff_ms(self, body: int | None) -> TaskInfo:
+        """Update the search cutoff in ms of the index."""
+        task = await self.http.put(self._settings_url_for(self.config.paths.search_cutoff_ms), body)
+
+        return TaskInfo(**task)
+
+    async def reset_search_cutoff_ms(self) -> TaskInfo:
+        """Reset the search cutoff of the index"""
+        task = await self.http.delete(
+            self._settings_url_for(self.config.paths.search_cutoff_ms),
+        )
+
+        return TaskInfo(**task)
+
+    async def get_prefix_search(self) -> PrefixSearch:
+        """Get the prefix search settings of an index."""
+        prefix_search = await self.http.get(self._settings_url_for(self.config.paths.prefix_search))
+
+        return PrefixSearch[to_snake(prefix_search).upper()]
+
+    async def update_prefix_search(self, body: PrefixSearch | None) -> TaskInfo:
+        """Update the prefix search settings of the index."""
+        task = await self.http.put(self._settings_url_for(self.config.paths.prefix_search), body)
+
+        return TaskInfo(**task)
+
+    async def reset_prefix_search(self) -> TaskInfo:
+        """Reset the prefix search settings of the index"""
+        task = await self.http.delete(
+            self._settings_url_for(self.config.paths.prefix_search),
+        )
+
+        return TaskInfo(**task)
+
+    async def get_proximity_precision(self) -> ProximityPrecision:
+        """Get the proximity_precision of the index."""
+        response = await self.http.get(
+            self._settings_url_for(self.config.paths.proximity_precision)
+        )
+        return ProximityPrecision[to_snake(response).upper()]
+
+    async def update_proximity_precision(self, body: ProximityPrecision | None) -> TaskInfo:
+        """Update the proximity_precision of the index."""
+        task = await self.http.put(
+            self._settings_url_for(self.config.paths.proximity_precision), body
+        )
+
+        return TaskInfo(**task)
+
+    async def reset_proximity_precision(self) -> TaskInfo:
+        """Reset the proximity_precision of the index"""
+        task = await self.http.delete(
+            self._settings_url_for(self.config.paths.proximity_precision),
+        )
+
+        return TaskInfo(**task)
+
+    async def get_localized_attributes(self) -> list[LocalizedAttributes] | None:
+        """Get the localized_attributes of the index."""
+        response = await self.http.get(
+            self._settings_url_for(self.config.paths.localized_attributes)
+        )
+
+        if not response:
+            return None
+
+        return [LocalizedAttributes(**attrs) for attrs in response]
+
+    async def update_localized_attributes(
+        self, body: list[Mapping[str, list[str]]] | None
+    ) -> TaskInfo:
+        """Update the localized_attributes of the index."""
+        task = await self.http.put(
+            self._settings_url_for(self.config.paths.localized_attributes), body
+        )
+
+        return TaskInfo(**task)
+
+    async def reset_localized_attributes(self) -> TaskInfo:
+        """Reset the localized_attributes of the index"""
+        task = await self.http.delete(
+            self._settings_url_for(self.config.paths.localized_attributes),
+        )
+
+        return TaskInfo(**task)
+
+    async def get_fields(
+        self,
+        offset: int | None = None,
+        limit: int | None = None,
+        filter: MutableMapping[str, Any] | None = None,
+    ) -> FieldsResults:
+        """Get all fields of the index."""
+        body: dict[str, Any] = {}
+        if offset is not None:
+            body["offset"] = offset
+        if limit is not None:
+            body["limit"] = limit
+        if filter is not None:
+            body["filter"] = filter
+
+        response = await self.http.post(
+            f"{self.config.paths.index}/{self.uid}/{self.config.paths.fields}",
+            body=body,
+        )
+
+        return FieldsResults(response)
+
+    async def compact(self) -> TaskInfo:
+        """Trigger the compaction of the index."""
+        task = await self.http.post(f"{self.config.paths.index}/{self.uid}/compact")
+        return TaskInfo(**task)
+
+    def _settings_url_for(self, sub_route: str) -> str:
+        return f"{self.config.paths.index}/{self.uid}/{self.config.paths.setting}/{sub_route}"
+
+    def _build_url(
+        self,
+        primary_key: str | None = None,
+        csv_delimiter: str | None = None,
+        skip_creation: bool | None = None,
+        metadata: str | None = None,
+    ) -> str:
+        return _build_documents_url(
+            self.config, self.uid, primary_key, csv_delimiter, skip_creation, metadata
+        )
+
+
+async def _aiter(
+    documents: Iterable[Mapping[str, Any]] | AsyncIterable[Mapping[str, Any]],
+) -> AsyncGenerator[Mapping[str, Any], None]:
+    if isinstance(documents, AsyncIterable):
+        async for document in documents:
+            yield document
+    else:
+        for document in documents:
+            yield document
+
+
+async def _aiter_pages(
+    fetch_page: Callable[[tuple[int, int]], Awaitable[tuple[list[_T], tuple[int, int] | None]]],
+    page: tuple[int, int],
+    prefetch: bool,
+) -> AsyncGenerator[_T, None]:
+    # Asyncio counterpart of meilisearch.index._iter_pages, the next page being fetched by a task.
+    if page[1] <= 0:
+        return
+    pending: asyncio.Future[tuple[list[_T], tuple[int, int] | None]] | None = None
+    try:
+        items, next_page = await fetch_page(page)
+        while True:
+            pending = (
+                asyncio.ensure_future(fetch_page(next_page))
+                if prefetch and next_page is not None
+                else None
+            )
+            for item in items:
+                yield item
+            if next_page is None:
+                return
+            items, next_page = await (pending if pending is not None else fetch_page(next_page))
+    finally:
+        if pending is not None:
+            pending.cancel()
@@ -0,0 +1,486 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator, Collection, Iterable, Mapping, MutableMapping
+from typing import Any
+from urllib import parse
+
+from meilisearch._polling import PollingSchedule, batch_percentage, is_transient
+from meilisearch.aio._httprequests import AsyncHttpRequests
+from meilisearch.config import Config
+from meilisearch.errors import (
+    MeilisearchApiError,
+    MeilisearchError,
+    MeilisearchTaskFailedError,
+    MeilisearchTimeoutError,
+)
+from meilisearch.models.task import Batch, BatchResults, Task, TaskInfo, TaskResults
+
+
+class AsyncTaskHandler:
+    """
+    Asyncio counterpart of TaskHandler covering the Meilisearch Task API.
+
+    https://www.meilisearch.com/docs/reference/api/tasks
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        custom_headers: Mapping[str, str] | None = None,
+        http: AsyncHttpRequests | None = None,
+    ):
+        """Parameters
+        ----------
+            config: Config object containing permission and location of Meilisearch.
+            http (optional): AsyncHttpRequests instance to share, so that the connection pool is reused.
+        """
+        self.config = config
+        self.http = http if http is not None else AsyncHttpRequests(config, custom_headers)
+
+    async def get_batches(self, parameters: MutableMapping[str, Any] | None = None) -> BatchResults:
+        """Get all task batches.
+
+        Parameters
+        ----------
+        parameters (optional):
+            parameters accepted by the get batches route: https://www.meilisearch.com/docs/reference/api/batches#get-batches.
+
+        Returns
+        -------
+        batch:
+            BatchResults instance contining limit, from, next and results containing a list of all batches.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        batches = await self.http.get(
+            f"{self.config.paths.batch}?{parse.urlencode(_join_list_parameters(parameters))}"
+        )
+        return BatchResults(**batches)
+
+    async def get_batch(self, uid: int) -> Batch:
+        """Get one tasks batch.
+
+        Parameters
+        ----------
+        uid:
+            Identifier of the batch.
+
+        Returns
+        -------
+        batch:
+            Batch instance containing information about the progress of the asynchronous batch.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        batch = await self.http.get(f"{self.config.paths.batch}/{uid}")
+        return Batch(**batch)
+
+    async def get_tasks(self, parameters: MutableMapping[str, Any] | None = None) -> TaskResults:
+        """Get all tasks.
+
+        Parameters
+        ----------
+        parameters (optional):
+            parameters accepted by the get tasks route: https://www.meilisearch.com/docs/reference/api/tasks#get-tasks.
+
+        Returns
+        -------
+        task:
+            TaskResults instance contining limit, from, next and results containing a list of all
+            enqueued, processing, succeeded or failed tasks.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        tasks = await self.http.get(
+            f"{self.config.paths.task}?{parse.urlencode(_join_list_parameters(parameters))}"
+        )
+        results = TaskResults(**tasks)
+        if self.config.search_cache is not None:
+            self.config.search_cache.observe(*results.results)
+        return results
+
+    async def get_task(self, uid: int) -> Task:
+        """Get one task.
+
+        Parameters
+        ----------
+        uid:
+            Identifier of the task.
+
+        Returns
+        -------
+        task:
+            Task instance containing information about the processed asynchronous task.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        task = await self.http.get(f"{self.config.paths.task}/{uid}")
+        fetched = Task(**task)
+        if self.config.search_cache is not None:
+            self.config.search_cache.observe(fetched)
+        return fetched
+
+    async def cancel_tasks(
+        self, parameters: MutableMapping[str, Any], *, metadata: str | None = None
+    ) -> TaskInfo:
+        """Cancel a list of enqueued or processing tasks.
+
+        Parameters
+        ----------
+        parameters:
+            parameters accepted by the cancel tasks https://www.meilisearch.com/docs/reference/api/tasks#cancel-task.
+        metadata (optional):
+            Custom metadata string to attach to the task.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        parameters = _join_list_parameters(parameters)
+        if metadata is not None:
+            parameters["customMetadata"] = metadata
+        response = await self.http.post(
+            f"{self.config.paths.task}/cancel?{parse.urlencode(parameters)}"
+        )
+        return TaskInfo(**response)
+
+    async def delete_tasks(
+        self, parameters: MutableMapping[str, Any], *, metadata: str | None = None
+    ) -> TaskInfo:
+        """Delete a list of finished tasks.
+
+        Parameters
+        ----------
+        parameters:
+            parameters accepted by the delete tasks route:https://www.meilisearch.com/docs/reference/api/tasks#delete-task.
+        metadata (optional):
+            Custom metadata string to attach to the task.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        parameters = _join_list_parameters(parameters)
+        if metadata is not None:
+            parameters["customMetadata"] = metadata
+        response = await self.http.delete(f"{self.config.paths.task}?{parse.urlencode(parameters)}")
+        return TaskInfo(**response)
+
+    async def wait_for_task(
+        self,
+        uid: int,
+        timeout_in_ms: int = 5000,
+        interval_in_ms: int | None = None,
+        *,
+        max_interval_in_ms: int = 1000,
+    ) -> Task:
+        """Wait until the task fails or succeeds in Meilisearch without blocking the event loop.
+        See TaskHandler.wait_for_task for how the interval adapts.
+
+        Parameters
+        ----------
+        uid:
+            Identifier of the task to wait for being processed.
+        timeout_in_ms (optional):
+            Time the method should wait before raising a MeilisearchTimeoutError.
+        interval_in_ms (optional):
+            Fixed time interval the method should wait (sleep) between requests.
+            Default = None (adaptive interval)
+        max_interval_in_ms (optional):
+            Longest time interval between requests when the interval is adaptive. Default = 1000
+
+        Returns
+        -------
+        task:
+            Task instance containing information about the processed asynchronous task.
+
+        Raises
+        ------
+        MeilisearchTimeoutError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        loop = asyncio.get_running_loop()
+        schedule = PollingSchedule(interval_in_ms, max_interval_in_ms, loop.time)
+        deadline = loop.time() + timeout_in_ms / 1000
+        push_until = self._push_until()
+        while loop.time() < deadline:
+            task = await self.get_task(uid)
+            if task.status not in _UNFINISHED:
+                return task
+            if loop.time() < push_until:
+                delay = push_until - loop.time()
+            else:
+                percentage = await self._batch_percentage(task) if schedule.adaptive else None
+                delay = schedule.next_delay(percentage)
+            pushed = await self._pause([uid], delay, deadline)
+            if pushed:
+                return pushed[uid]
+        raise MeilisearchTimeoutError(
+            f"timeout of ${timeout_in_ms}ms has exceeded on process ${uid} when waiting for task to be resolve."
+        )
+
+    async def wait_for_tasks(
+        self,
+        uids: Iterable[int],
+        timeout_in_ms: int = 5000,
+        interval_in_ms: int | None = None,
+        *,
+        max_interval_in_ms: int = 1000,
+        fail_fast: bool = False,
+    ) -> AsyncIterator[Task]:
+        """Wait until Meilisearch processes several tasks, yielding each one once it fails or
+        succeeds. See TaskHandler.wait_for_tasks.
+
+        Raises
+        ------
+        MeilisearchTimeoutError
+            If some tasks were still not processed after timeout_in_ms.
+        MeilisearchTaskFailedError
+            If fail_fast is True and a task failed.
+        MeilisearchError
+            If one of the tasks does not exist.
+        """
+        pending = set(uids)
+        loop = asyncio.get_running_loop()
+        schedule = PollingSchedule(interval_in_ms, max_interval_in_ms, loop.time)
+        deadline = loop.time() + timeout_in_ms / 1000
+        push_until = self._push_until()
+        finished: list[Task] = []
+        unknown: set[int] = set()
+        poll = True
+        while pending:
+            if poll:
+                unfinished = {
+                    task.uid for task in await self._get_tasks_by_uid(pending, _UNFINISHED)
+                }
+                finished = await self._get_tasks_by_uid(pending - unfinished)
+                unknown = pending - unfinished - {task.uid for task in finished}
+            for task in finished:
+                if fail_fast and task.status == "failed":
+                    raise MeilisearchTaskFailedError(task)
+                pending.discard(task.uid)
+                yield task
+            if unknown:
+                raise MeilisearchError(f"Task {min(unknown)} was not found.")
+            if not pending:
+                return
+            if loop.time() >= deadline:
+                raise MeilisearchTimeoutError(
+                    f"timeout of {timeout_in_ms}ms has exceeded when waiting for tasks {sorted(pending)} to be resolved."
+                )
+            delay = push_until - loop.time() if loop.time() < push_until else schedule.next_delay()
+            pushed = await self._pause(pending, delay, deadline)
+            finished = [task for _, task in sorted(pushed.items())]
+            poll = not finished
+            if finished:
+                push_until = self._push_until()
+
+    def _push_until(self) -> float:
+        receiver = self.config.task_webhook
+        loop = asyncio.get_running_loop()
+        return loop.time() + receiver.fallback_after if receiver is not None else 0.0
+
+    async def _pause(self, uids: Collection[int], delay: float, deadline: float) -> dict[int, Task]:
+        seconds = max(0.0, min(delay, deadline - asyncio.get_running_loop().time()))
+        receiver = self.config.task_webhook
+        if receiver is None:
+            await asyncio.sleep(seconds)
+            return {}
+        return await receiver.async_wait(uids, seconds)
+
+    async def _batch_percentage(self, task: Task) -> float | None:
+        if task.status != "processing" or task.batch_uid is None:
+            return None
+        try:
+            return batch_percentage((await self.get_batch(task.batch_uid)).progress)
+        except MeilisearchApiError:
+            return None
+
+    async def _get_tasks_by_uid(
+        self, uids: Collection[int], statuses: tuple[str, ...] = ()
+    ) -> list[Task]:
+        tasks: list[Task] = []
+        ordered = sorted(uids)
+        for start in range(0, len(ordered), _UIDS_PER_REQUEST):
+            chunk = ordered[start : start + _UIDS_PER_REQUEST]
+            parameters: dict[str, Any] = {"uids": ",".join(map(str, chunk)), "limit": len(chunk)}
+            if statuses:
+                parameters["statuses"] = ",".join(statuses)
+            tasks.extend((await self.get_tasks(parameters)).results)
+        return sorted(tasks, key=lambda task: task.uid)
+
+
+class AsyncTaskPoller:
+    """Asyncio counterpart of TaskPoller: resolves asyncio futures from one background asyncio
+    task polling all the watched tasks together."""
+
+    def __init__(self, task_handler: AsyncTaskHandler, max_interval_in_ms: int = 1000) -> None:
+        self.task_handler = task_handler
+        self.max_interval_in_ms = max_interval_in_ms
+        self._futures: dict[int, list[asyncio.Future[Task]]] = {}
+        self._wakeup = asyncio.Event()
+        self._closed = False
+        self._poller: asyncio.Task[None] | None = None
+
+    def watch(self, task: TaskInfo | int) -> asyncio.Future[Task]:
+        """Return a future resolved with the Task once Meilisearch processed it.
+
+        The future works with asyncio.wait, asyncio.as_completed and asyncio.wait_for.
+        Cancelling it stops watching the task, it does not cancel the task in Meilisearch.
+        """
+        if self._closed:
+            raise RuntimeError("The task poller is closed.")
+        uid = task if isinstance(task, int) else task.task_uid
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Task] = loop.create_future()
+        self._futures.setdefault(uid, []).append(future)
+        if self._poller is None:
+            # Created along with the poller to be bound to the running event loop.
+            self._wakeup = asyncio.Event()
+            self._poller = loop.create_task(self._run())
+        receiver = self.task_handler.config.task_webhook
+        if receiver is not None:
+            # The notification may have arrived before the task was watched.
+            self._resolve(receiver.wait([uid], 0))
+        self._wakeup.set()
+        return future
+
+    async def aclose(self) -> None:
+        """Stop the background task and cancel the futures not resolved yet."""
+        self._closed = True
+        if self._poller is not None:
+            self._poller.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._poller
+        for waiting in self._futures.values():
+            for future in waiting:
+                future.cancel()
+        self._futures.clear()
+
+    def notify(self, task: Task) -> None:
+        """Resolve the futures of a finished task without waiting for the next poll."""
+        self._resolve({task.uid: task})
+
+    async def _run(self) -> None:
+        try:
+            await self._poll_until_idle()
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            futures = [future for waiting in self._futures.values() for future in waiting]
+            self._futures.clear()
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
+        finally:
+            if self._poller is asyncio.current_task():
+                self._poller = None
+
+    async def _poll_until_idle(self) -> None:
+        loop = asyncio.get_running_loop()
+        schedule = PollingSchedule(max_interval_in_ms=self.max_interval_in_ms, clock=loop.time)
+        last_poll = loop.time()
+        polled: set[int] = set()
+        while True:
+            receiver = self.task_handler.config.task_webhook
+            if receiver is None:
+                delay = schedule.next_delay()
+            else:
+                delay = max(0.0, last_poll + receiver.fallback_after - loop.time())
+            woken = False
+            with contextlib.suppress(asyncio.TimeoutError):
+                woken = await asyncio.wait_for(self._wakeup.wait(), delay)
+                schedule = PollingSchedule(
+                    max_interval_in_ms=self.max_interval_in_ms, clock=loop.time
+                )
+            self._wakeup.clear()
+            self._futures = {
+                uid: alive
+                for uid, waiting in self._futures.items()
+                if (alive := [future for future in waiting if not future.done()])
+            }
+            if self._closed or not self._futures:
+                self._poller = None
+                return
+            uids = list(self._futures)
+            polled.intersection_update(uids)
+            if woken and receiver is not None and loop.time() < last_poll + receiver.fallback_after:
+                # Poll the newly watched tasks once, in case they finished before being watched.
+                fresh = [uid for uid in uids if uid not in polled]
+                if fresh:
+                    await self._poll(fresh)
+                    polled.update(fresh)
+                continue
+            await self._poll(uids)
+            polled.update(uids)
+            last_poll = loop.time()
+
+    async def _poll(self, uids: list[int]) -> None:
+        outcomes: dict[int, Task | MeilisearchError]
+        try:
+            unfinished = {
+                task.uid for task in await self.task_handler._get_tasks_by_uid(uids, _UNFINISHED)
+            }
+            finished = [uid for uid in uids if uid not in unfinished]
+            tasks = await self.task_handler._get_tasks_by_uid(finished) if finished else []
+        except MeilisearchError as error:
+            if is_transient(error):
+                # Meilisearch may answer at the next tick.
+                return
+            outcomes = dict.fromkeys(uids, error)
+        else:
+            found = {task.uid: task for task in tasks}
+            outcomes = {
+                uid: found[uid] if uid in found else MeilisearchError(f"Task {uid} was not found.")
+                for uid in finished
+            }
+        self._resolve(outcomes)
+
+    def _resolve(self, outcomes: Mapping[int, Task | MeilisearchError]) -> None:
+        for uid, outcome in outcomes.items():
+            for future in self._futures.pop(uid, []):
+                if future.done():
+                    continue
+                if isinstance(outcome, Task):
+                    future.set_result(outcome)
+                else:
+                    future.set_exception(outcome)
+
+
+_UNFINISHED = ("enqueued", "processing")
+_UIDS_PER_REQUEST = 1000
+
+
+def _join_list_parameters(parameters: MutableMapping[str, Any] | None) -> dict[str, Any]:
+    if parameters is None:
+        return {}
+    return {
+        key: ",".join(value) if isinstance(value, (list, tuple)) else value
+        for key, value in parameters.items()
+    }
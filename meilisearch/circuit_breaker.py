@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from meilisearch.errors import MeilisearchCircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+@dataclass
+class _Circuit:
+    state: str = CLOSED
+    opened_at: float = 0.0
+    # One (failed, slow) pair per recent call.
+    outcomes: deque[tuple[bool, bool]] = field(default_factory=deque)
+
+
+class CircuitBreaker:
+    """Stop sending requests to a Meilisearch instance that keeps failing or answering slowly.
+
+    Each base URL has its own circuit. While it is closed, the outcome of the last `window_size`
+    calls is recorded. Once at least `minimum_calls` were seen, the circuit opens when the share
+    of failed calls (connection errors, timeouts, 429 and 5xx responses) reaches
+    `failure_rate_threshold`, or when the share of calls slower than `slow_call_duration` reaches
+    `slow_call_rate_threshold`.
+
+    An open circuit rejects calls at once with MeilisearchCircuitOpenError instead of letting
+    them wait for the timeout. After `open_timeout` seconds it becomes half-open: the next call
+    first probes the `/health` route, closing the circuit if Meilisearch is available again and
+    reopening it otherwise. Calls made while the probe is running are rejected.
+
+    One breaker can be shared by several clients.
+    """
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        slow_call_duration: float | None = None,
+        slow_call_rate_threshold: float = 0.5,
+        *,
+        window_size: int = 20,
+        minimum_calls: int = 10,
+        open_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        failure_rate_threshold (optional):
+            Share of failed calls, between 0 and 1, that opens the circuit. Default = 0.5
+        slow_call_duration (optional):
+            Calls taking longer than this many seconds count as slow.
+            Default = None (latency is not watched)
+        slow_call_rate_threshold (optional):
+            Share of slow calls, between 0 and 1, that opens the circuit. Default = 0.5
+        window_size (optional):
+            Number of recent calls the rates are computed on. Default = 20
+        minimum_calls (optional):
+            The circuit cannot open before this many calls were recorded. Default = 10
+        open_timeout (optional):
+            Seconds an open circuit waits before probing Meilisearch again. Default = 30.0
+        clock (optional):
+            Monotonic clock returning seconds. Default = time.monotonic
+        """
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.window_size = window_size
+        self.minimum_calls = minimum_calls
+        self.open_timeout = open_timeout
+        self.clock = clock
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def state(self, url: str) -> str:
+        """Return the state of the circuit of `url`: 'closed', 'open' or 'half-open'."""
+        with self._lock:
+            return self._circuit(url).state
+
+    def acquire(self, url: str) -> bool:
+        """Check that a call to `url` can be sent.
+
+        Returns True when the caller must probe the health of Meilisearch before sending it and
+        report the result with `record_probe`.
+
+        Raises
+        ------
+        MeilisearchCircuitOpenError
+            If the circuit is open, or half-open with a probe already running.
+        """
+        with self._lock:
+            circuit = self._circuit(url)
+            if circuit.state == CLOSED:
+                return False
+            retry_in = circuit.opened_at + self.open_timeout - self.clock()
+            if circuit.state == OPEN and retry_in <= 0:
+                circuit.state = HALF_OPEN
+                return True
+            raise MeilisearchCircuitOpenError(url, max(0.0, retry_in))
+
+    def record(self, url: str, elapsed: float, failed: bool) -> None:
+        """Record the outcome of a call to `url` that took `elapsed` seconds."""
+        slow = self.slow_call_duration is not None and elapsed > self.slow_call_duration
+        with self._lock:
+            circuit = self._circuit(url)
+            if circuit.state != CLOSED:
+                return
+            circuit.outcomes.append((failed, slow))
+            if len(circuit.outcomes) > self.window_size:
+                circuit.outcomes.popleft()
+            calls = len(circuit.outcomes)
+            if calls < self.minimum_calls:
+                return
+            failures = sum(1 for failed, _ in circuit.outcomes if failed)
+            slow_calls = sum(1 for _, slow in circuit.outcomes if slow)
+            if (
+                failures / calls >= self.failure_rate_threshold
+                or slow_calls / calls >= self.slow_call_rate_threshold
+            ):
+                self._open(circuit)
+
+    def record_probe(self, url: str, healthy: bool) -> None:
+        """Close the half-open circuit of `url` if the probe succeeded, reopen it otherwise."""
+        with self._lock:
+            circuit = self._circuit(url)
+            if healthy:
+                circuit.state = CLOSED
+                circuit.outcomes.clear()
+            else:
+                self._open(circuit)
+
+    def _open(self, circuit: _Circuit) -> None:
+        circuit.state = OPEN
+        circuit.opened_at = self.clock()
+        circuit.outcomes.clear()
+
+    def _circuit(self, url: str) -> _Circuit:
+        circuit = self._circuits.get(url)
+        if circuit is None:
+            circuit = self._circuits[url] = _Circuit()
+        return circuit
+
+
+def is_failure(status_code: int) -> bool:
+    """Return True if a response with `status_code` counts as a failure for the breaker."""
+    return status_code == 429 or status_code >= 500
@@ -6,13 +6,15 @@ import hashlib
 import hmac
 import json
 import re
-from collections.abc import Iterator, Mapping, MutableMapping, Sequence
-from typing import Any
+from collections.abc import Callable, Iterable, Iterator, Mapping, MutableMapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 from urllib import parse
 
 from meilisearch._httprequests import HttpRequests
 from meilisearch.config import Config
 from meilisearch.errors import (
+    MeilisearchApiError,
     MeilisearchCommunicationError,
     MeilisearchError,
 )
@@ -22,7 +24,17 @@ from meilisearch.models.key import Key, KeysResults
 from meilisearch.models.search_rule import SearchRule, SearchRulesResults
 from meilisearch.models.task import Batch, BatchResults, Task, TaskInfo, TaskResults
 from meilisearch.models.webhook import Webhook, WebhooksResults
-from meilisearch.task import TaskHandler
+from meilisearch.task import TaskFuture, TaskHandler, TaskPoller
+from meilisearch.webhook_receiver import TaskWebhookReceiver
+
+if TYPE_CHECKING:
+    from meilisearch.circuit_breaker import CircuitBreaker
+    from meilisearch.hedging import HedgingPolicy
+    from meilisearch.json_codec import JsonCodec
+    from meilisearch.metrics import RequestMetrics
+    from meilisearch.retry import RetryPolicy
+    from meilisearch.search_batching import SearchBatching
+    from meilisearch.search_cache import SearchCache
 
 
 class Client:
@@ -31,21 +43,45 @@ class Client:
 
     A client instance is needed for every Meilisearch API method to know the location of
     Meilisearch and its permissions.
+
+    A single client, and the Index instances it creates, can be shared by many threads
+    (for example a thread pool): they send their requests over the same connection pool
+    and per-request headers never leak between concurrent calls.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
-        url: str,
+        url: str | Sequence[str],
         api_key: str | None = None,
         timeout: int | None = None,
         client_agents: tuple[str, ...] | None = None,
         custom_headers: Mapping[str, str] | None = None,
+        *,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        compression: str | None = None,
+        compression_min_size: int = 1024,
+        on_request_metrics: Callable[[RequestMetrics], None] | None = None,
+        json_codec: JsonCodec | str = "stdlib",
+        retry: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        load_balancing: str = "least_outstanding",
+        health_check_interval: float | None = 5.0,
+        read_from_primary: bool = True,
+        hedging: HedgingPolicy | None = None,
+        search_cache: SearchCache | None = None,
+        coalesce_searches: bool = False,
+        search_batching: SearchBatching | None = None,
     ) -> None:
         """
         Parameters
         ----------
         url:
-            The url to the Meilisearch API (ex: http://localhost:7700)
+            The url to the Meilisearch API (ex: http://localhost:7700), or the urls of several
+            nodes serving the same data: documents and settings are written to the first one
+            while searches and document reads are spread over all of them.
         api_key:
             The optional API key for Meilisearch
         timeout (optional):
@@ -56,16 +92,110 @@ class Client:
             of this client.
         custom_headers (optional):
             Custom headers to add when sending data to Meilisearch.
+        pool_connections (optional):
+            Number of per-host connection pools kept by the HTTP session. Default = 10
+        pool_maxsize (optional):
+            Maximum number of keep-alive connections opened to a single host. Default = 10
+        pool_block (optional):
+            If True, requests wait for a free connection once pool_maxsize is reached instead of
+            opening a throwaway connection. Default = False
+        keep_alive (optional):
+            If False, connections are closed after every request. Default = True
+        compression (optional):
+            Content-Encoding used to compress the bodies sent to the documents and settings
+            routes: 'gzip', 'zstd' (requires zstandard) or 'br' (requires brotli).
+            Default = None (bodies are sent uncompressed)
+        compression_min_size (optional):
+            In-memory bodies smaller than this many bytes are sent uncompressed. Default = 1024
+        on_request_metrics (optional):
+            Called with a RequestMetrics after every request. Default = None
+        json_codec (optional):
+            JsonCodec used to encode request bodies and decode responses, or the name of one:
+            'stdlib', 'orjson', 'msgspec' or 'auto' (the fastest one installed). Default = 'stdlib'
+        retry (optional):
+            RetryPolicy used to resend requests that failed with a transient error.
+            Default = None (requests are sent once)
+        circuit_breaker (optional):
+            CircuitBreaker rejecting requests at once while Meilisearch keeps failing or
+            answering slowly, instead of waiting for the timeout. Default = None
+        load_balancing (optional):
+            How reads are spread over several nodes: 'least_outstanding' (fewest requests in
+            flight) or 'ewma' (lowest average latency). Default = 'least_outstanding'
+        health_check_interval (optional):
+            Seconds between two background health checks of the nodes, None to disable them.
+            Unhealthy nodes receive no reads until they recover. Default = 5.0
+        read_from_primary (optional):
+            If False, the first node only receives writes and reads go to the other nodes,
+            unless none of them is healthy. Default = True
+        hedging (optional):
+            HedgingPolicy sending a duplicate of the searches that are slower than usual and
+            keeping the first response. Default = None
+        search_cache (optional):
+            SearchCache answering identical searches, facet searches and multi-searches from
+            memory until their index changes. Default = None
+        coalesce_searches (optional):
+            If True, identical searches, facet searches and multi-searches sent concurrently
+            share a single request, and each caller gets its own copy of the response.
+            Default = False
+        search_batching (optional):
+            SearchBatching gathering the index searches made concurrently, from threads or
+            tasks, into multi-search requests. Default = None
         """
 
-        self.config = Config(url, api_key, timeout=timeout, client_agents=client_agents)
+        self.config = Config(
+            url,
+            api_key,
+            timeout=timeout,
+            client_agents=client_agents,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            compression=compression,
+            compression_min_size=compression_min_size,
+            on_request_metrics=on_request_metrics,
+            json_codec=json_codec,
+            retry=retry,
+            circuit_breaker=circuit_breaker,
+            load_balancing=load_balancing,
+            health_check_interval=health_check_interval,
+            read_from_primary=read_from_primary,
+            hedging=hedging,
+            search_cache=search_cache,
+            coalesce_searches=coalesce_searches,
+            search_batching=search_batching,
+        )
 
         # Store custom headers so they can be propagated to sub-clients (Index, TaskHandler, etc.)
         self._custom_headers = custom_headers
 
+        # A single pooled HttpRequests is shared by the client, its indexes and its task handler.
         self.http = HttpRequests(self.config, custom_headers)
+        if self.config.load_balancer is not None:
+            self.config.load_balancer.session = self.http.session
+
+        self.task_handler = TaskHandler(self.config, custom_headers, http=self.http)
+
+        # A single poller resolves the futures of the tasks watched by the client and its indexes.
+        self.task_poller = TaskPoller(self.task_handler)
+
+    def __enter__(self) -> Client:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled HTTP connections of the client.
 
-        self.task_handler = TaskHandler(self.config, custom_headers)
+        Index instances created from this client share its connections, so they should not
+        be used after the client is closed.
+        """
+        self.stop_listening_for_tasks()
+        self.task_poller.close()
+        if self.config.load_balancer is not None:
+            self.config.load_balancer.close()
+        self.http.close()
 
     def create_index(
         self,
@@ -97,7 +227,12 @@ class Client:
             An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
         """
         return Index.create(
-            self.config, uid, options, custom_headers=self._custom_headers, metadata=metadata
+            self.config,
+            uid,
+            options,
+            custom_headers=self._custom_headers,
+            metadata=metadata,
+            http=self.http,
         )
 
     def delete_index(self, uid: str, *, metadata: str | None = None) -> TaskInfo:
@@ -158,6 +293,8 @@ class Client:
                 index["createdAt"],
                 index["updatedAt"],
                 custom_headers=self._custom_headers,
+                http=self.http,
+                task_poller=self.task_poller,
             )
             for index in response["results"]
         ]
@@ -204,7 +341,13 @@ class Client:
         MeilisearchApiError
             An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
         """
-        return Index(self.config, uid, custom_headers=self._custom_headers).fetch_info()
+        return Index(
+            self.config,
+            uid,
+            custom_headers=self._custom_headers,
+            http=self.http,
+            task_poller=self.task_poller,
+        ).fetch_info()
 
     def get_raw_index(self, uid: str) -> dict[str, Any]:
         """Get the index as a dictionary.
@@ -242,11 +385,23 @@ class Client:
             An Index instance.
         """
         if uid is not None:
-            return Index(self.config, uid=uid, custom_headers=self._custom_headers)
+            return Index(
+                self.config,
+                uid=uid,
+                custom_headers=self._custom_headers,
+                http=self.http,
+                task_poller=self.task_poller,
+            )
         raise ValueError("The index UID should not be None")
 
     def multi_search(
-        self, queries: Sequence[Mapping[str, Any]], federation: dict[str, Any] | None = None
+        self,
+        queries: Sequence[Mapping[str, Any]],
+        federation: dict[str, Any] | None = None,
+        *,
+        after_task_uid: int | None = None,
+        chunk_size: int | None = None,
+        max_concurrency: int = 4,
     ) -> dict[str, list[dict[str, Any]]]:
         """Multi-index search.
 
@@ -263,6 +418,19 @@ class Client:
             Dictionary containing offset, limit, and optionally showPerformanceDetails
             for federated search (top-level performanceDetails in the response).
             https://www.meilisearch.com/docs/reference/api/multi_search
+        after_task_uid (optional):
+            task_uid of a write (TaskInfo.task_uid) this read must see. When the client has
+            several nodes, the read is only sent to a node where that task succeeded, or else to
+            the first node. Default = None
+        chunk_size (optional):
+            Number of queries sent at most in one request. Longer lists of queries are split
+            into requests sent concurrently, spread over the nodes when the client has several,
+            and their results are returned in the order of the queries. A query Meilisearch
+            rejects does not fail the call: its result is {"indexUid": ..., "error": ...},
+            the error being the one Meilisearch returned. Cannot be used with federation.
+            Default = None (all the queries in one request)
+        max_concurrency (optional):
+            Number of requests sent at the same time when the queries are split. Default = 4
 
         Returns
         -------
@@ -274,10 +442,42 @@ class Client:
         MeilisearchApiError
             An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
         """
-        return self.http.post(
-            f"{self.config.paths.multi_search}",
-            body={"queries": queries, "federation": federation},
-        )
+        if chunk_size is None:
+            return self.http.post(
+                f"{self.config.paths.multi_search}",
+                body={"queries": queries, "federation": federation},
+                after_task_uid=after_task_uid,
+            )
+        if federation is not None:
+            raise ValueError("A federated multi-search cannot be split into chunks.")
+
+        chunks = _split_queries(queries, chunk_size)
+        with ThreadPoolExecutor(max(1, min(max_concurrency, len(chunks)))) as executor:
+            parts = executor.map(
+                lambda chunk: self._multi_search_chunk(chunk, after_task_uid), chunks
+            )
+            return {"results": [result for part in parts for result in part]}
+
+    def _multi_search_chunk(
+        self, queries: Sequence[Mapping[str, Any]], after_task_uid: int | None
+    ) -> list[dict[str, Any]]:
+        """Send a chunk of queries, halving it until the query Meilisearch rejects is alone."""
+        try:
+            response = self.http.post(
+                f"{self.config.paths.multi_search}",
+                body={"queries": queries, "federation": None},
+                after_task_uid=after_task_uid,
+            )
+        except MeilisearchApiError as err:
+            if err.type != "invalid_request":
+                # Not caused by a query, every query would fail alike.
+                raise
+            if len(queries) == 1:
+                return [_query_error(queries[0], err)]
+            middle = len(queries) // 2
+            first = self._multi_search_chunk(queries[:middle], after_task_uid)
+            return first + self._multi_search_chunk(queries[middle:], after_task_uid)
+        return response["results"]
 
     def render_template(
         self,
@@ -649,6 +849,63 @@ class Client:
         response = self.http.delete(f"{self.config.paths.webhooks}/{webhook_uuid}")
         return response.status_code
 
+    def listen_for_tasks(self, receiver: TaskWebhookReceiver | None = None) -> TaskWebhookReceiver:
+        """Start a webhook receiver and register it in Meilisearch, so that waiting for tasks
+        is resolved by Meilisearch notifications instead of polling.
+
+        wait_for_task, wait_for_tasks and the futures of watch_task, of the client and of its
+        indexes, return as soon as the notification of the task arrives. When none arrives
+        within the fallback delay of the receiver, they poll Meilisearch as usual.
+
+        Parameters
+        ----------
+        receiver (optional):
+            TaskWebhookReceiver to use, for example to listen on another interface or give
+            Meilisearch a public URL. Default = None (a receiver on a free local port)
+
+        Returns
+        -------
+        receiver:
+            The started TaskWebhookReceiver, whose webhook is deleted by
+            stop_listening_for_tasks or close.
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        self.stop_listening_for_tasks()
+        receiver = receiver if receiver is not None else TaskWebhookReceiver()
+        receiver.start()
+        try:
+            webhook = self.create_webhook(
+                {"url": receiver.url, "headers": {"Authorization": f"Bearer {receiver.token}"}}
+            )
+        except MeilisearchError:
+            receiver.close()
+            raise
+        receiver.webhook_uuid = webhook.uuid
+        receiver.add_listener(self.task_poller.notify)
+        if self.config.search_cache is not None:
+            receiver.add_listener(self.config.search_cache.observe)
+        self.config.task_webhook = receiver
+        return receiver
+
+    def stop_listening_for_tasks(self) -> None:
+        """Delete the webhook registered by listen_for_tasks and stop its receiver."""
+        receiver = self.config.task_webhook
+        if receiver is None:
+            return
+        self.config.task_webhook = None
+        try:
+            if receiver.webhook_uuid is not None:
+                self.delete_webhook(receiver.webhook_uuid)
+        except MeilisearchError:
+            # Closing the client must not fail because Meilisearch is unreachable.
+            pass
+        finally:
+            receiver.close()
+
     # DYNAMIC SEARCH RULES ROUTES
 
     def get_dynamic_search_rules(
@@ -994,7 +1251,9 @@ class Client:
         self,
         uid: int,
         timeout_in_ms: int = 5000,
-        interval_in_ms: int = 50,
+        interval_in_ms: int | None = None,
+        *,
+        max_interval_in_ms: int = 1000,
     ) -> Task:
         """Wait until Meilisearch processes a task until it fails or succeeds.
 
@@ -1005,7 +1264,10 @@ class Client:
         timeout_in_ms (optional):
             Time the method should wait before raising a MeilisearchTimeoutError
         interval_in_ms (optional):
-            Time interval the method should wait (sleep) between requests
+            Fixed time interval the method should wait (sleep) between requests
+            Default = None (starts at 10ms and doubles after each request)
+        max_interval_in_ms (optional):
+            Longest time interval between requests when the interval is adaptive. Default = 1000
 
         Returns
         -------
@@ -1017,7 +1279,76 @@ class Client:
         MeilisearchTimeoutError
             An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
         """
-        return self.task_handler.wait_for_task(uid, timeout_in_ms, interval_in_ms)
+        return self.task_handler.wait_for_task(
+            uid, timeout_in_ms, interval_in_ms, max_interval_in_ms=max_interval_in_ms
+        )
+
+    def wait_for_tasks(
+        self,
+        uids: Iterable[int],
+        timeout_in_ms: int = 5000,
+        interval_in_ms: int | None = None,
+        *,
+        max_interval_in_ms: int = 1000,
+        fail_fast: bool = False,
+    ) -> Iterator[Task]:
+        """Wait until Meilisearch processes several tasks, yielding each one once it fails or
+        succeeds.
+
+        The tasks are polled together with a single request per interval.
+
+        Parameters
+        ----------
+        uids:
+            Identifiers of the tasks to wait for being processed.
+        timeout_in_ms (optional):
+            Time the method should wait for all the tasks before raising a MeilisearchTimeoutError.
+        interval_in_ms (optional):
+            Fixed time interval the method should wait (sleep) between requests.
+            Default = None (starts at 10ms and doubles after each request)
+        max_interval_in_ms (optional):
+            Longest time interval between requests when the interval is adaptive. Default = 1000
+        fail_fast (optional):
+            If True, raise a MeilisearchTaskFailedError as soon as one of the tasks failed.
+
+        Returns
+        -------
+        tasks:
+            Iterator of Task instances, yielded as the tasks are processed.
+
+        Raises
+        ------
+        MeilisearchTimeoutError
+            If some tasks were still not processed after timeout_in_ms.
+        MeilisearchTaskFailedError
+            If fail_fast is True and a task failed.
+        """
+        return self.task_handler.wait_for_tasks(
+            uids,
+            timeout_in_ms,
+            interval_in_ms,
+            max_interval_in_ms=max_interval_in_ms,
+            fail_fast=fail_fast,
+        )
+
+    def watch_task(self, task: TaskInfo | int) -> TaskFuture:
+        """Return a future resolved once Meilisearch processed the task.
+
+        All the tasks watched through the client are polled together by one background thread,
+        see TaskPoller. The future works with concurrent.futures.wait and as_completed, accepts
+        callbacks and timeouts, and can be awaited.
+
+        Parameters
+        ----------
+        task:
+            TaskInfo returned by a write method, such as add_documents, or the uid of the task.
+
+        Returns
+        -------
+        future:
+            TaskFuture resolved with the Task once it succeeded or failed.
+        """
+        return self.task_poller.watch(task)
 
     def get_batches(self, parameters: MutableMapping[str, Any] | None = None) -> BatchResults:
         """Get all batches.
@@ -1393,3 +1724,18 @@ class Client:
             An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
         """
         return self.http.patch(self.config.paths.experimental_features, body=features)
+
+
+def _split_queries(
+    queries: Sequence[Mapping[str, Any]], chunk_size: int
+) -> list[Sequence[Mapping[str, Any]]]:
+    if chunk_size < 1:
+        raise ValueError("The chunk size of a multi-search should be at least 1.")
+    return [queries[start : start + chunk_size] for start in range(0, len(queries), chunk_size)]
+
+
+def _query_error(query: Mapping[str, Any], err: MeilisearchApiError) -> dict[str, Any]:
+    return {
+        "indexUid": query.get("indexUid"),
+        "error": {"message": err.message, "code": err.code, "type": err.type, "link": err.link},
+    }
@@ -1,5 +1,21 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING
+
+from meilisearch._compression import check_content_encoding
+from meilisearch.json_codec import JsonCodec, get_json_codec
+from meilisearch.load_balancer import LoadBalancer
+
+if TYPE_CHECKING:
+    from meilisearch.circuit_breaker import CircuitBreaker
+    from meilisearch.hedging import HedgingPolicy
+    from meilisearch.metrics import RequestMetrics
+    from meilisearch.retry import RetryPolicy
+    from meilisearch.search_batching import SearchBatching
+    from meilisearch.search_cache import SearchCache
+    from meilisearch.webhook_receiver import TaskWebhookReceiver
+
 
 class Config:
     """
@@ -53,24 +69,123 @@ class Config:
         export = "export"
         render_template = "render-template"
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
-        url: str,
+        url: str | Sequence[str],
         api_key: str | None = None,
         timeout: int | None = None,
         client_agents: tuple[str, ...] | None = None,
+        *,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        compression: str | None = None,
+        compression_min_size: int = 1024,
+        on_request_metrics: Callable[[RequestMetrics], None] | None = None,
+        json_codec: JsonCodec | str = "stdlib",
+        retry: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        load_balancing: str = "least_outstanding",
+        health_check_interval: float | None = 5.0,
+        read_from_primary: bool = True,
+        hedging: HedgingPolicy | None = None,
+        search_cache: SearchCache | None = None,
+        coalesce_searches: bool = False,
+        search_batching: SearchBatching | None = None,
     ) -> None:
         """
         Parameters
         ----------
         url:
-            The url to the Meilisearch API (ex: http://localhost:7700)
+            The url to the Meilisearch API (ex: http://localhost:7700), or the urls of several
+            nodes serving the same data. Writes are sent to the first one and reads are spread
+            over all of them.
         api_key:
             The optional API key to access Meilisearch
+        pool_connections (optional):
+            Number of per-host connection pools kept by the HTTP session. Default = 10
+        pool_maxsize (optional):
+            Maximum number of connections kept open to a single host. Default = 10
+        pool_block (optional):
+            If True, requests wait for a free connection once pool_maxsize is reached instead of
+            opening a throwaway connection. Default = False
+        keep_alive (optional):
+            If False, connections are closed after every request. Default = True
+        compression (optional):
+            Content-Encoding used to compress the bodies sent to the documents and settings
+            routes: 'gzip', 'zstd' (requires zstandard) or 'br' (requires brotli).
+            Default = None (bodies are sent uncompressed)
+        compression_min_size (optional):
+            In-memory bodies smaller than this many bytes are sent uncompressed. Files are always
+            compressed. Default = 1024
+        on_request_metrics (optional):
+            Called with a RequestMetrics after every request, for example to record latencies
+            or the compression ratio achieved. Default = None
+        json_codec (optional):
+            JsonCodec used to encode request bodies and decode responses, or the name of one:
+            'stdlib', 'orjson', 'msgspec' or 'auto' (the fastest one installed). A serializer
+            passed to a document method still takes precedence. Default = 'stdlib'
+        retry (optional):
+            RetryPolicy used to resend requests that failed with a transient error.
+            Default = None (requests are sent once)
+        circuit_breaker (optional):
+            CircuitBreaker rejecting requests at once while Meilisearch keeps failing or
+            answering slowly, instead of waiting for the timeout. Default = None
+        load_balancing (optional):
+            How reads are spread over several nodes: 'least_outstanding' (fewest requests in
+            flight) or 'ewma' (lowest average latency). Default = 'least_outstanding'
+        health_check_interval (optional):
+            Seconds between two background health checks of the nodes, None to disable them.
+            Unhealthy nodes receive no reads until they recover. Default = 5.0
+        read_from_primary (optional):
+            If False, the first node only receives writes and reads go to the other nodes,
+            unless none of them is healthy. Default = True
+        hedging (optional):
+            HedgingPolicy sending a duplicate of the searches that are slower than usual and
+            keeping the first response. Default = None
+        search_cache (optional):
+            SearchCache answering identical searches without sending them again. Default = None
+        coalesce_searches (optional):
+            If True, identical searches sent while one is in flight wait for its response
+            instead of being sent too. Default = False
+        search_batching (optional):
+            SearchBatching sending the concurrent searches as one multi-search. Default = None
         """
+        if compression is not None:
+            check_content_encoding(compression)
 
-        self.url = url
+        nodes = [url] if isinstance(url, str) else list(url)
+        self.url = nodes[0]
+        self.nodes = nodes
         self.api_key = api_key
         self.timeout = timeout
         self.client_agents = client_agents
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.compression = compression
+        self.compression_min_size = compression_min_size
+        self.on_request_metrics = on_request_metrics
+        self.json_codec = get_json_codec(json_codec)
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+        self.hedging = hedging
+        self.search_cache = search_cache
+        self.coalesce_searches = coalesce_searches
+        self.search_batching = search_batching
+        self.load_balancer = (
+            LoadBalancer(
+                nodes,
+                load_balancing,
+                health_check_interval,
+                timeout=timeout,
+                read_from_primary=read_from_primary,
+            )
+            if len(nodes) > 1
+            else None
+        )
+        # Set by Client.listen_for_tasks.
+        self.task_webhook: TaskWebhookReceiver | None = None
         self.paths = self.Paths()
@@ -3,10 +3,15 @@ from __future__ import annotations
 import json
 from collections.abc import Callable
 from functools import wraps
-from typing import Any, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from requests import Response
 
+if TYPE_CHECKING:
+    import httpx
+
+    from meilisearch.models.task import Task
+
 T = TypeVar("T")
 
 
@@ -24,7 +29,7 @@ class MeilisearchError(Exception):  # pragma: no cover
 class MeilisearchApiError(MeilisearchError):
     """Error sent by Meilisearch API"""
 
-    def __init__(self, error: str, request: Response) -> None:
+    def __init__(self, error: str, request: Response | httpx.Response) -> None:
         self.status_code = request.status_code
         self.code = None
         self.link = None
@@ -60,6 +65,32 @@ class MeilisearchCommunicationError(MeilisearchError):
         return f"MeilisearchCommunicationError, {self.message}"
 
 
+class MeilisearchCircuitOpenError(MeilisearchCommunicationError):
+    """Error when a request is not sent because the circuit breaker of its host is open"""
+
+    def __init__(self, url: str, retry_in: float) -> None:
+        self.url = url
+        self.retry_in = retry_in
+        super().__init__(
+            f"Circuit open for {url}, requests are rejected for {retry_in:.1f} more seconds"
+        )
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"MeilisearchCircuitOpenError, {self.message}"
+
+
+class MeilisearchTaskFailedError(MeilisearchError):
+    """Error when a task waited for failed in Meilisearch"""
+
+    def __init__(self, task: Task) -> None:
+        self.task = task
+        error = task.error or {}
+        super().__init__(f"Task {task.uid} failed: {error.get('message', task.status)}")
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"MeilisearchTaskFailedError, {self.message}"
+
+
 class MeilisearchTimeoutError(MeilisearchError):
     """Error when Meilisearch operation takes longer than expected"""
 
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from meilisearch.config import Config
+
+
+class HedgingPolicy:
+    """Send a duplicate of a slow search to cut tail latency.
+
+    When a search, facet search or multi-search has not been answered after the hedging delay,
+    the same request is sent again, to another node when the client has several, and the first
+    successful response is returned. The asyncio client cancels the losing request; the
+    synchronous client cannot interrupt a request in flight, so it discards its response.
+
+    The delay is either fixed or the `percentile` of the latencies of the last `window_size`
+    searches. In that case no duplicate is sent before `min_samples` searches were measured.
+
+    `fired` counts the duplicates sent and `won` the ones answered before the original request.
+    """
+
+    def __init__(
+        self,
+        delay: float | None = None,
+        percentile: float = 95.0,
+        *,
+        min_samples: int = 20,
+        window_size: int = 500,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        delay (optional):
+            Seconds to wait for a response before sending a duplicate.
+            Default = None (the observed percentile of the latencies)
+        percentile (optional):
+            Percentile of the observed latencies used as delay when none is given. Default = 95.0
+        min_samples (optional):
+            Number of latencies to observe before the percentile is trusted. Default = 20
+        window_size (optional):
+            Number of most recent latencies the percentile is computed on. Default = 500
+        """
+        self.delay = delay
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.fired = 0
+        self.won = 0
+        self._latencies: deque[float] = deque(maxlen=window_size)
+        self._lock = threading.Lock()
+
+    def hedge_delay(self) -> float | None:
+        """Return how long to wait before sending a duplicate, None to not send one."""
+        if self.delay is not None:
+            return self.delay
+        with self._lock:
+            latencies = sorted(self._latencies)
+        if len(latencies) < self.min_samples:
+            return None
+        return latencies[min(len(latencies) - 1, int(len(latencies) * self.percentile / 100))]
+
+    def record(self, elapsed: float) -> None:
+        """Record the latency in seconds of a request that got a response."""
+        with self._lock:
+            self._latencies.append(elapsed)
+
+    def record_fired(self) -> None:
+        with self._lock:
+            self.fired += 1
+
+    def record_won(self) -> None:
+        with self._lock:
+            self.won += 1
+
+
+def is_hedgeable(config: Config, method: str, path: str) -> bool:
+    """Return True for the requests worth hedging: searches, facet searches and multi-searches."""
+    if method.upper() != "POST":
+        return False
+    segment = path.split("?", 1)[0].strip("/").rsplit("/", 1)[-1]
+    paths = config.paths
+    return segment in (paths.search, paths.facet_search, paths.multi_search)
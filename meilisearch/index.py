@@ -1,17 +1,30 @@
 from __future__ import annotations
 
-from collections.abc import Generator, Mapping, MutableMapping, Sequence
+from collections.abc import (
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Sequence,
+)
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from mmap import ACCESS_READ, mmap
+from os import PathLike, fstat
+from pathlib import Path
+from threading import BoundedSemaphore, Event
+from typing import TYPE_CHECKING, Any, TypeVar
 from urllib import parse
 from warnings import warn
 
 from camel_converter import to_snake
 
-from meilisearch._httprequests import HttpRequests
+from meilisearch._httprequests import HttpRequests, _serialize_body
 from meilisearch._utils import iso_to_date_time
 from meilisearch.config import Config
-from meilisearch.errors import version_error_hint_message
+from meilisearch.errors import MeilisearchApiError, version_error_hint_message
 from meilisearch.models.document import Document, DocumentsResults, FieldsResults
 from meilisearch.models.embedders import (
     CompositeEmbedder,
@@ -34,11 +47,15 @@ from meilisearch.models.index import (
     TypoTolerance,
 )
 from meilisearch.models.task import Task, TaskInfo, TaskResults
-from meilisearch.task import TaskHandler
+from meilisearch.task import TaskFuture, TaskHandler, TaskPoller
 
 if TYPE_CHECKING:
     from json import JSONEncoder
 
+    from meilisearch.json_codec import JsonCodec
+
+_T = TypeVar("_T")
+
 
 class Index:
     """
@@ -56,6 +73,8 @@ class Index:
         created_at: datetime | str | None = None,
         updated_at: datetime | str | None = None,
         custom_headers: Mapping[str, str] | None = None,
+        http: HttpRequests | None = None,
+        task_poller: TaskPoller | None = None,
     ) -> None:
         """
         Parameters
@@ -66,10 +85,15 @@ class Index:
             UID of the index on which to perform the index actions.
         primary_key:
             Primary-key of the index.
+        http (optional):
+            HttpRequests instance to share, so that the connection pool of the client is reused.
+        task_poller (optional):
+            TaskPoller to share, so that the tasks of the client are polled together.
         """
         self.config = config
-        self.http = HttpRequests(config, custom_headers)
-        self.task_handler = TaskHandler(config, custom_headers)
+        self.http = http if http is not None else HttpRequests(config, custom_headers)
+        self.task_handler = TaskHandler(config, custom_headers, http=self.http)
+        self.task_poller = task_poller if task_poller is not None else TaskPoller(self.task_handler)
         self.uid = uid
         self.primary_key = primary_key
         self.created_at = iso_to_date_time(created_at)
@@ -191,6 +215,7 @@ class Index:
         custom_headers: Mapping[str, str] | None = None,
         *,
         metadata: str | None = None,
+        http: HttpRequests | None = None,
     ) -> TaskInfo:
         """Create the index.
 
@@ -202,6 +227,8 @@ class Index:
             Options passed during index creation (ex: { 'primaryKey': 'name' }).
         metadata (optional):
             Custom metadata string to attach to the task.
+        http (optional):
+            HttpRequests instance to send the request with. A new one is created if omitted.
 
         Returns
         -------
@@ -220,7 +247,9 @@ class Index:
         url = config.paths.index
         if metadata is not None:
             url += f"?{parse.urlencode({'customMetadata': metadata})}"
-        task = HttpRequests(config, custom_headers).post(url, payload)
+        if http is None:
+            http = HttpRequests(config, custom_headers)
+        task = http.post(url, payload)
 
         return TaskInfo(**task)
 
@@ -277,7 +306,9 @@ class Index:
         self,
         uid: int,
         timeout_in_ms: int = 5000,
-        interval_in_ms: int = 50,
+        interval_in_ms: int | None = None,
+        *,
+        max_interval_in_ms: int = 1000,
     ) -> Task:
         """Wait until Meilisearch processes a task until it fails or succeeds.
 
@@ -288,7 +319,10 @@ class Index:
         timeout_in_ms (optional):
             time the method should wait before raising a MeilisearchTimeoutError.
         interval_in_ms (optional):
-            time interval the method should wait (sleep) between requests.
+            fixed time interval the method should wait (sleep) between requests.
+            Default = None (starts at 10ms and doubles after each request)
+        max_interval_in_ms (optional):
+            longest time interval between requests when the interval is adaptive. Default = 1000
 
         Returns
         -------
@@ -300,7 +334,76 @@ class Index:
         MeilisearchTimeoutError
             An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
         """
-        return self.task_handler.wait_for_task(uid, timeout_in_ms, interval_in_ms)
+        return self.task_handler.wait_for_task(
+            uid, timeout_in_ms, interval_in_ms, max_interval_in_ms=max_interval_in_ms
+        )
+
+    def wait_for_tasks(
+        self,
+        uids: Iterable[int],
+        timeout_in_ms: int = 5000,
+        interval_in_ms: int | None = None,
+        *,
+        max_interval_in_ms: int = 1000,
+        fail_fast: bool = False,
+    ) -> Iterator[Task]:
+        """Wait until Meilisearch processes several tasks, yielding each one once it fails or
+        succeeds.
+
+        The tasks are polled together with a single request per interval.
+
+        Parameters
+        ----------
+        uids:
+            Identifiers of the tasks to wait for being processed.
+        timeout_in_ms (optional):
+            Time the method should wait for all the tasks before raising a MeilisearchTimeoutError.
+        interval_in_ms (optional):
+            Fixed time interval the method should wait (sleep) between requests.
+            Default = None (starts at 10ms and doubles after each request)
+        max_interval_in_ms (optional):
+            Longest time interval between requests when the interval is adaptive. Default = 1000
+        fail_fast (optional):
+            If True, raise a MeilisearchTaskFailedError as soon as one of the tasks failed.
+
+        Returns
+        -------
+        tasks:
+            Iterator of Task instances, yielded as the tasks are processed.
+
+        Raises
+        ------
+        MeilisearchTimeoutError
+            If some tasks were still not processed after timeout_in_ms.
+        MeilisearchTaskFailedError
+            If fail_fast is True and a task failed.
+        """
+        return self.task_handler.wait_for_tasks(
+            uids,
+            timeout_in_ms,
+            interval_in_ms,
+            max_interval_in_ms=max_interval_in_ms,
+            fail_fast=fail_fast,
+        )
+
+    def watch_task(self, task: TaskInfo | int) -> TaskFuture:
+        """Return a future resolved once Meilisearch processed the task.
+
+        All the tasks watched through the client of the index are polled together by one
+        background thread, see TaskPoller. The future works with concurrent.futures.wait and
+        as_completed, accepts callbacks and timeouts, and can be awaited.
+
+        Parameters
+        ----------
+        task:
+            TaskInfo returned by a write method, such as add_documents, or the uid of the task.
+
+        Returns
+        -------
+        future:
+            TaskFuture resolved with the Task once it succeeded or failed.
+        """
+        return self.task_poller.watch(task)
 
     def get_stats(
         self,
@@ -347,7 +450,13 @@ class Index:
         return IndexStats(**stats)
 
     @version_error_hint_message
-    def search(self, query: str, opt_params: Mapping[str, Any] | None = None) -> dict[str, Any]:
+    def search(
+        self,
+        query: str,
+        opt_params: Mapping[str, Any] | None = None,
+        *,
+        after_task_uid: int | None = None,
+    ) -> dict[str, Any]:
         """Search in the index.
 
         https://www.meilisearch.com/docs/reference/api/search
@@ -367,6 +476,10 @@ class Index:
             - offset: Number of documents to skip
             - showPerformanceDetails: If true, the response includes a
               performanceDetails object (raw data; fields may change in future API versions)
+        after_task_uid (optional):
+            task_uid of a write (TaskInfo.task_uid) this read must see. When the client has
+            several nodes, the read is only sent to a node where that task succeeded, or else to
+            the first node. Default = None
 
         Returns
         -------
@@ -387,14 +500,76 @@ class Index:
         return self.http.post(
             f"{self.config.paths.index}/{self.uid}/{self.config.paths.search}",
             body=body,
+            after_task_uid=after_task_uid,
         )
 
+    def iter_search(
+        self,
+        query: str,
+        opt_params: Mapping[str, Any] | None = None,
+        *,
+        page_size: int = 100,
+        prefetch: bool = True,
+        after_task_uid: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Search in the index and yield the hits one by one, fetching them page by page.
+
+        Iteration stops at the last hit, as counted by estimatedTotalHits, or when Meilisearch
+        returns fewer hits than asked, which happens past the maxTotalHits setting of the index.
+        While the hits of a page are consumed, the next page is fetched in a background thread,
+        so at most two pages are held in memory.
+
+        Parameters
+        ----------
+        query:
+            String containing the searched word(s)
+        opt_params (optional):
+            Dictionary containing optional query parameters, see search. offset is the number
+            of hits to skip and limit the number of hits to yield at most. page and hitsPerPage
+            are not supported.
+        page_size (optional):
+            Number of hits fetched by each search request. Default = 100
+        prefetch (optional):
+            If False, a page is only fetched once the hits of the previous one are consumed.
+            Default = True
+        after_task_uid (optional):
+            task_uid of a write this read must see, see search. Default = None
+
+        Returns
+        -------
+        hits:
+            Iterator of the hits of the search.
+
+        Raises
+        ------
+        ValueError
+            If opt_params contains page or hitsPerPage, or if page_size is not positive.
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        params, offset, end = _search_pages(opt_params, page_size)
+
+        def search_page(
+            page: tuple[int, int],
+        ) -> tuple[list[dict[str, Any]], tuple[int, int] | None]:
+            response = self.search(
+                query,
+                {**params, "offset": page[0], "limit": page[1]},
+                after_task_uid=after_task_uid,
+            )
+            total = response.get("estimatedTotalHits", response.get("totalHits"))
+            return response["hits"], _next_page(page, len(response["hits"]), total, end)
+
+        return _iter_pages(search_page, (offset, _page_limit(offset, page_size, end)), prefetch)
+
     @version_error_hint_message
     def facet_search(
         self,
         facet_name: str,
         facet_query: str | None = None,
         opt_params: Mapping[str, Any] | None = None,
+        *,
+        after_task_uid: int | None = None,
     ) -> dict[str, Any]:
         """
         Perform a facet search based on the given facet query and facet name.
@@ -407,6 +582,10 @@ class Index:
             String containing the searched words
         opt_params (optional):
             Dictionary containing optional query parameters.
+        after_task_uid (optional):
+            task_uid of a write (TaskInfo.task_uid) this read must see. When the client has
+            several nodes, the read is only sent to a node where that task succeeded, or else to
+            the first node. Default = None
 
         Returns
         -------
@@ -420,10 +599,15 @@ class Index:
         return self.http.post(
             f"{self.config.paths.index}/{self.uid}/{self.config.paths.facet_search}",
             body=body,
+            after_task_uid=after_task_uid,
         )
 
     def get_document(
-        self, document_id: str | int, parameters: MutableMapping[str, Any] | None = None
+        self,
+        document_id: str | int,
+        parameters: MutableMapping[str, Any] | None = None,
+        *,
+        after_task_uid: int | None = None,
     ) -> Document:
         """Get one document with given document identifier.
 
@@ -433,6 +617,10 @@ class Index:
             Unique identifier of the document.
         parameters (optional):
             parameters accepted by the get document route: https://www.meilisearch.com/docs/reference/api/documents#get-one-document
+        after_task_uid (optional):
+            task_uid of a write (TaskInfo.task_uid) this read must see. When the client has
+            several nodes, the read is only sent to a node where that task succeeded, or else to
+            the first node. Default = None
 
         Returns
         -------
@@ -450,12 +638,18 @@ class Index:
             parameters["fields"] = ",".join(parameters["fields"])
 
         document = self.http.get(
-            f"{self.config.paths.index}/{self.uid}/{self.config.paths.document}/{document_id}?{parse.urlencode(parameters)}"
+            f"{self.config.paths.index}/{self.uid}/{self.config.paths.document}/{document_id}?{parse.urlencode(parameters)}",
+            after_task_uid=after_task_uid,
         )
         return Document(document)
 
     @version_error_hint_message
-    def get_documents(self, parameters: MutableMapping[str, Any] | None = None) -> DocumentsResults:
+    def get_documents(
+        self,
+        parameters: MutableMapping[str, Any] | None = None,
+        *,
+        after_task_uid: int | None = None,
+    ) -> DocumentsResults:
         """Get a set of documents from the index.
 
         Parameters
@@ -463,6 +657,10 @@ class Index:
         parameters (optional):
             parameters accepted by the get documents route: https://www.meilisearch.com/docs/reference/api/documents#get-documents
             Note: The filter parameter is only available in Meilisearch >= 1.2.0.
+        after_task_uid (optional):
+            task_uid of a write (TaskInfo.task_uid) this read must see. When the client has
+            several nodes, the read is only sent to a node where that task succeeded, or else to
+            the first node. Default = None
 
         Returns
         -------
@@ -490,9 +688,69 @@ class Index:
         response = self.http.post(
             f"{self.config.paths.index}/{self.uid}/{self.config.paths.document}/fetch",
             body=parameters,
+            after_task_uid=after_task_uid,
         )
         return DocumentsResults(response)
 
+    def iter_documents(
+        self,
+        *,
+        fields: Sequence[str] | None = None,
+        filter: str | list[str | list[str]] | None = None,
+        page_size: int = 1000,
+        raw: bool = False,
+        prefetch: bool = True,
+        after_task_uid: int | None = None,
+    ) -> Iterator[Document] | Iterator[dict[str, Any]]:
+        """Yield every document of the index, fetching them page by page.
+
+        While the documents of a page are consumed, the next page is fetched, and its documents
+        built, in a background thread, so at most two pages are held in memory. Documents
+        added or deleted during the iteration may be skipped or yielded twice.
+
+        Parameters
+        ----------
+        fields (optional):
+            Attributes of the documents to retrieve. Default = None (all of them)
+        filter (optional):
+            Filter expression the documents must match. Default = None
+        page_size (optional):
+            Number of documents fetched by each request. Default = 1000
+        raw (optional):
+            If True, yield the documents as dictionaries instead of Document instances.
+            Default = False
+        prefetch (optional):
+            If False, a page is only fetched once the documents of the previous one are
+            consumed. Default = True
+        after_task_uid (optional):
+            task_uid of a write this read must see, see get_documents. Default = None
+
+        Returns
+        -------
+        documents:
+            Iterator of Document instances, or of dictionaries when raw is True.
+
+        Raises
+        ------
+        ValueError
+            If page_size is not positive.
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        parameters = _documents_pages(fields, filter, page_size)
+
+        def documents_page(page: tuple[int, int]) -> tuple[list[Any], tuple[int, int] | None]:
+            response = self.http.post(
+                f"{self.config.paths.index}/{self.uid}/{self.config.paths.document}/fetch",
+                body={**parameters, "offset": page[0], "limit": page[1]},
+                after_task_uid=after_task_uid,
+            )
+            documents = response["results"]
+            next_page = _next_page(page, len(documents), response["total"], None)
+            return (documents if raw else [Document(doc) for doc in documents]), next_page
+
+        return _iter_pages(documents_page, (0, page_size), prefetch)
+
     def get_similar_documents(self, parameters: Mapping[str, Any]) -> dict[str, Any]:
         """Get the documents similar to a document.
 
@@ -569,6 +827,8 @@ class Index:
         serializer: type[JSONEncoder] | None = None,
         skip_creation: bool | None = None,
         metadata: str | None = None,
+        max_concurrency: int | None = None,
+        max_payload_size: int | None = None,
     ) -> list[TaskInfo]:
         """Add documents to the index in batches.
 
@@ -588,6 +848,16 @@ class Index:
             than created. If False or None (default), existing behavior is preserved.
         metadata (optional):
             Custom metadata string to attach to the task.
+        max_concurrency (optional):
+            Maximum number of batches serialized and sent at the same time from a thread pool.
+            Batches sharing a primary key value are still enqueued in submission order. When
+            primary_key is not given and the index has none yet, batches are sent one after
+            another. Default = None (batches are sent one after another).
+        max_payload_size (optional):
+            Maximum size in bytes of the JSON payload of each batch. Each document is serialized
+            once and packed into the current batch until the payload would exceed this size or
+            hold batch_size documents. A document larger than this size is sent on its own.
+            Default = None (batches are only limited by batch_size).
 
         Returns
         -------
@@ -602,19 +872,32 @@ class Index:
             Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
         """
 
-        tasks: list[TaskInfo] = []
-
-        for document_batch in self._batch(documents, batch_size):
-            task = self.add_documents(
+        def send(document_batch: Sequence[Mapping[str, Any]], payload: bytes | None) -> TaskInfo:
+            if payload is not None:
+                return self.add_documents_raw(
+                    payload,
+                    primary_key,
+                    "application/json",
+                    skip_creation=skip_creation,
+                    metadata=metadata,
+                )
+            return self.add_documents(
                 document_batch,
                 primary_key,
                 serializer=serializer,
                 skip_creation=skip_creation,
                 metadata=metadata,
             )
-            tasks.append(task)
 
-        return tasks
+        return self._send_batches(
+            send,
+            documents,
+            batch_size,
+            primary_key,
+            max_concurrency=max_concurrency,
+            max_payload_size=max_payload_size,
+            serializer=serializer,
+        )
 
     def add_documents_json(
         self,
@@ -801,6 +1084,256 @@ class Index:
         response = self.http.post(url, str_documents, content_type, serializer=serializer)
         return TaskInfo(**response)
 
+    def add_documents_from_file(
+        self,
+        path: str | PathLike[str],
+        primary_key: str | None = None,
+        content_type: str | None = None,
+        csv_delimiter: str | None = None,
+        *,
+        skip_creation: bool | None = None,
+        metadata: str | None = None,
+    ) -> TaskInfo:
+        """Add documents from a JSON, NDJSON or CSV file.
+
+        The file is streamed to Meilisearch in blocks with its Content-Length, it is never read
+        into memory as a whole.
+
+        Parameters
+        ----------
+        path:
+            Path of the file.
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up.
+        content_type (optional):
+            The content MIME type: 'application/json', 'application/x-ndjson', or 'text/csv'.
+            Default = None (guessed from the file extension: .json, .ndjson, .jsonl or .csv).
+        csv_delimiter (optional):
+            One ASCII character used to customize the delimiter for CSV.
+            Note: The csv delimiter can only be used with the Content-Type text/csv.
+        skip_creation (optional):
+            If True, documents that don't exist in the index are silently ignored rather
+            than created. If False or None (default), existing behavior is preserved.
+        metadata (optional):
+            Custom metadata string to attach to the task.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        ValueError
+            If content_type is not given and cannot be guessed from the file extension.
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        url = self._build_url(
+            primary_key=primary_key,
+            csv_delimiter=csv_delimiter,
+            skip_creation=skip_creation,
+            metadata=metadata,
+        )
+        content_type = content_type or _guess_content_type(path)
+        with open(path, "rb") as document_file:
+            response = self.http.post(url, document_file, content_type)
+        return TaskInfo(**response)
+
+    def add_documents_from_file_in_batches(
+        self,
+        path: str | PathLike[str],
+        max_payload_size: int,
+        primary_key: str | None = None,
+        content_type: str | None = None,
+        csv_delimiter: str | None = None,
+        *,
+        max_concurrency: int | None = None,
+        skip_creation: bool | None = None,
+        metadata: str | None = None,
+    ) -> list[TaskInfo]:
+        """Add documents from an NDJSON or CSV file too big for a single payload.
+
+        The file is memory-mapped and cut into byte ranges of at most max_payload_size bytes
+        that end on record boundaries, taking quoted CSV fields into account. Each CSV batch
+        starts with the header line. Records are never decoded.
+
+        Parameters
+        ----------
+        path:
+            Path of the file.
+        max_payload_size:
+            Maximum size in bytes of each batch. A record larger than this size is sent on its own.
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up.
+        content_type (optional):
+            The content MIME type: 'application/x-ndjson' or 'text/csv'.
+            Default = None (guessed from the file extension: .ndjson, .jsonl or .csv).
+        csv_delimiter (optional):
+            One ASCII character used to customize the delimiter for CSV.
+            Note: The csv delimiter can only be used with the Content-Type text/csv.
+        max_concurrency (optional):
+            Maximum number of batches sent at the same time from a thread pool. Batches may then
+            be enqueued out of order, so keep the default if the file writes the same document
+            more than once. Default = None (batches are sent one after another).
+        skip_creation (optional):
+            If True, documents that don't exist in the index are silently ignored rather
+            than created. If False or None (default), existing behavior is preserved.
+        metadata (optional):
+            Custom metadata string to attach to the task.
+
+        Returns
+        -------
+        tasks_info:
+            List of TaskInfo instances containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        ValueError
+            If the content type is neither 'application/x-ndjson' nor 'text/csv'.
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        content_type = content_type or _guess_content_type(path)
+
+        def send(payload: bytes) -> TaskInfo:
+            return self.add_documents_raw(
+                payload,
+                primary_key,
+                content_type,
+                csv_delimiter,
+                skip_creation=skip_creation,
+                metadata=metadata,
+            )
+
+        payloads = _split_file(path, content_type, max_payload_size)
+        if not max_concurrency or max_concurrency <= 1:
+            return [send(payload) for payload in payloads]
+        return _send_concurrently(send, payloads, max_concurrency)
+
+    def add_documents_raw_in_batches(
+        self,
+        str_documents: bytes,
+        max_payload_size: int,
+        primary_key: str | None = None,
+        content_type: str = "application/x-ndjson",
+        csv_delimiter: str | None = None,
+        *,
+        skip_creation: bool | None = None,
+        metadata: str | None = None,
+    ) -> list[TaskInfo]:
+        """Add documents from a byte-encoded NDJSON or CSV string in batches bounded by size.
+
+        The string is split on record boundaries without being decoded. Each CSV batch starts
+        with the header line.
+
+        Parameters
+        ----------
+        str_documents:
+            Byte-encoded NDJSON or CSV string.
+        max_payload_size:
+            Maximum size in bytes of each batch. A record larger than this size is sent on its own.
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up.
+        content_type (optional):
+            The content MIME type: 'application/x-ndjson' or 'text/csv'. Default = 'application/x-ndjson'
+        csv_delimiter (optional):
+            One ASCII character used to customize the delimiter for CSV.
+            Note: The csv delimiter can only be used with the Content-Type text/csv.
+        skip_creation (optional):
+            If True, documents that don't exist in the index are silently ignored rather
+            than created. If False or None (default), existing behavior is preserved.
+        metadata (optional):
+            Custom metadata string to attach to the task.
+
+        Returns
+        -------
+        tasks_info:
+            List of TaskInfo instances containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        ValueError
+            If content_type is neither 'application/x-ndjson' nor 'text/csv'.
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return [
+            self.add_documents_raw(
+                payload,
+                primary_key,
+                content_type,
+                csv_delimiter,
+                skip_creation=skip_creation,
+                metadata=metadata,
+            )
+            for payload in _split_raw_documents(str_documents, content_type, max_payload_size)
+        ]
+
+    def add_documents_stream(
+        self,
+        documents: Iterable[Mapping[str, Any]],
+        primary_key: str | None = None,
+        *,
+        max_payload_size: int = 10_485_760,
+        serializer: type[JSONEncoder] | None = None,
+        skip_creation: bool | None = None,
+        metadata: str | None = None,
+    ) -> Generator[TaskInfo, None, None]:
+        """Add documents from any iterable, such as a generator or a database cursor.
+
+        Documents are consumed lazily and encoded as NDJSON into payloads of at most
+        max_payload_size bytes, so memory use does not depend on the size of the dataset.
+        Each payload is sent as soon as it is full.
+
+        Parameters
+        ----------
+        documents:
+            Iterable of documents. Each document should be a dictionary.
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up.
+        max_payload_size (optional):
+            Maximum size in bytes of each payload. A document larger than this size is sent on
+            its own. Default = 10485760 (10 MiB)
+        serializer (optional):
+            A custom JSONEncode to handle serializing fields that the build in json.dumps
+            cannot handle, for example UUID and datetime.
+        skip_creation (optional):
+            If True, documents that don't exist in the index are silently ignored rather
+            than created. If False or None (default), existing behavior is preserved.
+        metadata (optional):
+            Custom metadata string to attach to the task.
+
+        Returns
+        -------
+        tasks_info:
+            Generator yielding a TaskInfo for each payload as soon as it is enqueued.
+            Nothing is sent until the generator is iterated.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        packer = _RecordPacker(max_payload_size)
+        for document in documents:
+            payload = packer.add(
+                _encode_ndjson_record(document, serializer, self.config.json_codec)
+            )
+            if payload is not None:
+                yield self.add_documents_ndjson(
+                    payload, primary_key, skip_creation=skip_creation, metadata=metadata
+                )
+        payload = packer.flush()
+        if payload is not None:
+            yield self.add_documents_ndjson(
+                payload, primary_key, skip_creation=skip_creation, metadata=metadata
+            )
+
     def update_documents(
         self,
         documents: Sequence[Mapping[str, Any]],
@@ -844,7 +1377,7 @@ class Index:
 
     def update_documents_ndjson(
         self,
-        str_documents: str,
+        str_documents: str | bytes,
         primary_key: str | None = None,
         *,
         skip_creation: bool | None = None,
@@ -976,7 +1509,7 @@ class Index:
 
     def update_documents_raw(
         self,
-        str_documents: str,
+        str_documents: str | bytes,
         primary_key: str | None = None,
         content_type: str | None = None,
         csv_delimiter: str | None = None,
@@ -1027,6 +1560,256 @@ class Index:
         response = self.http.put(url, str_documents, content_type, serializer=serializer)
         return TaskInfo(**response)
 
+    def update_documents_from_file(
+        self,
+        path: str | PathLike[str],
+        primary_key: str | None = None,
+        content_type: str | None = None,
+        csv_delimiter: str | None = None,
+        *,
+        skip_creation: bool | None = None,
+        metadata: str | None = None,
+    ) -> TaskInfo:
+        """Update documents from a JSON, NDJSON or CSV file.
+
+        The file is streamed to Meilisearch in blocks with its Content-Length, it is never read
+        into memory as a whole.
+
+        Parameters
+        ----------
+        path:
+            Path of the file.
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up.
+        content_type (optional):
+            The content MIME type: 'application/json', 'application/x-ndjson', or 'text/csv'.
+            Default = None (guessed from the file extension: .json, .ndjson, .jsonl or .csv).
+        csv_delimiter (optional):
+            One ASCII character used to customize the delimiter for CSV.
+            Note: The csv delimiter can only be used with the Content-Type text/csv.
+        skip_creation (optional):
+            If True, documents that don't exist in the index are silently ignored rather
+            than created. If False or None (default), existing behavior is preserved.
+        metadata (optional):
+            Custom metadata string to attach to the task.
+
+        Returns
+        -------
+        task_info:
+            TaskInfo instance containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        ValueError
+            If content_type is not given and cannot be guessed from the file extension.
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        url = self._build_url(
+            primary_key=primary_key,
+            csv_delimiter=csv_delimiter,
+            skip_creation=skip_creation,
+            metadata=metadata,
+        )
+        content_type = content_type or _guess_content_type(path)
+        with open(path, "rb") as document_file:
+            response = self.http.put(url, document_file, content_type)
+        return TaskInfo(**response)
+
+    def update_documents_from_file_in_batches(
+        self,
+        path: str | PathLike[str],
+        max_payload_size: int,
+        primary_key: str | None = None,
+        content_type: str | None = None,
+        csv_delimiter: str | None = None,
+        *,
+        max_concurrency: int | None = None,
+        skip_creation: bool | None = None,
+        metadata: str | None = None,
+    ) -> list[TaskInfo]:
+        """Update documents from an NDJSON or CSV file too big for a single payload.
+
+        The file is memory-mapped and cut into byte ranges of at most max_payload_size bytes
+        that end on record boundaries, taking quoted CSV fields into account. Each CSV batch
+        starts with the header line. Records are never decoded.
+
+        Parameters
+        ----------
+        path:
+            Path of the file.
+        max_payload_size:
+            Maximum size in bytes of each batch. A record larger than this size is sent on its own.
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up.
+        content_type (optional):
+            The content MIME type: 'application/x-ndjson' or 'text/csv'.
+            Default = None (guessed from the file extension: .ndjson, .jsonl or .csv).
+        csv_delimiter (optional):
+            One ASCII character used to customize the delimiter for CSV.
+            Note: The csv delimiter can only be used with the Content-Type text/csv.
+        max_concurrency (optional):
+            Maximum number of batches sent at the same time from a thread pool. Batches may then
+            be enqueued out of order, so keep the default if the file writes the same document
+            more than once. Default = None (batches are sent one after another).
+        skip_creation (optional):
+            If True, documents that don't exist in the index are silently ignored rather
+            than created. If False or None (default), existing behavior is preserved.
+        metadata (optional):
+            Custom metadata string to attach to the task.
+
+        Returns
+        -------
+        tasks_info:
+            List of TaskInfo instances containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        ValueError
+            If the content type is neither 'application/x-ndjson' nor 'text/csv'.
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        content_type = content_type or _guess_content_type(path)
+
+        def send(payload: bytes) -> TaskInfo:
+            return self.update_documents_raw(
+                payload,
+                primary_key,
+                content_type,
+                csv_delimiter,
+                skip_creation=skip_creation,
+                metadata=metadata,
+            )
+
+        payloads = _split_file(path, content_type, max_payload_size)
+        if not max_concurrency or max_concurrency <= 1:
+            return [send(payload) for payload in payloads]
+        return _send_concurrently(send, payloads, max_concurrency)
+
+    def update_documents_raw_in_batches(
+        self,
+        str_documents: bytes,
+        max_payload_size: int,
+        primary_key: str | None = None,
+        content_type: str = "application/x-ndjson",
+        csv_delimiter: str | None = None,
+        *,
+        skip_creation: bool | None = None,
+        metadata: str | None = None,
+    ) -> list[TaskInfo]:
+        """Update documents from a byte-encoded NDJSON or CSV string in batches bounded by size.
+
+        The string is split on record boundaries without being decoded. Each CSV batch starts
+        with the header line.
+
+        Parameters
+        ----------
+        str_documents:
+            Byte-encoded NDJSON or CSV string.
+        max_payload_size:
+            Maximum size in bytes of each batch. A record larger than this size is sent on its own.
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up.
+        content_type (optional):
+            The content MIME type: 'application/x-ndjson' or 'text/csv'. Default = 'application/x-ndjson'
+        csv_delimiter (optional):
+            One ASCII character used to customize the delimiter for CSV.
+            Note: The csv delimiter can only be used with the Content-Type text/csv.
+        skip_creation (optional):
+            If True, documents that don't exist in the index are silently ignored rather
+            than created. If False or None (default), existing behavior is preserved.
+        metadata (optional):
+            Custom metadata string to attach to the task.
+
+        Returns
+        -------
+        tasks_info:
+            List of TaskInfo instances containing information about a task to track the progress of an asynchronous process.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        ValueError
+            If content_type is neither 'application/x-ndjson' nor 'text/csv'.
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        return [
+            self.update_documents_raw(
+                payload,
+                primary_key,
+                content_type,
+                csv_delimiter,
+                skip_creation=skip_creation,
+                metadata=metadata,
+            )
+            for payload in _split_raw_documents(str_documents, content_type, max_payload_size)
+        ]
+
+    def update_documents_stream(
+        self,
+        documents: Iterable[Mapping[str, Any]],
+        primary_key: str | None = None,
+        *,
+        max_payload_size: int = 10_485_760,
+        serializer: type[JSONEncoder] | None = None,
+        skip_creation: bool | None = None,
+        metadata: str | None = None,
+    ) -> Generator[TaskInfo, None, None]:
+        """Update documents from any iterable, such as a generator or a database cursor.
+
+        Documents are consumed lazily and encoded as NDJSON into payloads of at most
+        max_payload_size bytes, so memory use does not depend on the size of the dataset.
+        Each payload is sent as soon as it is full.
+
+        Parameters
+        ----------
+        documents:
+            Iterable of documents. Each document should be a dictionary.
+        primary_key (optional):
+            The primary-key used in index. Ignored if already set up.
+        max_payload_size (optional):
+            Maximum size in bytes of each payload. A document larger than this size is sent on
+            its own. Default = 10485760 (10 MiB)
+        serializer (optional):
+            A custom JSONEncode to handle serializing fields that the build in json.dumps
+            cannot handle, for example UUID and datetime.
+        skip_creation (optional):
+            If True, documents that don't exist in the index are silently ignored rather
+            than created. If False or None (default), existing behavior is preserved.
+        metadata (optional):
+            Custom metadata string to attach to the task.
+
+        Returns
+        -------
+        tasks_info:
+            Generator yielding a TaskInfo for each payload as soon as it is enqueued.
+            Nothing is sent until the generator is iterated.
+            https://www.meilisearch.com/docs/reference/api/tasks#get-one-task
+
+        Raises
+        ------
+        MeilisearchApiError
+            An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
+        """
+        packer = _RecordPacker(max_payload_size)
+        for document in documents:
+            payload = packer.add(
+                _encode_ndjson_record(document, serializer, self.config.json_codec)
+            )
+            if payload is not None:
+                yield self.update_documents_ndjson(
+                    payload, primary_key, skip_creation=skip_creation, metadata=metadata
+                )
+        payload = packer.flush()
+        if payload is not None:
+            yield self.update_documents_ndjson(
+                payload, primary_key, skip_creation=skip_creation, metadata=metadata
+            )
+
     def update_documents_in_batches(
         self,
         documents: Sequence[Mapping[str, Any]],
@@ -1036,6 +1819,8 @@ class Index:
         serializer: type[JSONEncoder] | None = None,
         skip_creation: bool | None = None,
         metadata: str | None = None,
+        max_concurrency: int | None = None,
+        max_payload_size: int | None = None,
     ) -> list[TaskInfo]:
         """Update documents to the index in batches.
 
@@ -1055,6 +1840,16 @@ class Index:
             than created. If False or None (default), existing behavior is preserved.
         metadata (optional):
             Custom metadata string to attach to the task.
+        max_concurrency (optional):
+            Maximum number of batches serialized and sent at the same time from a thread pool.
+            Batches sharing a primary key value are still enqueued in submission order. When
+            primary_key is not given and the index has none yet, batches are sent one after
+            another. Default = None (batches are sent one after another).
+        max_payload_size (optional):
+            Maximum size in bytes of the JSON payload of each batch. Each document is serialized
+            once and packed into the current batch until the payload would exceed this size or
+            hold batch_size documents. A document larger than this size is sent on its own.
+            Default = None (batches are only limited by batch_size).
 
         Returns
         -------
@@ -1069,19 +1864,32 @@ class Index:
             Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
         """
 
-        tasks = []
-
-        for document_batch in self._batch(documents, batch_size):
-            update_task = self.update_documents(
+        def send(document_batch: Sequence[Mapping[str, Any]], payload: bytes | None) -> TaskInfo:
+            if payload is not None:
+                return self.update_documents_raw(
+                    payload,
+                    primary_key,
+                    "application/json",
+                    skip_creation=skip_creation,
+                    metadata=metadata,
+                )
+            return self.update_documents(
                 document_batch,
                 primary_key,
                 serializer=serializer,
                 skip_creation=skip_creation,
                 metadata=metadata,
             )
-            tasks.append(update_task)
 
-        return tasks
+        return self._send_batches(
+            send,
+            documents,
+            batch_size,
+            primary_key,
+            max_concurrency=max_concurrency,
+            max_payload_size=max_payload_size,
+            serializer=serializer,
+        )
 
     def delete_document(self, document_id: str | int, *, metadata: str | None = None) -> TaskInfo:
         """Delete one document from the index.
@@ -1210,25 +2018,7 @@ class Index:
             f"{self.config.paths.index}/{self.uid}/{self.config.paths.setting}"
         )
 
-        if settings.get("embedders"):
-            embedders: dict[str, EmbedderType] = {}
-            for k, v in settings["embedders"].items():
-                if v.get("source") == "openAi":
-                    embedders[k] = OpenAiEmbedder(**v)
-                elif v.get("source") == "ollama":
-                    embedders[k] = OllamaEmbedder(**v)
-                elif v.get("source") == "huggingFace":
-                    embedders[k] = HuggingFaceEmbedder(**v)
-                elif v.get("source") == "rest":
-                    embedders[k] = RestEmbedder(**v)
-                elif v.get("source") == "composite":
-                    embedders[k] = CompositeEmbedder(**v)
-                else:
-                    embedders[k] = UserProvidedEmbedder(**v)
-
-            settings["embedders"] = embedders
-
-        return settings
+        return _parse_settings(settings)
 
     def update_settings(
         self, body: MutableMapping[str, Any], *, metadata: str | None = None
@@ -2291,26 +3081,7 @@ class Index:
         if not response:
             return None
 
-        embedders: dict[str, EmbedderType] = {}
-        for k, v in response.items():
-            source = v.get("source")
-            if source == "openAi":
-                embedders[k] = OpenAiEmbedder(**v)
-            elif source == "huggingFace":
-                embedders[k] = HuggingFaceEmbedder(**v)
-            elif source == "ollama":
-                embedders[k] = OllamaEmbedder(**v)
-            elif source == "rest":
-                embedders[k] = RestEmbedder(**v)
-            elif source == "composite":
-                embedders[k] = CompositeEmbedder(**v)
-            elif source == "userProvided":
-                embedders[k] = UserProvidedEmbedder(**v)
-            else:
-                # Default to UserProvidedEmbedder for unknown sources
-                embedders[k] = UserProvidedEmbedder(**v)
-
-        return Embedders(embedders=embedders)
+        return Embedders(embedders={k: _parse_embedder(v) for k, v in response.items()})
 
     def update_embedders(self, body: MutableMapping[str, Any] | None) -> TaskInfo:
         """Update embedders of the index.
@@ -2336,26 +3107,7 @@ class Index:
             Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
         """
         if body is not None and body.get("embedders"):
-            embedders: dict[str, EmbedderType] = {}
-            for k, v in body["embedders"].items():
-                source = v.get("source")
-                if source == "openAi":
-                    embedders[k] = OpenAiEmbedder(**v)
-                elif source == "huggingFace":
-                    embedders[k] = HuggingFaceEmbedder(**v)
-                elif source == "ollama":
-                    embedders[k] = OllamaEmbedder(**v)
-                elif source == "rest":
-                    embedders[k] = RestEmbedder(**v)
-                elif source == "composite":
-                    embedders[k] = CompositeEmbedder(**v)
-                elif source == "userProvided":
-                    embedders[k] = UserProvidedEmbedder(**v)
-                else:
-                    # Default to UserProvidedEmbedder for unknown sources
-                    embedders[k] = UserProvidedEmbedder(**v)
-
-            body = {"embedders": {k: v.model_dump(by_alias=True) for k, v in embedders.items()}}
+            body = _serialize_embedders(body["embedders"])
 
         task = self.http.patch(self.__settings_url_for(self.config.paths.embedders), body)
 
@@ -2681,6 +3433,47 @@ class Index:
 
         return FieldsResults(response)
 
+    def _send_batches(
+        self,
+        send: Callable[[Sequence[Mapping[str, Any]], bytes | None], TaskInfo],
+        documents: Sequence[Mapping[str, Any]],
+        batch_size: int,
+        primary_key: str | None = None,
+        *,
+        max_concurrency: int | None = None,
+        max_payload_size: int | None = None,
+        serializer: type[JSONEncoder] | None = None,
+    ) -> list[TaskInfo]:
+        batches: Iterable[tuple[Sequence[Mapping[str, Any]], bytes | None]]
+        if max_payload_size is None:
+            batches = ((batch, None) for batch in self._batch(documents, batch_size))
+        else:
+            batches = _pack_documents(
+                documents, batch_size, max_payload_size, serializer, self.config.json_codec
+            )
+
+        if not max_concurrency or max_concurrency <= 1:
+            return [send(document_batch, payload) for document_batch, payload in batches]
+
+        # Batches are only ordered by the primary key the index really uses, so they are sent
+        # one after another when it is not known yet.
+        key = primary_key or self._known_primary_key()
+        if key is None:
+            return [send(document_batch, payload) for document_batch, payload in batches]
+
+        return _send_concurrently(
+            lambda batch: send(*batch),
+            batches,
+            max_concurrency,
+            keys=lambda batch: {doc[key] for doc in batch[0] if key in doc},
+        )
+
+    def _known_primary_key(self) -> str | None:
+        try:
+            return self.get_primary_key()
+        except MeilisearchApiError:
+            return None
+
     @staticmethod
     def _batch(
         documents: Sequence[Mapping[str, Any]], batch_size: int
@@ -2699,18 +3492,9 @@ class Index:
         skip_creation: bool | None = None,
         metadata: str | None = None,
     ) -> str:
-        parameters = {}
-        if primary_key:
-            parameters["primaryKey"] = primary_key
-        if csv_delimiter:
-            parameters["csvDelimiter"] = csv_delimiter
-        if skip_creation is True:
-            parameters["skipCreation"] = "true"
-        if metadata is not None:
-            parameters["customMetadata"] = metadata
-        if not parameters:
-            return f"{self.config.paths.index}/{self.uid}/{self.config.paths.document}"
-        return f"{self.config.paths.index}/{self.uid}/{self.config.paths.document}?{parse.urlencode(parameters)}"
+        return _build_documents_url(
+            self.config, self.uid, primary_key, csv_delimiter, skip_creation, metadata
+        )
 
     def compact(self) -> TaskInfo:
         """
@@ -2725,3 +3509,363 @@ class Index:
         path = f"{self.config.paths.index}/{self.uid}/compact"
         task = self.http.post(path)
         return TaskInfo(**task)
+
+
+def _parse_settings(settings: dict[str, Any]) -> dict[str, Any]:
+    if settings.get("embedders"):
+        settings["embedders"] = {k: _parse_embedder(v) for k, v in settings["embedders"].items()}
+
+    return settings
+
+
+def _parse_embedder(embedder: Mapping[str, Any]) -> EmbedderType:
+    source = embedder.get("source")
+    if source == "openAi":
+        return OpenAiEmbedder(**embedder)
+    if source == "huggingFace":
+        return HuggingFaceEmbedder(**embedder)
+    if source == "ollama":
+        return OllamaEmbedder(**embedder)
+    if source == "rest":
+        return RestEmbedder(**embedder)
+    if source == "composite":
+        return CompositeEmbedder(**embedder)
+    # Default to UserProvidedEmbedder for userProvided and unknown sources
+    return UserProvidedEmbedder(**embedder)
+
+
+def _serialize_embedders(embedders: Mapping[str, Mapping[str, Any]]) -> dict[str, Any]:
+    return {
+        "embedders": {k: _parse_embedder(v).model_dump(by_alias=True) for k, v in embedders.items()}
+    }
+
+
+def _build_documents_url(
+    config: Config,
+    uid: str,
+    primary_key: str | None = None,
+    csv_delimiter: str | None = None,
+    skip_creation: bool | None = None,
+    metadata: str | None = None,
+) -> str:
+    parameters = {}
+    if primary_key:
+        parameters["primaryKey"] = primary_key
+    if csv_delimiter:
+        parameters["csvDelimiter"] = csv_delimiter
+    if skip_creation is True:
+        parameters["skipCreation"] = "true"
+    if metadata is not None:
+        parameters["customMetadata"] = metadata
+    if not parameters:
+        return f"{config.paths.index}/{uid}/{config.paths.document}"
+    return f"{config.paths.index}/{uid}/{config.paths.document}?{parse.urlencode(parameters)}"
+
+
+_FILE_CONTENT_TYPES = {
+    ".csv": "text/csv",
+    ".json": "application/json",
+    ".jsonl": "application/x-ndjson",
+    ".ndjson": "application/x-ndjson",
+}
+
+
+def _guess_content_type(path: str | PathLike[str]) -> str:
+    suffix = Path(path).suffix.lower()
+    if suffix not in _FILE_CONTENT_TYPES:
+        raise ValueError(
+            f"Cannot guess the content type of {str(path)!r}, pass one of "
+            f"{sorted(set(_FILE_CONTENT_TYPES.values()))} as content_type."
+        )
+    return _FILE_CONTENT_TYPES[suffix]
+
+
+def _send_concurrently(
+    send: Callable[[_T], TaskInfo],
+    batches: Iterable[_T],
+    max_concurrency: int,
+    keys: Callable[[_T], set[Any]] | None = None,
+) -> list[TaskInfo]:
+    # Sends batches from a thread pool with at most max_concurrency of them in flight and
+    # returns the results in submission order. No new batch is submitted after a failure.
+    #
+    # Meilisearch applies tasks in the order they are enqueued, so when keys is given a batch
+    # sharing a key with an earlier batch is only sent once that earlier batch is enqueued.
+    pending: list[tuple[Future[TaskInfo], set[Any]]] = []
+    in_flight = BoundedSemaphore(max_concurrency)
+    failed = Event()
+    futures: list[Future[TaskInfo]] = []
+
+    def run(batch: _T, dependencies: set[Future[TaskInfo]]) -> TaskInfo:
+        for dependency in dependencies:
+            dependency.result()
+        return send(batch)
+
+    def on_done(future: Future[TaskInfo]) -> None:
+        if future.exception() is not None:
+            failed.set()
+        in_flight.release()
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        for batch in batches:
+            in_flight.acquire()  # pylint: disable=consider-using-with
+            if failed.is_set():
+                in_flight.release()
+                break
+
+            batch_keys = keys(batch) if keys is not None else set()
+            pending = [(f, f_keys) for f, f_keys in pending if not f.done()]
+            dependencies = {f for f, f_keys in pending if not batch_keys.isdisjoint(f_keys)}
+            future = executor.submit(run, batch, dependencies)
+            future.add_done_callback(on_done)
+            futures.append(future)
+            pending.append((future, batch_keys))
+
+    return [future.result() for future in futures]
+
+
+def _search_pages(
+    opt_params: Mapping[str, Any] | None, page_size: int
+) -> tuple[dict[str, Any], int, int | None]:
+    # Splits the parameters of a paginated search into the other parameters, the offset of the
+    # first hit and the offset where the iteration ends, None to go through every hit.
+    if page_size < 1:
+        raise ValueError("The page size should be at least 1.")
+    params = dict(opt_params or {})
+    if "page" in params or "hitsPerPage" in params:
+        raise ValueError("iter_search pages with offset and limit, not page and hitsPerPage.")
+    offset = params.pop("offset", None) or 0
+    limit = params.pop("limit", None)
+    return params, offset, offset + limit if limit is not None else None
+
+
+def _documents_pages(
+    fields: Sequence[str] | None, filter: str | list[str | list[str]] | None, page_size: int
+) -> dict[str, Any]:
+    # Returns the parameters of the requests fetching the documents of the index page by page.
+    if page_size < 1:
+        raise ValueError("The page size should be at least 1.")
+    parameters: dict[str, Any] = {}
+    if fields is not None:
+        parameters["fields"] = list(fields)
+    if filter is not None:
+        parameters["filter"] = filter
+    return parameters
+
+
+def _page_limit(offset: int, page_size: int, end: int | None) -> int:
+    return page_size if end is None else min(page_size, end - offset)
+
+
+def _next_page(
+    page: tuple[int, int], count: int, total: int | None, end: int | None
+) -> tuple[int, int] | None:
+    # Returns the offset and limit of the page following one of count items, None after the
+    # last one.
+    offset, limit = page
+    offset += count
+    if (
+        count < limit
+        or (total is not None and offset >= total)
+        or (end is not None and offset >= end)
+    ):
+        return None
+    return offset, _page_limit(offset, limit, end)
+
+
+def _iter_pages(
+    fetch_page: Callable[[tuple[int, int]], tuple[list[_T], tuple[int, int] | None]],
+    page: tuple[int, int],
+    prefetch: bool,
+) -> Iterator[_T]:
+    # Yields the items of the pages, fetch_page returning those of a page (offset and limit)
+    # along with the next page. The next page is fetched from a thread while the items of the
+    # current one are consumed.
+    if page[1] <= 0:
+        return
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        items, next_page = fetch_page(page)
+        while True:
+            pending = (
+                executor.submit(fetch_page, next_page)
+                if executor is not None and next_page is not None
+                else None
+            )
+            yield from items
+            if next_page is None:
+                return
+            items, next_page = pending.result() if pending is not None else fetch_page(next_page)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _pack_documents(
+    documents: Sequence[Mapping[str, Any]],
+    batch_size: int,
+    max_payload_size: int,
+    serializer: type[JSONEncoder] | None = None,
+    codec: JsonCodec | None = None,
+) -> Generator[tuple[Sequence[Mapping[str, Any]], bytes], None, None]:
+    # Yields each batch with its JSON array payload; every document is serialized exactly once.
+    start = 0
+    encoded: list[bytes] = []
+    size = 2  # The enclosing brackets.
+    for position, document in enumerate(documents):
+        item = _serialize_body(document, serializer, codec)
+        if encoded and (len(encoded) >= batch_size or size + len(item) + 1 > max_payload_size):
+            yield documents[start:position], b"[" + b",".join(encoded) + b"]"
+            start, encoded, size = position, [], 2
+        size += len(item) + (1 if encoded else 0)
+        encoded.append(item)
+    if encoded:
+        yield documents[start:], b"[" + b",".join(encoded) + b"]"
+
+
+def _split_raw_documents(
+    str_documents: bytes, content_type: str, max_payload_size: int
+) -> Generator[bytes, None, None]:
+    if content_type == "application/x-ndjson":
+        records = _iter_records(str_documents, quoted=False)
+        header = b""
+    elif content_type == "text/csv":
+        records = _iter_records(str_documents, quoted=True)
+        header = next(records, b"")
+    else:
+        raise ValueError(
+            f"Cannot split {content_type!r} documents, use 'application/x-ndjson' or 'text/csv'."
+        )
+
+    packer = _RecordPacker(max_payload_size, header)
+    for record in records:
+        payload = packer.add(record)
+        if payload is not None:
+            yield payload
+    payload = packer.flush()
+    if payload is not None:
+        yield payload
+
+
+def _iter_records(data: bytes, *, quoted: bool) -> Generator[bytes, None, None]:
+    start = 0
+    for end in _record_ends(data, 0, quoted=quoted):
+        record = data[start:end]
+        start = end
+        if record.strip():
+            yield record if record.endswith(b"\n") else record + b"\n"
+
+
+def _split_file(
+    path: str | PathLike[str], content_type: str, max_payload_size: int
+) -> Generator[bytes, None, None]:
+    if content_type not in ("application/x-ndjson", "text/csv"):
+        raise ValueError(
+            f"Cannot split {content_type!r} documents, use 'application/x-ndjson' or 'text/csv'."
+        )
+
+    with open(path, "rb") as document_file:
+        if fstat(document_file.fileno()).st_size == 0:
+            return
+        with mmap(document_file.fileno(), 0, access=ACCESS_READ) as data:
+            quoted = content_type == "text/csv"
+            header = b""
+            if quoted:
+                header = data[: next(_record_ends(data, 0, quoted=True), len(data))]
+                if not header.endswith(b"\n"):
+                    header += b"\n"
+
+            # As in _split_raw_documents, records that do not fit are sent on their own.
+            budget = max(1, max_payload_size - len(header))
+            for start, end in _file_ranges(data, len(header), budget, quoted=quoted):
+                chunk = data[start:end]
+                if not chunk.isspace():
+                    yield header + chunk
+
+
+def _file_ranges(
+    data: mmap, start: int, budget: int, *, quoted: bool
+) -> Generator[tuple[int, int], None, None]:
+    size = len(data)
+    if quoted and data.find(b'"', start) != -1:
+        # A newline may be part of a quoted field, so records have to be walked one by one.
+        chunk_start = last_end = start
+        for end in _record_ends(data, start, quoted=True):
+            if end - chunk_start > budget and last_end > chunk_start:
+                yield chunk_start, last_end
+                chunk_start = last_end
+            last_end = end
+        if last_end > chunk_start:
+            yield chunk_start, last_end
+        return
+
+    # Every newline ends a record: cut at the last one that fits in the budget.
+    position = start
+    while position < size:
+        if position + budget >= size:
+            end = size
+        else:
+            cut = data.rfind(b"\n", position, position + budget)
+            if cut == -1:
+                # A record larger than the budget is sent on its own.
+                cut = data.find(b"\n", max(position, position + budget))
+            end = size if cut == -1 else cut + 1
+        yield position, end
+        position = end
+
+
+def _record_ends(data: bytes | mmap, start: int, *, quoted: bool) -> Generator[int, None, None]:
+    # Yields the offset after each record. A CSV record only ends on a newline outside of a
+    # quoted field, which may span lines.
+    size = len(data)
+    position = start
+    in_quotes = False
+    while position < size:
+        newline = data.find(b"\n", position)
+        end = size if newline == -1 else newline + 1
+        if quoted and data[position:end].count(b'"') % 2:
+            in_quotes = not in_quotes
+        if not in_quotes:
+            yield end
+        position = end
+    if in_quotes:
+        yield size
+
+
+def _encode_ndjson_record(
+    document: Mapping[str, Any],
+    serializer: type[JSONEncoder] | None = None,
+    codec: JsonCodec | None = None,
+) -> bytes:
+    return _serialize_body(document, serializer, codec) + b"\n"
+
+
+class _RecordPacker:
+    """Packs encoded records into payloads of at most max_payload_size bytes.
+
+    Only the records of the payload being filled are held in memory. A record larger than
+    max_payload_size gets a payload of its own.
+    """
+
+    def __init__(self, max_payload_size: int, header: bytes = b"") -> None:
+        self.max_payload_size = max_payload_size
+        self.header = header
+        self._records: list[bytes] = []
+        self._size = len(header)
+
+    def add(self, record: bytes) -> bytes | None:
+        """Add a record, returning the previous payload if the record does not fit in it."""
+        payload = None
+        if self._records and self._size + len(record) > self.max_payload_size:
+            payload = self.flush()
+        self._records.append(record)
+        self._size += len(record)
+        return payload
+
+    def flush(self) -> bytes | None:
+        """Return the payload being filled, if any, and start a new one."""
+        if not self._records:
+            return None
+        payload = self.header + b"".join(self._records)
+        self._records, self._size = [], len(self.header)
+        return payload
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    _HAS_ORJSON = False
+else:
+    _HAS_ORJSON = True
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    _HAS_MSGSPEC = False
+else:
+    _HAS_MSGSPEC = True
+
+
+class JsonCodec:
+    """Encode request bodies to JSON bytes and decode JSON response bodies.
+
+    This default implementation uses the standard library. Subclass it and override `encode`
+    and `decode` to plug in another JSON library.
+
+    Datetimes, dates and times are encoded in ISO 8601, UUIDs and Decimals as strings, so no
+    custom JSONEncoder is needed for them.
+    """
+
+    name = "stdlib"
+
+    def encode(self, obj: Any) -> bytes:
+        return json.dumps(obj, default=_default, ensure_ascii=False).encode("utf-8")
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec backed by orjson (`pip install orjson`)."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if not _HAS_ORJSON:
+            raise ImportError("The orjson codec requires orjson: `pip install orjson`.")
+
+    def encode(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+    def decode(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """JSON codec backed by msgspec (`pip install msgspec`)."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        if not _HAS_MSGSPEC:
+            raise ImportError("The msgspec codec requires msgspec: `pip install msgspec`.")
+        self._encoder = msgspec.json.Encoder(enc_hook=_default)
+        self._decoder = msgspec.json.Decoder()
+
+    def encode(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def decode(self, data: bytes) -> Any:
+        return self._decoder.decode(data)
+
+
+def get_json_codec(codec: JsonCodec | str) -> JsonCodec:
+    """Return the codec for `codec`: a JsonCodec instance or one of 'stdlib', 'orjson', 'msgspec'
+    and 'auto'.
+
+    'auto' picks orjson, then msgspec, whichever is installed first, and falls back to the
+    standard library.
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec == "auto":
+        if _HAS_ORJSON:
+            return OrjsonCodec()
+        if _HAS_MSGSPEC:
+            return MsgspecCodec()
+        return JsonCodec()
+    codecs: dict[str, type[JsonCodec]] = {
+        "stdlib": JsonCodec,
+        "orjson": OrjsonCodec,
+        "msgspec": MsgspecCodec,
+    }
+    if codec not in codecs:
+        raise ValueError(
+            f"Unknown JSON codec {codec!r}, use a JsonCodec or one of {[*codecs, 'auto']}."
+        )
+    return codecs[codec]()
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, (UUID, Decimal)):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import random
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import requests
+
+if TYPE_CHECKING:
+    from meilisearch.config import Config
+
+STRATEGIES = ("least_outstanding", "ewma")
+
+# Seconds a health check waits for a node when no timeout is given.
+DEFAULT_PROBE_TIMEOUT = 2.0
+
+
+@dataclass
+class _Node:
+    url: str
+    healthy: bool = True
+    outstanding: int = 0
+    # Exponentially weighted moving average of the response time in seconds.
+    latency: float = 0.0
+    # Highest uid of a task known to have succeeded on the node.
+    applied_task_uid: int = -1
+
+
+class LoadBalancer:
+    """Spread read requests over several Meilisearch nodes serving the same data.
+
+    With the 'least_outstanding' strategy a request goes to the node with the fewest requests
+    in flight, with the 'ewma' strategy to the node whose average response time, weighted by
+    its requests in flight, is the lowest. Remaining ties are broken at random.
+
+    A background thread calls the `/health` route of every node each `health_check_interval`
+    seconds, all nodes at the same time. Nodes failing the check stop receiving requests until
+    they pass it again. If no node is healthy, requests are spread over all of them.
+
+    The first node is the primary, which receives all the writes. With `read_from_primary` set
+    to False it only serves reads when no other node is healthy.
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        strategy: str = "least_outstanding",
+        health_check_interval: float | None = 5.0,
+        *,
+        timeout: float | None = None,
+        probe: Callable[[str], bool] | None = None,
+        decay: float = 0.3,
+        read_from_primary: bool = True,
+        session: requests.Session | None = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        urls:
+            URLs of the Meilisearch nodes.
+        strategy (optional):
+            'least_outstanding' or 'ewma'. Default = 'least_outstanding'
+        health_check_interval (optional):
+            Seconds between two health checks of the nodes, None to never check them.
+            Default = 5.0
+        timeout (optional):
+            Timeout in seconds of a health check. Default = None (2 seconds)
+        probe (optional):
+            Called with the URL of a node to tell if it is healthy.
+            Default = None (a GET request on its /health route)
+        decay (optional):
+            Weight of the last response time in the moving average, between 0 and 1.
+            Default = 0.3
+        read_from_primary (optional):
+            If False, reads are sent to the other nodes while one of them is healthy.
+            Default = True
+        session (optional):
+            Pooled session the health checks are sent with. The Client gives its own.
+            Default = None (a session of the load balancer)
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(
+                f"Unknown load balancing strategy {strategy!r}, use one of {STRATEGIES}."
+            )
+        if not urls:
+            raise ValueError("At least one node URL is required.")
+
+        self.strategy = strategy
+        self.health_check_interval = health_check_interval
+        self.timeout = timeout if timeout is not None else DEFAULT_PROBE_TIMEOUT
+        self.session = session
+        self.probe = probe if probe is not None else self._is_healthy
+        self.decay = decay
+        self.read_from_primary = read_from_primary
+        self._nodes = {url: _Node(url) for url in urls}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._session: requests.Session | None = None
+
+    @property
+    def nodes(self) -> list[str]:
+        return list(self._nodes)
+
+    @property
+    def healthy_nodes(self) -> list[str]:
+        return [node.url for node in self._nodes.values() if node.healthy]
+
+    @property
+    def primary(self) -> str:
+        return next(iter(self._nodes))
+
+    def acquire(self) -> str:
+        """Return the URL of the node the next read request should be sent to.
+
+        Every call must be followed by a call to `release` once the response is received.
+        """
+        return self.claim(self.candidates()[0])
+
+    def candidates(self) -> list[str]:
+        """Return the URLs of the nodes that can serve the next read, the best one first."""
+        self._start()
+        with self._lock:
+            nodes = [node for node in self._nodes.values() if node.healthy]
+            replicas = [node for node in nodes if node.url != self.primary]
+            if not self.read_from_primary and replicas:
+                nodes = replicas
+            if not nodes:
+                nodes = list(self._nodes.values())
+            random.shuffle(nodes)
+            return [node.url for node in sorted(nodes, key=self._score)]
+
+    def claim(self, url: str) -> str:
+        """Count a read sent to `url` as in flight until `release` is called, and return `url`."""
+        with self._lock:
+            self._nodes[url].outstanding += 1
+        return url
+
+    def has_applied(self, url: str, task_uid: int) -> bool:
+        """Return True if the task `task_uid`, or a later one, is known to have succeeded on
+        `url`. Tasks are processed in order, so a node that ran a task also ran the ones before.
+        """
+        return self._nodes[url].applied_task_uid >= task_uid
+
+    def record_applied(self, url: str, task_uid: int) -> None:
+        """Record that the task `task_uid` succeeded on `url`."""
+        with self._lock:
+            node = self._nodes[url]
+            node.applied_task_uid = max(node.applied_task_uid, task_uid)
+
+    def release(self, url: str, elapsed: float | None = None) -> None:
+        """Record the end of a request sent to `url`, which took `elapsed` seconds if it got a
+        response."""
+        with self._lock:
+            node = self._nodes[url]
+            node.outstanding -= 1
+            if elapsed is not None:
+                node.latency = (
+                    elapsed
+                    if node.latency == 0
+                    else node.latency + self.decay * (elapsed - node.latency)
+                )
+
+    def check_health(self) -> None:
+        """Probe every node once, all at the same time, and update which ones receive
+        requests."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    len(self._nodes), thread_name_prefix="meilisearch-health-probe"
+                )
+        results = self._executor.map(self.probe, self._nodes)
+        for node, healthy in zip(self._nodes.values(), results, strict=True):
+            with self._lock:
+                node.healthy = healthy
+
+    def close(self) -> None:
+        """Stop the background health checks."""
+        self._stopped.set()
+        if self._thread is not None:
+            # A probe in flight ends within the timeout, and the thread is a daemon anyway.
+            self._thread.join(self.timeout + 1)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._session is not None:
+            self._session.close()
+
+    def _score(self, node: _Node) -> tuple[float, float]:
+        # Each strategy breaks its ties with the criterion of the other one.
+        if self.strategy == "ewma":
+            return node.latency * (node.outstanding + 1), node.outstanding
+        return node.outstanding, node.latency
+
+    def _start(self) -> None:
+        if self._thread is not None or self.health_check_interval is None:
+            return
+        with self._lock:
+            if self._thread is None and not self._stopped.is_set():
+                self._thread = threading.Thread(
+                    target=self._run,
+                    args=(self.health_check_interval,),
+                    name="meilisearch-health-check",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _run(self, interval: float) -> None:
+        while not self._stopped.wait(interval):
+            self.check_health()
+
+    def _is_healthy(self, url: str) -> bool:
+        session = self.session
+        if session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = requests.Session()
+                session = self._session
+        try:
+            return session.get(url + "/health", timeout=self.timeout).ok
+        except requests.exceptions.RequestException:
+            return False
+
+
+def is_balanced_read(config: Config, method: str, path: str) -> bool:
+    """Return True for the read requests spread over the nodes: searches and document reads."""
+    segments = path.split("?", 1)[0].strip("/").split("/")
+    paths = config.paths
+    # Matched by position, an index may be named like any route segment.
+    in_index = len(segments) >= 3 and segments[0] == paths.index
+    if method.upper() == "GET":
+        return in_index and segments[2] == paths.document
+    if method.upper() != "POST":
+        return False
+    if segments == [paths.multi_search]:
+        return True
+    return in_index and (
+        segments[2:] in ([paths.search], [paths.facet_search], [paths.document, "fetch"])
+    )
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RequestMetrics:
+    """Measurements of one HTTP request sent to Meilisearch.
+
+    Instances are passed to the `on_request_metrics` callback of the client after every request,
+    whether it succeeded or not.
+    """
+
+    method: str
+    path: str
+    status_code: int | None
+    elapsed: float
+    """Seconds spent sending the request and reading its response, retries included."""
+    content_encoding: str | None = None
+    """Content-Encoding of the request body, None when it was sent uncompressed."""
+    body_size: int | None = None
+    """Size in bytes of the request body before compression."""
+    sent_size: int | None = None
+    """Size in bytes of the request body as sent."""
+    attempts: int = 1
+    """Number of times the request was sent, more than 1 when it was retried."""
+
+    @property
+    def compression_ratio(self) -> float | None:
+        """Body size divided by sent size, None when the body was not compressed."""
+        if self.content_encoding is None or not self.body_size or not self.sent_size:
+            return None
+        return self.body_size / self.sent_size
@@ -17,6 +17,7 @@ class Task(CamelBase):
     details: dict[str, Any] | None = None
     error: dict[str, Any] | None = None
     canceled_by: int | None = None
+    batch_uid: int | None = None
     duration: str | None = None
     enqueued_at: datetime
     started_at: datetime | None = None
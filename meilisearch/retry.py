@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import random
+import threading
+from collections.abc import Collection, Mapping
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from meilisearch.config import Config
+
+
+class RetryBudget:
+    """Token bucket bounding the share of requests that can be retried.
+
+    Every failed attempt takes one token and every successful request gives back `token_ratio`
+    tokens, up to `max_tokens`. Retries are only allowed while more than half of the tokens are
+    left, so a failing Meilisearch sees at most a fraction of extra load from retries instead
+    of `max_attempts` times the load. One budget can be shared by several clients.
+    """
+
+    def __init__(self, max_tokens: float = 10.0, token_ratio: float = 0.1) -> None:
+        self.max_tokens = max_tokens
+        self.token_ratio = token_ratio
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.token_ratio)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._tokens = max(0.0, self._tokens - 1)
+
+    def can_retry(self) -> bool:
+        return self._tokens > self.max_tokens / 2
+
+
+class RetryPolicy:
+    """When and how long to wait before sending a failed request again.
+
+    Attempts are spaced with exponential backoff and full jitter: before attempt `n + 1` the
+    client sleeps a random time between 0 and `min(max_backoff, backoff_factor * 2 ** (n - 1))`
+    seconds. A `Retry-After` header on a retryable response is honoured instead when it is
+    longer; if it asks for more than `max_backoff` seconds the error is raised right away.
+
+    Only idempotent requests (GET requests and read-only POST routes such as searches) are
+    retried after a timeout, a lost connection or a retryable status. Other requests, like
+    document additions, are only retried when the connection could not be established, since
+    Meilisearch cannot have received them.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_factor: float = 0.1,
+        max_backoff: float = 10.0,
+        *,
+        retry_statuses: Collection[int] = (429, 502, 503, 504),
+        budget: RetryBudget | None = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        max_attempts (optional):
+            Maximum number of attempts for one request, the first one included. Default = 3
+        backoff_factor (optional):
+            Base of the exponential backoff in seconds. Default = 0.1
+        max_backoff (optional):
+            Upper bound in seconds of a single wait between two attempts. Default = 10.0
+        retry_statuses (optional):
+            HTTP statuses worth retrying for idempotent requests. Default = (429, 502, 503, 504)
+        budget (optional):
+            RetryBudget limiting retries when many requests fail. Default = None (no budget)
+        """
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.budget = budget
+
+    def backoff(self, attempt: int) -> float:
+        """Return a jittered wait in seconds after the failed attempt number `attempt`."""
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1)))
+
+    def next_delay(self, attempt: int, headers: Mapping[str, str] | None = None) -> float | None:
+        """Record the failure of attempt number `attempt` and return how long to wait before
+        the next one, or None if the request should not be retried."""
+        if self.budget is not None:
+            self.budget.record_failure()
+        if attempt >= self.max_attempts:
+            return None
+        if self.budget is not None and not self.budget.can_retry():
+            return None
+
+        delay = self.backoff(attempt)
+        retry_after = _parse_retry_after(headers.get("Retry-After")) if headers else None
+        if retry_after is not None:
+            if retry_after > self.max_backoff:
+                return None
+            delay = max(delay, retry_after)
+        return delay
+
+    def record_success(self) -> None:
+        if self.budget is not None:
+            self.budget.record_success()
+
+
+def is_idempotent(config: Config, method: str, path: str) -> bool:
+    """Return True if sending the request twice has the same effect as sending it once."""
+    method = method.upper()
+    if method in ("GET", "HEAD"):
+        return True
+    if method != "POST":
+        return False
+    segments = path.split("?", 1)[0].strip("/").split("/")
+    paths = config.paths
+    return segments[-1] in (
+        paths.search,
+        paths.multi_search,
+        paths.facet_search,
+        paths.similar,
+        paths.fields,
+    ) or segments[-2:] == [paths.document, "fetch"]
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
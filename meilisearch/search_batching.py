@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any
+
+from meilisearch.errors import MeilisearchApiError
+
+if TYPE_CHECKING:
+    from meilisearch.config import Config
+
+# Result of a search whose batch was rejected, so that it is sent on its own.
+_UNBATCHED = object()
+
+
+class SearchBatching:
+    """Send the searches made concurrently as one multi-search.
+
+    The first search waits `window` seconds for others to join it, or less when
+    `max_batch_size` searches joined, and all of them are then sent in a single multi-search
+    request. Every caller gets the result of its own search. Meilisearch rejects a whole
+    multi-search when one of its queries is invalid, so when that happens each search is sent
+    again on its own and only the invalid ones raise. A search alone in its window is sent as
+    is. Searches sent with `after_task_uid` are never batched.
+
+    `batches` counts the multi-searches sent and `batched` the searches they carried.
+    """
+
+    def __init__(self, window: float = 0.002, max_batch_size: int = 20) -> None:
+        """
+        Parameters
+        ----------
+        window (optional):
+            Seconds the first search of a batch waits for others. Default = 0.002
+        max_batch_size (optional):
+            Number of searches sent at most in one multi-search. Default = 20
+        """
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.batches = 0
+        self.batched = 0
+        self._lock = threading.Lock()
+
+    def record_batch(self, size: int) -> None:
+        with self._lock:
+            self.batches += 1
+            self.batched += size
+
+
+def batchable_query(config: Config, path: str, body: Any) -> dict[str, Any] | None:
+    """Return the multi-search query equivalent to a POST request, None if the request is not
+    the search of an index."""
+    segments = path.split("?", 1)[0].strip("/").split("/")
+    if (
+        len(segments) == 3
+        and segments[0] == config.paths.index
+        and segments[2] == config.paths.search
+        and isinstance(body, dict)
+    ):
+        return {**body, "indexUid": segments[1]}
+    return None
+
+
+def _split_results(response: Any, size: int) -> list[Any]:
+    results = response["results"][:size]
+    for result in results:
+        result.pop("indexUid", None)
+    # A search missing from the response is sent again rather than left waiting.
+    return results + [_UNBATCHED] * (size - len(results))
+
+
+class _Batch:
+    def __init__(self) -> None:
+        self.queries: list[dict[str, Any]] = []
+        self.futures: list[Future[Any]] = []
+        self.full = threading.Event()
+
+
+class SearchBatcher:
+    """Gather the searches of concurrent threads into multi-searches. The first search of a
+    batch sends it, the others wait for their result."""
+
+    def __init__(
+        self, batching: SearchBatching, send_batch: Callable[[list[dict[str, Any]]], Any]
+    ) -> None:
+        self.batching = batching
+        self.send_batch = send_batch
+        self._open: _Batch | None = None
+        self._lock = threading.Lock()
+
+    def search(self, query: dict[str, Any], send: Callable[[], Any]) -> Any:
+        """Return the result of `query`, sent with others or with `send` when it is alone."""
+        future: Future[Any] = Future()
+        with self._lock:
+            batch = self._open
+            leading = batch is None
+            if batch is None:
+                batch = self._open = _Batch()
+            batch.queries.append(query)
+            batch.futures.append(future)
+            if len(batch.queries) >= self.batching.max_batch_size:
+                self._open = None
+                batch.full.set()
+
+        if leading:
+            batch.full.wait(self.batching.window)
+            with self._lock:
+                if self._open is batch:
+                    self._open = None
+                alone = len(batch.queries) == 1
+            if alone:
+                return send()
+            self._send(batch)
+
+        result = future.result()
+        return send() if result is _UNBATCHED else result
+
+    def _send(self, batch: _Batch) -> None:
+        self.batching.record_batch(len(batch.queries))
+        try:
+            results = _split_results(self.send_batch(batch.queries), len(batch.queries))
+        except BaseException as err:
+            if not _rejects_a_query(err):
+                for future in batch.futures:
+                    future.set_exception(err)
+                return
+            results = [_UNBATCHED] * len(batch.futures)
+        for future, result in zip(batch.futures, results, strict=True):
+            future.set_result(result)
+
+
+class _AsyncBatch:
+    def __init__(self) -> None:
+        self.queries: list[dict[str, Any]] = []
+        self.futures: list[asyncio.Future[Any]] = []
+        self.full = asyncio.Event()
+
+
+class AsyncSearchBatcher:
+    """Asyncio counterpart of SearchBatcher. A batch is sent by its own task, so that it goes on
+    when the first caller is cancelled."""
+
+    def __init__(
+        self,
+        batching: SearchBatching,
+        send_batch: Callable[[list[dict[str, Any]]], Awaitable[Any]],
+    ) -> None:
+        self.batching = batching
+        self.send_batch = send_batch
+        self._open: _AsyncBatch | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def search(self, query: dict[str, Any], send: Callable[[], Awaitable[Any]]) -> Any:
+        """See SearchBatcher.search."""
+        batch = self._open
+        if batch is None:
+            batch = self._open = _AsyncBatch()
+            task = asyncio.ensure_future(self._flush(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        batch.queries.append(query)
+        batch.futures.append(future)
+        if len(batch.queries) >= self.batching.max_batch_size:
+            self._open = None
+            batch.full.set()
+
+        result = await future
+        return await send() if result is _UNBATCHED else result
+
+    async def _flush(self, batch: _AsyncBatch) -> None:
+        try:
+            await asyncio.wait_for(batch.full.wait(), self.batching.window)
+        except asyncio.TimeoutError:
+            pass
+        if self._open is batch:
+            self._open = None
+        if len(batch.queries) == 1:
+            _resolve(batch.futures, [_UNBATCHED])
+            return
+        self.batching.record_batch(len(batch.queries))
+        try:
+            results = _split_results(await self.send_batch(batch.queries), len(batch.queries))
+        except Exception as err:
+            if not _rejects_a_query(err):
+                for future in batch.futures:
+                    if not future.done():
+                        future.set_exception(err)
+                return
+            results = [_UNBATCHED] * len(batch.futures)
+        _resolve(batch.futures, results)
+
+
+def _rejects_a_query(err: BaseException) -> bool:
+    """Whether the batch failed because of one of its queries, that is sent on its own to get
+    its outcome, rather than because of Meilisearch, that would fail the queries alike."""
+    return isinstance(err, MeilisearchApiError) and err.type == "invalid_request"
+
+
+def _resolve(futures: list[asyncio.Future[Any]], results: list[Any]) -> None:
+    for future, result in zip(futures, results, strict=True):
+        if not future.done():
+            future.set_result(result)
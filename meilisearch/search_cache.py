@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Collection, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from meilisearch.config import Config
+    from meilisearch.models.task import Task
+
+# Types of the tasks that can change the results of a search on their index.
+INVALIDATING_TASK_TYPES = frozenset(
+    (
+        "documentAdditionOrUpdate",
+        "documentEdition",
+        "documentDeletion",
+        "settingsUpdate",
+        "indexDeletion",
+        "indexUpdate",
+    )
+)
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float
+    index_uids: frozenset[str]
+
+
+class SearchCache:
+    """Keep the responses of identical searches, facet searches and multi-searches.
+
+    A request is identified by its route and its body, serialized with sorted keys so that the
+    order of the search parameters does not matter. Responses are kept for `ttl` seconds, and
+    the least recently used one is evicted once `max_entries` are kept.
+
+    The entries of an index are dropped when the client sees a document, settings or index
+    task of that index succeed, whether by waiting for it, fetching it or through a webhook
+    notification, and every entry is dropped when an index swap succeeds. Searches sent with
+    `after_task_uid` bypass the cache.
+
+    `hits` and `misses` count the lookups answered from the cache and the ones sent to
+    Meilisearch.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        ttl: float | None = 60.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        max_entries (optional):
+            Number of responses kept. Default = 1000
+        ttl (optional):
+            Seconds a response is kept, None to keep it until it is evicted or invalidated.
+            Default = 60.0
+        clock (optional):
+            Monotonic clock returning seconds. Default = time.monotonic
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        # Highest uid of a task that invalidated each index, so that seeing it again does not.
+        self._applied: dict[str, int] = {}
+        self._swapped = -1
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        """Counter increased by every invalidation. A response is only stored if no
+        invalidation happened since the lookup that missed it."""
+        return self._generation
+
+    def get(self, key: str) -> Any | None:
+        """Return a copy of the response stored for `key`, None if there is none."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= self.clock():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(entry.value)
+
+    def put(self, key: str, index_uids: Collection[str], value: Any, generation: int) -> None:
+        """Store the response of a search on the indexes `index_uids`, unless the cache was
+        invalidated since `generation`."""
+        expires_at = self.clock() + self.ttl if self.ttl is not None else float("inf")
+        entry = _Entry(copy.deepcopy(value), expires_at, frozenset(index_uids))
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, index_uid: str | None = None) -> None:
+        """Drop the responses involving `index_uid`, or all of them."""
+        with self._lock:
+            self._generation += 1
+            if index_uid is None:
+                self._entries.clear()
+                return
+            for key in [
+                key for key, entry in self._entries.items() if index_uid in entry.index_uids
+            ]:
+                del self._entries[key]
+
+    def observe(self, *tasks: Task) -> None:
+        """Invalidate the indexes changed by the succeeded tasks among `tasks`."""
+        swapped = False
+        changed: set[str] = set()
+        with self._lock:
+            for task in tasks:
+                if task.status != "succeeded":
+                    continue
+                if task.type == "indexSwap" and task.uid > self._swapped:
+                    self._swapped = task.uid
+                    swapped = True
+                elif (
+                    task.type in INVALIDATING_TASK_TYPES
+                    and task.index_uid is not None
+                    and task.uid > self._applied.get(task.index_uid, -1)
+                ):
+                    self._applied[task.index_uid] = task.uid
+                    changed.add(task.index_uid)
+        if swapped:
+            self.invalidate()
+            return
+        for index_uid in changed:
+            self.invalidate(index_uid)
+
+
+def search_request_key(
+    config: Config, path: str, body: Any, headers: Mapping[str, str]
+) -> tuple[str, frozenset[str]] | None:
+    """Return the key identifying a POST request among identical ones and the indexes it
+    searches, None if the request is not a search, a facet search or a multi-search.
+
+    The key covers the URL and the headers sent, so clients sharing a cache with other
+    credentials, such as tenant tokens, never get the results of one another."""
+    segments = path.split("?", 1)[0].strip("/").split("/")
+    paths = config.paths
+    searches = (paths.search, paths.facet_search)
+    if len(segments) == 3 and segments[0] == paths.index and segments[2] in searches:
+        index_uids = frozenset((segments[1],))
+    elif segments == [paths.multi_search] and isinstance(body, dict):
+        index_uids = frozenset(
+            query["indexUid"] for query in body.get("queries", ()) if "indexUid" in query
+        )
+    else:
+        return None
+    try:
+        canonical = json.dumps(body, sort_keys=True, separators=(",", ":"), default=str)
+    except (TypeError, ValueError):
+        return None
+    sender = hashlib.sha256(json.dumps(sorted(headers.items())).encode()).hexdigest()
+    return f"{config.url} {sender} {'/'.join(segments)} {canonical}", index_uids
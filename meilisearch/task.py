@@ -1,14 +1,22 @@
 from __future__ import annotations
 
-from collections.abc import Mapping, MutableMapping
-from datetime import datetime
-from time import sleep
+import asyncio
+import threading
+from collections.abc import Collection, Generator, Iterable, Iterator, Mapping, MutableMapping
+from concurrent.futures import Future
+from time import monotonic, sleep
 from typing import Any
 from urllib import parse
 
 from meilisearch._httprequests import HttpRequests
+from meilisearch._polling import PollingSchedule, batch_percentage, is_transient
 from meilisearch.config import Config
-from meilisearch.errors import MeilisearchTimeoutError
+from meilisearch.errors import (
+    MeilisearchApiError,
+    MeilisearchError,
+    MeilisearchTaskFailedError,
+    MeilisearchTimeoutError,
+)
 from meilisearch.models.task import Batch, BatchResults, Task, TaskInfo, TaskResults
 
 
@@ -20,13 +28,19 @@ class TaskHandler:
     https://www.meilisearch.com/docs/reference/api/tasks
     """
 
-    def __init__(self, config: Config, custom_headers: Mapping[str, str] | None = None):
+    def __init__(
+        self,
+        config: Config,
+        custom_headers: Mapping[str, str] | None = None,
+        http: HttpRequests | None = None,
+    ):
         """Parameters
         ----------
             config: Config object containing permission and location of Meilisearch.
+            http (optional): HttpRequests instance to share, so that the connection pool is reused.
         """
         self.config = config
-        self.http = HttpRequests(config, custom_headers)
+        self.http = http if http is not None else HttpRequests(config, custom_headers)
 
     def get_batches(self, parameters: MutableMapping[str, Any] | None = None) -> BatchResults:
         """Get all task batches.
@@ -100,7 +114,10 @@ class TaskHandler:
             if isinstance(parameters[param], (list, tuple)):
                 parameters[param] = ",".join(parameters[param])
         tasks = self.http.get(f"{self.config.paths.task}?{parse.urlencode(parameters)}")
-        return TaskResults(**tasks)
+        results = TaskResults(**tasks)
+        if self.config.search_cache is not None:
+            self.config.search_cache.observe(*results.results)
+        return results
 
     def get_task(self, uid: int) -> Task:
         """Get one task.
@@ -121,7 +138,10 @@ class TaskHandler:
             An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
         """
         task = self.http.get(f"{self.config.paths.task}/{uid}")
-        return Task(**task)
+        fetched = Task(**task)
+        if self.config.search_cache is not None:
+            self.config.search_cache.observe(fetched)
+        return fetched
 
     def cancel_tasks(
         self, parameters: MutableMapping[str, Any], *, metadata: str | None = None
@@ -188,10 +208,16 @@ class TaskHandler:
         self,
         uid: int,
         timeout_in_ms: int = 5000,
-        interval_in_ms: int = 50,
+        interval_in_ms: int | None = None,
+        *,
+        max_interval_in_ms: int = 1000,
     ) -> Task:
         """Wait until the task fails or succeeds in Meilisearch.
 
+        Unless a fixed interval is given, the task is first polled after 10ms, then the interval
+        doubles after each request up to max_interval_in_ms. While the task is processing, the
+        progress of its batch is used to estimate when it will be done and poll then instead.
+
         Parameters
         ----------
         uid:
@@ -199,7 +225,10 @@ class TaskHandler:
         timeout_in_ms (optional):
             Time the method should wait before raising a MeilisearchTimeoutError.
         interval_in_ms (optional):
-            Time interval the method should wait (sleep) between requests.
+            Fixed time interval the method should wait (sleep) between requests.
+            Default = None (adaptive interval)
+        max_interval_in_ms (optional):
+            Longest time interval between requests when the interval is adaptive. Default = 1000
 
         Returns
         -------
@@ -211,15 +240,325 @@ class TaskHandler:
         MeilisearchTimeoutError
             An error containing details about why Meilisearch can't process your request. Meilisearch error codes are described here: https://www.meilisearch.com/docs/reference/errors/error_codes#meilisearch-errors
         """
-        start_time = datetime.now()
-        elapsed_time = 0.0
-        while elapsed_time < timeout_in_ms:
+        schedule = PollingSchedule(interval_in_ms, max_interval_in_ms)
+        deadline = monotonic() + timeout_in_ms / 1000
+        push_until = self._push_until()
+        while monotonic() < deadline:
             task = self.get_task(uid)
-            if task.status not in ("enqueued", "processing"):
+            if task.status not in _UNFINISHED:
                 return task
-            sleep(interval_in_ms / 1000)
-            time_delta = datetime.now() - start_time
-            elapsed_time = time_delta.seconds * 1000 + time_delta.microseconds / 1000
+            if monotonic() < push_until:
+                delay = push_until - monotonic()
+            else:
+                percentage = self._batch_percentage(task) if schedule.adaptive else None
+                delay = schedule.next_delay(percentage)
+            pushed = self._pause([uid], delay, deadline)
+            if pushed:
+                return pushed[uid]
         raise MeilisearchTimeoutError(
             f"timeout of ${timeout_in_ms}ms has exceeded on process ${uid} when waiting for task to be resolve."
         )
+
+    def wait_for_tasks(
+        self,
+        uids: Iterable[int],
+        timeout_in_ms: int = 5000,
+        interval_in_ms: int | None = None,
+        *,
+        max_interval_in_ms: int = 1000,
+        fail_fast: bool = False,
+    ) -> Iterator[Task]:
+        """Wait until Meilisearch processes several tasks, yielding each one once it fails or
+        succeeds.
+
+        All the tasks are polled together, with one request listing the ones still enqueued or
+        processing per interval, instead of one request per task.
+
+        Parameters
+        ----------
+        uids:
+            Identifiers of the tasks to wait for being processed.
+        timeout_in_ms (optional):
+            Time the method should wait for all the tasks before raising a MeilisearchTimeoutError.
+        interval_in_ms (optional):
+            Fixed time interval the method should wait (sleep) between requests.
+            Default = None (starts at 10ms and doubles after each request)
+        max_interval_in_ms (optional):
+            Longest time interval between requests when the interval is adaptive. Default = 1000
+        fail_fast (optional):
+            If True, raise a MeilisearchTaskFailedError as soon as one of the tasks failed.
+
+        Returns
+        -------
+        tasks:
+            Iterator of Task instances, yielded as the tasks are processed.
+
+        Raises
+        ------
+        MeilisearchTimeoutError
+            If some tasks were still not processed after timeout_in_ms.
+        MeilisearchTaskFailedError
+            If fail_fast is True and a task failed.
+        MeilisearchError
+            If one of the tasks does not exist.
+        """
+        pending = set(uids)
+        schedule = PollingSchedule(interval_in_ms, max_interval_in_ms)
+        deadline = monotonic() + timeout_in_ms / 1000
+        push_until = self._push_until()
+        finished: list[Task] = []
+        unknown: set[int] = set()
+        poll = True
+        while pending:
+            if poll:
+                unfinished = {task.uid for task in self._get_tasks_by_uid(pending, _UNFINISHED)}
+                finished = self._get_tasks_by_uid(pending - unfinished)
+                unknown = pending - unfinished - {task.uid for task in finished}
+            for task in finished:
+                if fail_fast and task.status == "failed":
+                    raise MeilisearchTaskFailedError(task)
+                pending.discard(task.uid)
+                yield task
+            if unknown:
+                raise MeilisearchError(f"Task {min(unknown)} was not found.")
+            if not pending:
+                return
+            if monotonic() >= deadline:
+                raise MeilisearchTimeoutError(
+                    f"timeout of {timeout_in_ms}ms has exceeded when waiting for tasks {sorted(pending)} to be resolved."
+                )
+            delay = push_until - monotonic() if monotonic() < push_until else schedule.next_delay()
+            finished = [task for _, task in sorted(self._pause(pending, delay, deadline).items())]
+            # While notifications arrive, wait for the next one instead of polling.
+            poll = not finished
+            if finished:
+                push_until = self._push_until()
+
+    def _push_until(self) -> float:
+        """Return until when to wait for a webhook notification rather than poll."""
+        receiver = self.config.task_webhook
+        return monotonic() + receiver.fallback_after if receiver is not None else 0.0
+
+    def _pause(self, uids: Collection[int], delay: float, deadline: float) -> dict[int, Task]:
+        """Sleep before the next poll and return the tasks among `uids` finished meanwhile,
+        according to the webhook notifications received."""
+        seconds = max(0.0, min(delay, deadline - monotonic()))
+        receiver = self.config.task_webhook
+        if receiver is None:
+            sleep(seconds)
+            return {}
+        return receiver.wait(uids, seconds)
+
+    def _batch_percentage(self, task: Task) -> float | None:
+        if task.status != "processing" or task.batch_uid is None:
+            return None
+        try:
+            return batch_percentage(self.get_batch(task.batch_uid).progress)
+        except MeilisearchApiError:
+            # The progress only refines the polling interval, waiting goes on without it.
+            return None
+
+    def _get_tasks_by_uid(
+        self, uids: Collection[int], statuses: tuple[str, ...] = ()
+    ) -> list[Task]:
+        tasks: list[Task] = []
+        ordered = sorted(uids)
+        # Uids are sent in chunks to keep the query string of a request short.
+        for start in range(0, len(ordered), _UIDS_PER_REQUEST):
+            chunk = ordered[start : start + _UIDS_PER_REQUEST]
+            parameters: dict[str, Any] = {"uids": ",".join(map(str, chunk)), "limit": len(chunk)}
+            if statuses:
+                parameters["statuses"] = ",".join(statuses)
+            tasks.extend(self.get_tasks(parameters).results)
+        return sorted(tasks, key=lambda task: task.uid)
+
+
+class TaskFuture(Future[Task]):
+    """Future resolved with the Task once Meilisearch processed it, whether it succeeded or
+    failed.
+
+    It works with concurrent.futures.wait and concurrent.futures.as_completed, its result can be
+    waited for with a timeout, and it can be awaited from a coroutine. Callbacks added with
+    add_done_callback run in the thread of the TaskPoller. Cancelling the future stops watching
+    the task, it does not cancel the task in Meilisearch.
+    """
+
+    def __init__(self, task_uid: int) -> None:
+        super().__init__()
+        self.task_uid = task_uid
+
+    def __await__(self) -> Generator[Any, None, Task]:
+        return asyncio.wrap_future(self).__await__()
+
+
+class TaskPoller:
+    """Resolve TaskFutures with one background thread polling all the watched tasks together.
+
+    Each tick sends a single request listing which of the watched tasks are still enqueued or
+    processing, then fetches the finished ones. The interval starts at 10ms and doubles after
+    every tick up to `max_interval_in_ms`, and starts over when a new task is watched. The
+    thread is started by `watch` and stops once no future is left to resolve.
+
+    While the client listens for task notifications (see Client.listen_for_tasks), they resolve
+    the futures and polling only happens every `fallback_after` seconds of the receiver.
+    """
+
+    def __init__(self, task_handler: TaskHandler, max_interval_in_ms: int = 1000) -> None:
+        """
+        Parameters
+        ----------
+        task_handler:
+            TaskHandler used to poll the tasks.
+        max_interval_in_ms (optional):
+            Longest time interval between two polls. Default = 1000
+        """
+        self.task_handler = task_handler
+        self.max_interval_in_ms = max_interval_in_ms
+        self._futures: dict[int, list[TaskFuture]] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._thread: threading.Thread | None = None
+
+    def watch(self, task: TaskInfo | int) -> TaskFuture:
+        """Return a TaskFuture resolved once Meilisearch processed the task.
+
+        Parameters
+        ----------
+        task:
+            TaskInfo returned by a write method, or the uid of the task.
+
+        Returns
+        -------
+        future:
+            TaskFuture resolved with the processed Task.
+        """
+        uid = task if isinstance(task, int) else task.task_uid
+        future = TaskFuture(uid)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The task poller is closed.")
+            self._futures.setdefault(uid, []).append(future)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="meilisearch-task-poller", daemon=True
+                )
+                self._thread.start()
+        receiver = self.task_handler.config.task_webhook
+        if receiver is not None:
+            # The notification may have arrived before the task was watched.
+            self._resolve(receiver.wait([uid], 0))
+        self._wakeup.set()
+        return future
+
+    def close(self) -> None:
+        """Stop the background thread and cancel the futures not resolved yet."""
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+            futures = [future for waiting in self._futures.values() for future in waiting]
+            self._futures.clear()
+        self._wakeup.set()
+        if thread is not None and thread is not threading.current_thread():
+            # A poll in flight ends within the request timeout, and the thread is a daemon anyway.
+            thread.join((self.task_handler.config.timeout or 0) + 1)
+        for future in futures:
+            future.cancel()
+
+    def notify(self, task: Task) -> None:
+        """Resolve the futures of a finished task without waiting for the next poll."""
+        self._resolve({task.uid: task})
+
+    def _run(self) -> None:
+        try:
+            self._poll_until_idle()
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            # Fail the futures instead of leaving them to a thread that is gone.
+            with self._lock:
+                self._thread = None
+                futures = [future for waiting in self._futures.values() for future in waiting]
+                self._futures.clear()
+            for future in futures:
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(error)
+        finally:
+            with self._lock:
+                if self._thread is threading.current_thread():
+                    self._thread = None
+
+    def _poll_until_idle(self) -> None:
+        schedule = PollingSchedule(max_interval_in_ms=self.max_interval_in_ms)
+        last_poll = monotonic()
+        polled: set[int] = set()
+        while True:
+            receiver = self.task_handler.config.task_webhook
+            if receiver is None:
+                delay = schedule.next_delay()
+            else:
+                # Notifications resolve the futures, polling only catches the lost ones.
+                delay = max(0.0, last_poll + receiver.fallback_after - monotonic())
+            woken = self._wakeup.wait(delay)
+            if woken:
+                self._wakeup.clear()
+                schedule = PollingSchedule(max_interval_in_ms=self.max_interval_in_ms)
+            with self._lock:
+                self._futures = {
+                    uid: alive
+                    for uid, waiting in self._futures.items()
+                    if (alive := [future for future in waiting if not future.cancelled()])
+                }
+                if self._closed or not self._futures:
+                    self._thread = None
+                    return
+                uids = list(self._futures)
+            polled.intersection_update(uids)
+            if woken and receiver is not None and monotonic() < last_poll + receiver.fallback_after:
+                # Poll the newly watched tasks once, in case they finished before being watched.
+                fresh = [uid for uid in uids if uid not in polled]
+                if fresh:
+                    self._poll(fresh)
+                    polled.update(fresh)
+                continue
+            self._poll(uids)
+            polled.update(uids)
+            last_poll = monotonic()
+
+    def _poll(self, uids: list[int]) -> None:
+        outcomes: dict[int, Task | MeilisearchError]
+        try:
+            unfinished = {
+                task.uid for task in self.task_handler._get_tasks_by_uid(uids, _UNFINISHED)
+            }
+            finished = [uid for uid in uids if uid not in unfinished]
+            tasks = self.task_handler._get_tasks_by_uid(finished) if finished else []
+        except MeilisearchError as error:
+            if is_transient(error):
+                # Meilisearch may answer at the next tick.
+                return
+            outcomes = dict.fromkeys(uids, error)
+        else:
+            found = {task.uid: task for task in tasks}
+            outcomes = {
+                uid: found[uid] if uid in found else MeilisearchError(f"Task {uid} was not found.")
+                for uid in finished
+            }
+        self._resolve(outcomes)
+
+    def _resolve(self, outcomes: Mapping[int, Task | MeilisearchError]) -> None:
+        with self._lock:
+            resolved = [
+                (future, outcome)
+                for uid, outcome in outcomes.items()
+                for future in self._futures.pop(uid, [])
+            ]
+        for future, outcome in resolved:
+            if not future.set_running_or_notify_cancel():
+                continue
+            if isinstance(outcome, Task):
+                future.set_result(outcome)
+            else:
+                future.set_exception(outcome)
+
+
+_UNFINISHED = ("enqueued", "processing")
+_UIDS_PER_REQUEST = 1000
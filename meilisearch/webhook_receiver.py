@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hmac
+import io
+import json
+import secrets
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Collection
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import monotonic
+
+from meilisearch.models.task import Task
+
+
+class TaskWebhookReceiver:
+    """Small HTTP server receiving the task notifications Meilisearch sends to its webhooks.
+
+    Meilisearch posts the tasks it finished, as NDJSON, to every registered webhook. Once
+    registered with `Client.listen_for_tasks`, the receiver resolves the pending waits of the
+    client (wait_for_task, wait_for_tasks and watched task futures) as soon as the notification
+    arrives. If none arrives within `fallback_after` seconds, they go back to polling, so that a
+    lost notification only delays them.
+
+    Notifications must carry the random bearer token given to Meilisearch along with the
+    webhook URL. The last `max_retained` finished tasks are kept, so that a notification
+    arriving before the wait starts is not missed.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        public_url: str | None = None,
+        fallback_after: float = 10.0,
+        max_retained: int = 10_000,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        host (optional):
+            Interface the server listens on. Default = '127.0.0.1'
+        port (optional):
+            Port the server listens on. Default = 0 (a free port)
+        public_url (optional):
+            URL Meilisearch should send the notifications to, when it cannot reach the server
+            at host and port, for example from another machine or container.
+            Default = None (http://host:port/)
+        fallback_after (optional):
+            Seconds to wait for a notification before polling Meilisearch. Default = 10.0
+        max_retained (optional):
+            Number of finished tasks remembered. Default = 10000
+        """
+        self.host = host
+        self.port = port
+        self.public_url = public_url
+        self.fallback_after = fallback_after
+        self.max_retained = max_retained
+        self.token = secrets.token_urlsafe(32)
+        self.webhook_uuid: str | None = None
+        self._tasks: OrderedDict[int, Task] = OrderedDict()
+        self._condition = threading.Condition()
+        self._listeners: list[Callable[[Task], object]] = []
+        self._async_waiters: list[
+            tuple[asyncio.AbstractEventLoop, asyncio.Future[None], Collection[int]]
+        ] = []
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """URL of the webhook registered in Meilisearch."""
+        if self.public_url is not None:
+            return self.public_url
+        if self._server is None:
+            raise RuntimeError("The webhook receiver is not started.")
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}/"
+
+    def start(self) -> None:
+        """Start listening in a background thread."""
+        if self._server is not None:
+            return
+        self._server = ThreadingHTTPServer((self.host, self.port), _handler(self))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.1},
+            name="meilisearch-webhook-receiver",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop the server."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        self._server = self._thread = None
+
+    def add_listener(self, listener: Callable[[Task], object]) -> None:
+        """Call `listener` with every finished task received, from the thread of the server."""
+        self._listeners.append(listener)
+
+    def wait(self, uids: Collection[int], timeout: float) -> dict[int, Task]:
+        """Block until a notification for one of the tasks `uids` was received, for at most
+        `timeout` seconds, and return the tasks among `uids` received so far, by uid."""
+        deadline = monotonic() + timeout
+        with self._condition:
+            while True:
+                received = self._received(uids)
+                remaining = deadline - monotonic()
+                if received or remaining <= 0:
+                    return received
+                self._condition.wait(remaining)
+
+    async def async_wait(self, uids: Collection[int], timeout: float) -> dict[int, Task]:
+        """Asyncio counterpart of `wait`."""
+        loop = asyncio.get_running_loop()
+        notified: asyncio.Future[None] = loop.create_future()
+        waiter = (loop, notified, uids)
+        with self._condition:
+            received = self._received(uids)
+            if received:
+                return received
+            self._async_waiters.append(waiter)
+        try:
+            await asyncio.wait_for(notified, max(0.0, timeout))
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._condition:
+                self._async_waiters.remove(waiter)
+        with self._condition:
+            return self._received(uids)
+
+    def receive(self, tasks: list[Task]) -> None:
+        """Record finished tasks and wake up the waits for them."""
+        finished = [task for task in tasks if task.status not in ("enqueued", "processing")]
+        if not finished:
+            return
+        uids = {task.uid for task in finished}
+        with self._condition:
+            for task in finished:
+                self._tasks[task.uid] = task
+                self._tasks.move_to_end(task.uid)
+            while len(self._tasks) > self.max_retained:
+                self._tasks.popitem(last=False)
+            self._condition.notify_all()
+            notified = [
+                (loop, future)
+                for loop, future, waited in self._async_waiters
+                if any(uid in uids for uid in waited)
+            ]
+        for loop, future in notified:
+            loop.call_soon_threadsafe(_notify, future)
+        for listener in self._listeners:
+            for task in finished:
+                listener(task)
+
+    def _received(self, uids: Collection[int]) -> dict[int, Task]:
+        return {uid: self._tasks[uid] for uid in uids if uid in self._tasks}
+
+
+def parse_task_notification(body: bytes, content_encoding: str | None = None) -> list[Task]:
+    """Parse the NDJSON body of a task notification, gzip compressed or not."""
+    if content_encoding == "gzip":
+        body = gzip.decompress(body)
+    return [Task(**json.loads(line)) for line in body.splitlines() if line.strip()]
+
+
+def _notify(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+def _read_chunked(stream: io.BufferedIOBase) -> bytes:
+    """Read a body sent with the chunked transfer encoding, as Meilisearch streams them."""
+    chunks: list[bytes] = []
+    while True:
+        size = int(stream.readline().split(b";", 1)[0], 16)
+        if size == 0:
+            # The trailer section ends with an empty line.
+            while stream.readline().strip():
+                pass
+            return b"".join(chunks)
+        chunks.append(stream.read(size))
+        stream.readline()
+
+
+def _handler(receiver: TaskWebhookReceiver) -> type[BaseHTTPRequestHandler]:
+    class _TaskNotificationHandler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:  # noqa: N802
+            authorization = self.headers.get("Authorization") or ""
+            if not hmac.compare_digest(authorization.encode(), f"Bearer {receiver.token}".encode()):
+                self._reply(401)
+                return
+            try:
+                body = self._read_body()
+                if body is None:
+                    self._reply(411)
+                    return
+                tasks = parse_task_notification(body, self.headers.get("Content-Encoding"))
+            except (OSError, ValueError, TypeError):
+                self._reply(400)
+                return
+            receiver.receive(tasks)
+            self._reply(200)
+
+        def _read_body(self) -> bytes | None:
+            """Return the request body, None when its length is unknown."""
+            if "chunked" in self.headers.get("Transfer-Encoding", "").lower():
+                return _read_chunked(self.rfile)
+            length = self.headers.get("Content-Length")
+            return self.rfile.read(int(length)) if length is not None else None
+
+        def _reply(self, status: int) -> None:
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+            pass
+
+    return _TaskNotificationHandler
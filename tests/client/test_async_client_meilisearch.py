@@ -0,0 +1,368 @@
+import asyncio
+
+import httpx
+import pytest
+
+from meilisearch import AsyncClient
+from meilisearch.aio import AsyncIndex
+from meilisearch.circuit_breaker import CircuitBreaker
+from meilisearch.errors import (
+    MeilisearchApiError,
+    MeilisearchCircuitOpenError,
+    MeilisearchCommunicationError,
+    MeilisearchError,
+)
+from meilisearch.hedging import HedgingPolicy
+from meilisearch.models.document import DocumentsResults
+from meilisearch.models.index import ProximityPrecision
+from meilisearch.models.task import Task, TaskInfo
+from meilisearch.retry import RetryPolicy
+from tests import BASE_URL, MASTER_KEY, common
+
+
+async def _index_with_documents(client, documents):
+    index = client.index(common.INDEX_UID)
+    task = await index.add_documents(documents)
+    await client.wait_for_task(task.task_uid, timeout_in_ms=30_000)
+    return index
+
+
+def test_async_client_health():
+    async def run():
+        async with AsyncClient(BASE_URL, MASTER_KEY) as client:
+            assert await client.health() == {"status": "available"}
+            assert await client.is_healthy() is True
+
+    asyncio.run(run())
+
+
+def test_async_client_index_shares_connection_pool():
+    client = AsyncClient(BASE_URL, MASTER_KEY)
+    index = client.index(common.INDEX_UID)
+
+    assert isinstance(index, AsyncIndex)
+    assert index.http is client.http
+    assert index.task_handler.http is client.http
+
+
+def test_async_add_documents_and_search(small_movies):
+    async def run():
+        async with AsyncClient(BASE_URL, MASTER_KEY) as client:
+            task = await client.index(common.INDEX_UID).add_documents(small_movies)
+            assert isinstance(task, TaskInfo)
+            finished = await client.wait_for_task(task.task_uid, timeout_in_ms=30_000)
+            assert isinstance(finished, Task)
+            assert finished.status == "succeeded"
+
+            response = await client.index(common.INDEX_UID).search("How to Train Your Dragon")
+            assert response["hits"][0]["id"] == "166428"
+
+    asyncio.run(run())
+
+
+def test_async_add_documents_stream(small_movies):
+    async def documents():
+        for movie in small_movies:
+            yield movie
+
+    async def run():
+        async with AsyncClient(BASE_URL, MASTER_KEY) as client:
+            index = client.index(common.INDEX_UID)
+            response = [
+                task
+                async for task in index.add_documents_stream(documents(), max_payload_size=4096)
+            ]
+            assert len(response) > 1
+            for task in response:
+                finished = await client.wait_for_task(task.task_uid, timeout_in_ms=30_000)
+                assert finished.status == "succeeded"
+            assert (await index.get_stats()).number_of_documents == len(small_movies)
+
+    asyncio.run(run())
+
+
+def test_async_add_documents_from_file(songs_ndjson, tmp_path):
+    path = tmp_path / "songs.ndjson"
+    path.write_bytes(songs_ndjson)
+
+    async def run():
+        async with AsyncClient(BASE_URL, MASTER_KEY) as client:
+            index = client.index(common.INDEX_UID)
+            task = await index.add_documents_from_file(path)
+            finished = await client.wait_for_task(task.task_uid, timeout_in_ms=30_000)
+            assert finished.status == "succeeded"
+            assert (await index.get_stats()).number_of_documents == len(songs_ndjson.splitlines())
+
+    asyncio.run(run())
+
+
+def test_async_compressed_uploads(small_movies, songs_ndjson, tmp_path):
+    path = tmp_path / "songs.ndjson"
+    path.write_bytes(songs_ndjson)
+    metrics = []
+
+    async def run():
+        async with AsyncClient(
+            BASE_URL, MASTER_KEY, compression="gzip", on_request_metrics=metrics.append
+        ) as client:
+            index = client.index(common.INDEX_UID)
+            for task in (
+                await index.add_documents(small_movies),
+                await index.add_documents_from_file(path),
+            ):
+                finished = await client.wait_for_task(task.task_uid, timeout_in_ms=30_000)
+                assert finished.status == "succeeded"
+
+    asyncio.run(run())
+    uploads = [m for m in metrics if m.method == "POST"]
+    assert [m.content_encoding for m in uploads] == ["gzip", "gzip"]
+    assert all(m.compression_ratio > 2 for m in uploads)
+
+
+def test_async_concurrent_searches(small_movies):
+    async def run():
+        async with AsyncClient(BASE_URL, MASTER_KEY) as client:
+            index = await _index_with_documents(client, small_movies)
+            responses = await asyncio.gather(*(index.search("Dragon") for _ in range(50)))
+            assert all(response["hits"] for response in responses)
+
+    asyncio.run(run())
+
+
+def test_async_iter_search(small_movies):
+    async def run():
+        async with AsyncClient(BASE_URL, MASTER_KEY) as client:
+            index = await _index_with_documents(client, small_movies)
+            hits = [hit async for hit in index.iter_search("", page_size=7)]
+            first = [hit async for hit in index.iter_search("", {"limit": 3}, prefetch=False)]
+            assert len(hits) == len(small_movies)
+            assert first == hits[:3]
+
+    asyncio.run(run())
+
+
+def test_async_multi_search(small_movies):
+    async def run():
+        async with AsyncClient(BASE_URL, MASTER_KEY) as client:
+            await _index_with_documents(client, small_movies)
+            response = await client.multi_search([{"indexUid": common.INDEX_UID, "q": "Dragon"}])
+            assert response["results"][0]["indexUid"] == common.INDEX_UID
+            assert response["results"][0]["hits"]
+
+    asyncio.run(run())
+
+
+def test_async_multi_search_split_into_chunks(small_movies):
+    async def run():
+        async with AsyncClient(BASE_URL, MASTER_KEY) as client:
+            await _index_with_documents(client, small_movies)
+            queries = [{"indexUid": common.INDEX_UID, "limit": limit} for limit in range(1, 6)]
+            queries[0] = {"indexUid": "indexDoesNotExist"}
+            response = await client.multi_search(queries, chunk_size=2, max_concurrency=2)
+            assert response["results"][0]["error"]["code"] == "index_not_found"
+            assert [result["limit"] for result in response["results"][1:]] == [2, 3, 4, 5]
+
+    asyncio.run(run())
+
+
+def test_async_get_documents(small_movies):
+    async def run():
+        async with AsyncClient(BASE_URL, MASTER_KEY) as client:
+            index = await _index_with_documents(client, small_movies)
+            documents = await index.get_documents({"limit": 5})
+            assert isinstance(documents, DocumentsResults)
+            assert len(documents.results) == 5
+
+    asyncio.run(run())
+
+
+def test_async_iter_documents(small_movies):
+    async def run():
+        async with AsyncClient(BASE_URL, MASTER_KEY) as client:
+            index = await _index_with_documents(client, small_movies)
+            documents = [document async for document in index.iter_documents(page_size=7)]
+            raw = [
+                document
+                async for document in index.iter_documents(fields=["id"], raw=True, prefetch=False)
+            ]
+            assert {document.id for document in documents} == {m["id"] for m in small_movies}
+            assert raw == [{"id": movie["id"]} for movie in small_movies]
+
+    asyncio.run(run())
+
+
+def test_async_update_settings(small_movies):
+    async def run():
+        async with AsyncClient(BASE_URL, MASTER_KEY) as client:
+            index = await _index_with_documents(client, small_movies)
+            task = await index.update_settings({"filterableAttributes": ["genre"]})
+            await index.wait_for_task(task.task_uid, timeout_in_ms=30_000)
+            settings = await index.get_settings()
+            assert settings["filterableAttributes"] == ["genre"]
+
+    asyncio.run(run())
+
+
+def test_async_setting_routes():
+    requests = []
+    task = {"taskUid": 1, "indexUid": "movies", "status": "enqueued", "type": "settingsUpdate"}
+    task["enqueuedAt"] = "2024-01-01T00:00:00.000000Z"
+    responses = {
+        "typo-tolerance": {"enabled": False},
+        "embedders": {"default": {"source": "userProvided", "dimensions": 3}},
+        "proximity-precision": "byAttribute",
+    }
+
+    def handler(request):
+        route = request.url.path.rsplit("/", 1)[-1]
+        requests.append((request.method, route))
+        if request.method == "GET":
+            return httpx.Response(200, json=responses[route])
+        return httpx.Response(202, json=task)
+
+    async def run():
+        async with AsyncClient(BASE_URL, MASTER_KEY) as client:
+            client.http.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            index = client.index("movies")
+            assert (await index.get_typo_tolerance()).enabled is False
+            embedders = await index.get_embedders()
+            assert embedders.embedders["default"].dimensions == 3
+            assert await index.get_proximity_precision() == ProximityPrecision.BY_ATTRIBUTE
+            assert isinstance(await index.update_ranking_rules(["words"]), TaskInfo)
+            await index.reset_synonyms()
+
+    asyncio.run(run())
+    assert requests[-2:] == [("PUT", "ranking-rules"), ("DELETE", "synonyms")]
+
+
+def test_async_get_index_not_found():
+    async def run():
+        async with AsyncClient(BASE_URL, MASTER_KEY) as client:
+            with pytest.raises(MeilisearchApiError):
+                await client.get_index("unknown")
+
+    asyncio.run(run())
+
+
+def test_async_communication_error():
+    async def run():
+        async with AsyncClient("http://wrongurl:1234", MASTER_KEY, timeout=1) as client:
+            with pytest.raises(MeilisearchCommunicationError):
+                await client.health()
+
+    asyncio.run(run())
+
+
+def test_async_retry():
+    paths = []
+
+    def handler(request):
+        paths.append(request.url.path)
+        first_attempt = paths.count(request.url.path) == 1
+        if request.url.path == "/health":
+            if first_attempt:
+                raise httpx.ReadError("connection reset")
+            return httpx.Response(200, json={"status": "available"})
+        if first_attempt:
+            raise httpx.ConnectError("connection refused")
+        return httpx.Response(503, json={"message": "unavailable"})
+
+    async def run():
+        metrics = []
+        async with AsyncClient(
+            BASE_URL,
+            MASTER_KEY,
+            retry=RetryPolicy(max_attempts=3, backoff_factor=0),
+            on_request_metrics=metrics.append,
+        ) as client:
+            client.http.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            assert await client.health() == {"status": "available"}
+            # Refused connections are retried for writes too, not the 503 that follows.
+            with pytest.raises(MeilisearchApiError):
+                await client.index("movies").add_documents([{"id": 1}])
+
+        assert [m.attempts for m in metrics] == [2, 2]
+
+    asyncio.run(run())
+
+
+def test_async_circuit_breaker():
+    paths = []
+
+    def handler(request):
+        paths.append(request.url.path)
+        raise httpx.ConnectError("connection refused")
+
+    async def run():
+        breaker = CircuitBreaker(minimum_calls=2)
+        async with AsyncClient(BASE_URL, MASTER_KEY, circuit_breaker=breaker) as client:
+            client.http.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            for _ in range(2):
+                with pytest.raises(MeilisearchCommunicationError):
+                    await client.health()
+            with pytest.raises(MeilisearchCircuitOpenError):
+                await client.index("movies").search("wonder")
+
+        assert paths == ["/health", "/health"]
+
+    asyncio.run(run())
+
+
+def test_async_hedged_search():
+    cancelled = []
+
+    async def handler(request):
+        if not cancelled:
+            cancelled.append(False)
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled[0] = True
+                raise
+        return httpx.Response(200, json={"hits": []})
+
+    async def run():
+        hedging = HedgingPolicy(delay=0.05)
+        async with AsyncClient(BASE_URL, MASTER_KEY, hedging=hedging) as client:
+            client.http.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            assert await client.index("movies").search("wonder") == {"hits": []}
+            await asyncio.sleep(0)
+
+        assert (hedging.fired, hedging.won) == (1, 1)
+        assert cancelled == [True]
+
+    asyncio.run(run())
+
+
+def test_async_wait_for_tasks(small_movies):
+    async def run():
+        async with AsyncClient(BASE_URL, MASTER_KEY) as client:
+            index = client.index(common.INDEX_UID)
+            uids = [
+                (await index.add_documents(small_movies[i : i + 5])).task_uid
+                for i in range(0, 15, 5)
+            ]
+            tasks = [task async for task in index.wait_for_tasks(uids, timeout_in_ms=10_000)]
+
+        assert sorted(task.uid for task in tasks) == sorted(uids)
+        assert all(task.status == "succeeded" for task in tasks)
+
+    asyncio.run(run())
+
+
+def test_async_watch_task(small_movies):
+    async def run():
+        async with AsyncClient(BASE_URL, MASTER_KEY) as client:
+            index = client.index(common.INDEX_UID)
+            futures = [
+                index.watch_task(await index.add_documents(small_movies[i : i + 5]))
+                for i in range(0, 15, 5)
+            ]
+            tasks = await asyncio.wait_for(asyncio.gather(*futures), 10)
+            with pytest.raises(MeilisearchError):
+                await asyncio.wait_for(client.watch_task(10**9), 10)
+
+        assert all(task.status == "succeeded" for task in tasks)
+        assert [task.uid for task in tasks] == [future.result().uid for future in futures]
+
+    asyncio.run(run())
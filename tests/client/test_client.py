@@ -66,3 +66,22 @@ def test_index_inherits_custom_headers():
 
     # Index-level HttpRequests instance should also include the custom headers
     assert index.http.headers.items() >= custom_headers.items()
+
+
+def test_index_and_task_handler_share_client_connection_pool():
+    client = meilisearch.Client("127.0.0.1:7700")
+
+    assert client.index("movies").http is client.http
+    assert client.task_handler.http is client.http
+    assert client.index("movies").task_handler.http.session is client.http.session
+
+
+def test_client_pool_configuration():
+    client = meilisearch.Client(
+        "http://127.0.0.1:7700", pool_connections=2, pool_maxsize=32, keep_alive=False
+    )
+    adapter = client.http.session.get_adapter("http://127.0.0.1:7700")
+
+    assert adapter._pool_connections == 2  # pylint: disable=protected-access
+    assert adapter._pool_maxsize == 32  # pylint: disable=protected-access
+    assert client.http.session.headers["Connection"] == "close"
@@ -0,0 +1,193 @@
+import json
+import socket
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+
+import meilisearch
+from meilisearch.load_balancer import LoadBalancer, is_balanced_read
+from tests import BASE_URL, MASTER_KEY
+
+REPLICA_URL = "http://127.0.0.1:7701"
+
+
+def _json_response(content: bytes) -> requests.Response:
+    response = requests.models.Response()
+    response.status_code = 200
+    response._content = content  # pylint: disable=protected-access
+    return response
+
+
+def test_reads_are_spread_and_writes_go_to_the_first_node():
+    client = meilisearch.Client([BASE_URL, REPLICA_URL], MASTER_KEY, health_check_interval=None)
+    index = client.index("movies")
+    urls = []
+
+    def post(url, **kwargs):
+        urls.append(url)
+        if url.endswith("/search"):
+            return _json_response(b'{"hits": []}')
+        return _json_response(
+            b'{"taskUid": 1, "indexUid": "movies", "status": "enqueued",'
+            b' "type": "documentAdditionOrUpdate", "enqueuedAt": "2024-01-01T00:00:00.000000Z"}'
+        )
+
+    with patch.object(client.http.session, "post", side_effect=post) as mock_post:
+        mock_post.configure_mock(__name__="post")
+        for _ in range(10):
+            index.search("wonder")
+        index.add_documents([{"id": 1}])
+
+    searches = [url for url in urls if url.endswith("/search")]
+    assert {url.rsplit("/indexes", 1)[0] for url in searches} == {BASE_URL, REPLICA_URL}
+    assert urls[-1] == f"{BASE_URL}/indexes/movies/documents"
+    assert client.config.url == BASE_URL
+
+
+def test_balanced_reads_are_matched_by_route_position():
+    config = meilisearch.Client(BASE_URL, MASTER_KEY).config
+
+    assert is_balanced_read(config, "GET", "indexes/documents/documents/1")
+    assert is_balanced_read(config, "POST", "indexes/search/search")
+    assert is_balanced_read(config, "POST", "indexes/documents/documents/fetch")
+    assert is_balanced_read(config, "POST", "multi-search")
+    for path in ("indexes/documents", "indexes/documents/settings", "indexes/documents/stats"):
+        assert not is_balanced_read(config, "GET", path)
+    assert not is_balanced_read(config, "POST", "indexes/search/documents")
+
+
+def test_least_outstanding_requests():
+    balancer = LoadBalancer([BASE_URL, REPLICA_URL], health_check_interval=None)
+
+    first = balancer.acquire()
+    second = balancer.acquire()
+    assert {first, second} == {BASE_URL, REPLICA_URL}
+
+    balancer.release(second, 0.01)
+    assert balancer.acquire() == second
+
+
+def test_ewma_latency():
+    balancer = LoadBalancer([BASE_URL, REPLICA_URL], "ewma", health_check_interval=None)
+    assert {balancer.acquire(), balancer.acquire()} == {BASE_URL, REPLICA_URL}
+    balancer.release(BASE_URL, 0.5)
+    balancer.release(REPLICA_URL, 0.01)
+
+    assert [balancer.acquire() for _ in range(3)] == [REPLICA_URL] * 3
+
+
+def test_unhealthy_nodes_are_taken_out_and_brought_back():
+    down = {REPLICA_URL}
+    balancer = LoadBalancer(
+        [BASE_URL, REPLICA_URL], health_check_interval=None, probe=lambda url: url not in down
+    )
+
+    balancer.check_health()
+    assert balancer.healthy_nodes == [BASE_URL]
+    assert {balancer.acquire() for _ in range(5)} == {BASE_URL}
+
+    down.clear()
+    balancer.check_health()
+    assert balancer.healthy_nodes == [BASE_URL, REPLICA_URL]
+    assert balancer.acquire() == REPLICA_URL
+
+
+def test_background_health_checks(empty_index):
+    client = meilisearch.Client(
+        [BASE_URL, "http://127.0.0.1:1"], MASTER_KEY, health_check_interval=0.05
+    )
+    balancer = client.config.load_balancer
+    with client:
+        balancer.release(balancer.acquire())
+        for _ in range(40):
+            if balancer.healthy_nodes == [BASE_URL]:
+                break
+            time.sleep(0.05)
+        assert balancer.healthy_nodes == [BASE_URL]
+
+        index = client.index(empty_index().uid)
+        for _ in range(10):
+            assert index.search("")["hits"] == []
+
+    assert not balancer._thread.is_alive()  # pylint: disable=protected-access
+
+
+def test_unknown_load_balancing_strategy():
+    with pytest.raises(ValueError):
+        meilisearch.Client([BASE_URL, REPLICA_URL], MASTER_KEY, load_balancing="round_robin")
+
+
+def test_reads_can_skip_the_primary():
+    balancer = LoadBalancer(
+        [BASE_URL, REPLICA_URL], health_check_interval=None, read_from_primary=False
+    )
+    assert {balancer.acquire() for _ in range(5)} == {REPLICA_URL}
+
+    balancer.probe = lambda url: url == BASE_URL
+    balancer.check_health()
+    assert balancer.acquire() == BASE_URL
+
+
+def test_read_your_writes():
+    client = meilisearch.Client(
+        [BASE_URL, REPLICA_URL], MASTER_KEY, health_check_interval=None, read_from_primary=False
+    )
+    index = client.index("movies")
+    status = {"status": "processing"}
+    sent = []
+
+    def get(url, **kwargs):
+        sent.append(url)
+        return _json_response(json.dumps({"uid": 5, **status}).encode())
+
+    def post(url, **kwargs):
+        sent.append(url)
+        return _json_response(b'{"hits": []}')
+
+    with (
+        patch.object(client.http.session, "get", side_effect=get) as mock_get,
+        patch.object(client.http.session, "post", side_effect=post) as mock_post,
+    ):
+        mock_get.configure_mock(__name__="get")
+        mock_post.configure_mock(__name__="post")
+        index.search("wonder", after_task_uid=5)
+        status["status"] = "succeeded"
+        index.search("wonder", after_task_uid=5)
+        index.search("wonder", after_task_uid=4)
+
+    assert sent == [
+        f"{REPLICA_URL}/tasks/5",
+        f"{BASE_URL}/indexes/movies/search",
+        f"{REPLICA_URL}/tasks/5",
+        f"{REPLICA_URL}/indexes/movies/search",
+        f"{REPLICA_URL}/indexes/movies/search",
+    ]
+
+
+def test_health_checks_time_out_and_run_concurrently():
+    with socket.socket() as silent:
+        # Accepts connections but never answers.
+        silent.bind(("127.0.0.1", 0))
+        silent.listen()
+        silent_url = f"http://127.0.0.1:{silent.getsockname()[1]}"
+        client = meilisearch.Client(
+            [BASE_URL, silent_url, REPLICA_URL], MASTER_KEY, health_check_interval=0.05
+        )
+        balancer = client.config.load_balancer
+        balancer.timeout = 0.5
+        assert balancer.session is client.http.session
+
+        started = time.monotonic()
+        balancer.check_health()
+        assert time.monotonic() - started < 1.0
+        assert balancer.healthy_nodes == [BASE_URL]
+
+        balancer.acquire()
+        time.sleep(0.1)
+        started = time.monotonic()
+        client.close()
+        assert time.monotonic() - started < 2.0
+
+    assert LoadBalancer([BASE_URL]).timeout == 2.0
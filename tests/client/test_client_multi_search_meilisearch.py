@@ -1,4 +1,5 @@
 import pytest
+import requests
 
 from meilisearch.errors import MeilisearchApiError
 from tests.common import INDEX_UID, REMOTE_MS_1, REMOTE_MS_2
@@ -122,3 +123,43 @@ def test_multi_search_with_network(client, index_with_documents):
     assert response["hits"][0]["_federation"]["remote"] == REMOTE_MS_1
     assert response["remoteErrors"] == {}
     reset_network_config(client)
+
+
+def test_multi_search_split_into_chunks(client, index_with_documents):
+    """Tests a multi-search split into chunks, with a query on a missing index."""
+    index_with_documents()
+    queries = [{"indexUid": INDEX_UID, "q": "", "limit": limit} for limit in range(1, 8)]
+    queries[4] = {"indexUid": "indexDoesNotExist", "q": ""}
+
+    response = client.multi_search(queries, chunk_size=2, max_concurrency=3)
+
+    assert len(response["results"]) == 7
+    limits = [result["limit"] for result in response["results"] if "limit" in result]
+    assert limits == [1, 2, 3, 4, 6, 7]
+    assert response["results"][4]["indexUid"] == "indexDoesNotExist"
+    assert response["results"][4]["error"]["code"] == "index_not_found"
+
+
+def test_multi_search_chunks_are_not_split_on_server_errors(client, monkeypatch):
+    """Tests that an error not caused by a query fails the multi-search instead of splitting it."""
+    unavailable = requests.Response()
+    unavailable.status_code = 503
+    unavailable._content = b'{"message": "unavailable", "code": "internal", "type": "internal"}'  # pylint: disable=protected-access
+    sent = []
+
+    def post(path, body=None, **kwargs):
+        sent.append(body["queries"])
+        raise MeilisearchApiError("unavailable", unavailable)
+
+    monkeypatch.setattr(client.http, "post", post)
+    queries = [{"indexUid": INDEX_UID, "q": "", "limit": limit} for limit in range(1, 5)]
+
+    with pytest.raises(MeilisearchApiError):
+        client.multi_search(queries, chunk_size=4)
+    assert sent == [queries]
+
+
+def test_multi_search_chunks_with_federation(client):
+    """Tests that a federated multi-search cannot be split."""
+    with pytest.raises(ValueError):
+        client.multi_search([{"indexUid": INDEX_UID, "q": ""}], {}, chunk_size=1)
@@ -0,0 +1,100 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+import meilisearch
+from meilisearch.errors import MeilisearchApiError
+from meilisearch.search_batching import SearchBatching
+from tests import BASE_URL, MASTER_KEY
+
+
+def _client(batching, sent):
+    return meilisearch.Client(
+        BASE_URL,
+        MASTER_KEY,
+        search_batching=batching,
+        on_request_metrics=lambda metrics: sent.append(metrics.path),
+    )
+
+
+def test_concurrent_searches_are_sent_as_one_multi_search(index_with_documents):
+    batching = SearchBatching(window=0.2, max_batch_size=3)
+    sent = []
+    client = _client(batching, sent)
+    uid = index_with_documents().uid
+    queries = ["shazam", "dragon", "", "shazam"]
+
+    with ThreadPoolExecutor(4) as pool:
+        responses = list(pool.map(lambda query: client.index(uid).search(query), queries))
+    alone = client.index(uid).search("dragon")
+
+    expected = [client.index(uid).search(query, after_task_uid=0) for query in queries]
+    assert responses == expected
+    assert "indexUid" not in responses[0]
+    assert alone == expected[1]
+    assert (batching.batches, batching.batched) == (1, 3)
+    assert len([path for path in sent if path.endswith("multi-search")]) == 1
+
+
+def test_each_search_of_a_rejected_batch_gets_its_own_outcome(index_with_documents):
+    batching = SearchBatching(window=0.2)
+    sent = []
+    client = _client(batching, sent)
+    uid = index_with_documents().uid
+
+    with ThreadPoolExecutor(2) as pool:
+        found = pool.submit(client.index(uid).search, "shazam")
+        missing = pool.submit(client.index("missing-index").search, "shazam")
+        assert found.result()["hits"]
+        with pytest.raises(MeilisearchApiError):
+            missing.result()
+
+    assert batching.batches == 1
+    assert len([path for path in sent if path.endswith("/search")]) == 2
+
+
+def test_a_batch_failing_for_every_search_is_not_sent_again(index_with_documents, monkeypatch):
+    sent = []
+    client = _client(SearchBatching(window=0.2), sent)
+    uid = index_with_documents().uid
+    unavailable = requests.Response()
+    unavailable.status_code = 503
+    unavailable._content = b'{"message": "unavailable", "code": "internal", "type": "internal"}'  # pylint: disable=protected-access
+
+    def send_batch(queries):
+        raise MeilisearchApiError("unavailable", unavailable)
+
+    monkeypatch.setattr(client.http._batcher, "send_batch", send_batch)  # pylint: disable=protected-access
+    with ThreadPoolExecutor(2) as pool:
+        futures = [pool.submit(client.index(uid).search, query) for query in ("shazam", "")]
+        for future in futures:
+            with pytest.raises(MeilisearchApiError) as error:
+                future.result()
+            assert error.value.type == "internal"
+
+    assert not [path for path in sent if path.endswith("/search")]
+
+
+def test_async_search_batching(index_with_documents):
+    uid = index_with_documents().uid
+    batching = SearchBatching(window=0.05)
+    sent = []
+
+    async def run():
+        async with meilisearch.AsyncClient(
+            BASE_URL,
+            MASTER_KEY,
+            search_batching=batching,
+            on_request_metrics=lambda metrics: sent.append(metrics.path),
+        ) as client:
+            index = client.index(uid)
+            batched = await asyncio.gather(index.search("shazam"), index.search("dragon"))
+            alone = await index.search("shazam")
+        return batched, alone
+
+    batched, alone = asyncio.run(run())
+    assert batched[0] == alone
+    assert (batching.batches, batching.batched) == (1, 2)
+    assert sent.count("multi-search") == 1
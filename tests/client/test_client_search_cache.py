@@ -0,0 +1,117 @@
+import asyncio
+
+import meilisearch
+from meilisearch.models.task import Task
+from meilisearch.search_cache import SearchCache
+from tests import BASE_URL, MASTER_KEY
+
+
+def _client(cache, sent):
+    return meilisearch.Client(
+        BASE_URL,
+        MASTER_KEY,
+        search_cache=cache,
+        on_request_metrics=lambda metrics: sent.append((metrics.method, metrics.path)),
+    )
+
+
+def test_identical_searches_are_answered_from_the_cache(index_with_documents):
+    cache = SearchCache()
+    sent = []
+    index = _client(cache, sent).index(index_with_documents().uid)
+
+    first = index.search("shazam", {"limit": 5, "offset": 0})
+    first["hits"].clear()
+    second = index.search("shazam", {"offset": 0, "limit": 5})
+    index.search("shazam", {"limit": 6})
+
+    assert second["hits"]
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert len([path for method, path in sent if path.endswith("/search")]) == 2
+
+
+def test_cache_is_invalidated_when_a_document_task_succeeds(index_with_documents):
+    cache = SearchCache()
+    sent = []
+    client = _client(cache, sent)
+    index = client.index(index_with_documents().uid)
+    queries = [{"indexUid": index.uid, "q": "shazam"}]
+
+    index.search("shazam")
+    client.multi_search(queries)
+    task = index.add_documents([{"id": "1", "title": "Shazam 2"}])
+    index.search("shazam")
+    assert cache.hits == 1
+
+    client.wait_for_task(task.task_uid)
+    index.search("shazam")
+    client.multi_search(queries)
+    index.search("shazam", after_task_uid=task.task_uid)
+    client.get_tasks()
+    index.search("shazam")
+
+    assert (cache.hits, cache.misses) == (2, 4)
+    assert len([path for method, path in sent if "search" in path]) == 5
+
+
+def test_clients_sharing_a_cache_do_not_share_their_results(index_with_documents):
+    cache = SearchCache()
+    uid = index_with_documents().uid
+    tenant = meilisearch.Client(
+        BASE_URL, MASTER_KEY, search_cache=cache, custom_headers={"X-Tenant": "1"}
+    )
+
+    _client(cache, []).index(uid).search("shazam")
+    tenant.index(uid).search("shazam")
+    tenant.index(uid).search("shazam")
+
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_ttl_lru_and_concurrent_invalidation():
+    now = [0.0]
+    cache = SearchCache(max_entries=2, ttl=10, clock=lambda: now[0])
+
+    cache.put("a", ["movies"], {"hits": [1]}, cache.generation)
+    cache.put("b", ["books"], {"hits": [2]}, cache.generation)
+    assert cache.get("a") == {"hits": [1]}
+    cache.put("c", ["books"], {"hits": [3]}, cache.generation)
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    now[0] = 11.0
+    assert cache.get("a") is None
+
+    generation = cache.generation
+    cache.observe(
+        Task(
+            uid=3,
+            indexUid="books",
+            status="succeeded",
+            type="settingsUpdate",
+            enqueuedAt="2024-01-01T00:00:00.000000Z",
+        )
+    )
+    cache.put("d", ["movies"], {"hits": []}, generation)
+    assert cache.get("c") is None
+    assert cache.get("d") is None
+
+
+def test_async_search_cache(index_with_documents):
+    uid = index_with_documents().uid
+    cache = SearchCache()
+
+    async def run():
+        async with meilisearch.AsyncClient(BASE_URL, MASTER_KEY, search_cache=cache) as client:
+            index = client.index(uid)
+            first = await index.search("shazam")
+            second = await index.search("shazam")
+            task = await index.delete_all_documents()
+            await client.wait_for_task(task.task_uid)
+            third = await index.search("shazam")
+        return first, second, third
+
+    first, second, third = asyncio.run(run())
+    assert first == second
+    assert third["hits"] == []
+    assert (cache.hits, cache.misses) == (1, 2)
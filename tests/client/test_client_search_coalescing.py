@@ -0,0 +1,130 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import meilisearch
+from meilisearch._single_flight import AsyncSingleFlight, SingleFlight
+from meilisearch.errors import MeilisearchError
+from meilisearch.search_cache import SearchCache
+from tests import BASE_URL, MASTER_KEY
+
+
+def test_concurrent_identical_searches_share_one_request(index_with_documents):
+    client = meilisearch.Client(BASE_URL, MASTER_KEY, coalesce_searches=True)
+    index = client.index(index_with_documents().uid)
+    post = client.http.session.post
+    sent = []
+
+    def slow_post(*args, **kwargs):
+        sent.append(args[0])
+        time.sleep(0.3)
+        return post(*args, **kwargs)
+
+    client.http.session.post = slow_post
+    with ThreadPoolExecutor(4) as pool:
+        responses = list(pool.map(lambda _: index.search("shazam", {"limit": 5}), range(4)))
+    index.search("shazam", {"limit": 6})
+
+    assert len(sent) == 2
+    assert all(response == responses[0] for response in responses)
+    responses[0]["hits"].clear()
+    assert responses[1]["hits"]
+
+
+def test_searches_sent_after_an_invalidation_do_not_join_older_ones(index_with_documents):
+    cache = SearchCache()
+    client = meilisearch.Client(BASE_URL, MASTER_KEY, coalesce_searches=True, search_cache=cache)
+    index = client.index(index_with_documents().uid)
+    post = client.http.session.post
+    sending = threading.Event()
+    sent = []
+
+    def slow_post(*args, **kwargs):
+        sent.append(args[0])
+        sending.set()
+        time.sleep(0.3)
+        return post(*args, **kwargs)
+
+    client.http.session.post = slow_post
+    with ThreadPoolExecutor(2) as pool:
+        stale = pool.submit(index.search, "shazam")
+        sending.wait()
+        cache.invalidate(index.uid)
+        fresh = pool.submit(index.search, "shazam")
+        assert stale.result() == fresh.result()
+    index.search("shazam")
+
+    assert len(sent) == 2
+    assert cache.hits == 1
+
+
+def test_single_flight_shares_the_error():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def call():
+        calls.append(1)
+        started.set()
+        release.wait()
+        raise MeilisearchError("boom")
+
+    with ThreadPoolExecutor(2) as pool:
+        leader = pool.submit(flight.do, "key", call)
+        started.wait()
+        follower = pool.submit(flight.do, "key", call)
+        time.sleep(0.05)
+        release.set()
+        for future in (leader, follower):
+            with pytest.raises(MeilisearchError):
+                future.result()
+
+    assert len(calls) == 1
+    assert flight.do("key", lambda: {"hits": []}) == {"hits": []}
+
+
+def test_async_single_flight_survives_the_cancellation_of_the_first_caller():
+    async def run():
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def call():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"hits": [1]}
+
+        leader = asyncio.ensure_future(flight.do("key", call))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("key", call))
+        await asyncio.sleep(0)
+        leader.cancel()
+        result = await follower
+        again = await flight.do("key", call)
+        return calls, result, again
+
+    calls, result, again = asyncio.run(run())
+    assert len(calls) == 2
+    assert result == again == {"hits": [1]}
+
+
+def test_async_concurrent_identical_searches_share_one_request(index_with_documents):
+    uid = index_with_documents().uid
+    sent = []
+
+    async def run():
+        async with meilisearch.AsyncClient(
+            BASE_URL,
+            MASTER_KEY,
+            coalesce_searches=True,
+            on_request_metrics=lambda metrics: sent.append(metrics.path),
+        ) as client:
+            index = client.index(uid)
+            return await asyncio.gather(*(index.search("shazam") for _ in range(5)))
+
+    responses = asyncio.run(run())
+    assert len([path for path in sent if path.endswith("/search")]) == 1
+    assert all(response == responses[0] for response in responses)
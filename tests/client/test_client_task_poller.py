@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import as_completed
+from unittest.mock import patch
+
+import pytest
+
+import meilisearch
+from meilisearch.errors import MeilisearchError, MeilisearchTimeoutError
+from meilisearch.models.task import TaskResults
+from tests import BASE_URL, MASTER_KEY
+
+
+def _task(uid, status):
+    return {
+        "uid": uid,
+        "indexUid": "movies",
+        "status": status,
+        "type": "documentAdditionOrUpdate",
+        "enqueuedAt": "2024-01-01T00:00:00.000000Z",
+    }
+
+
+def _results(results):
+    return TaskResults(results=results, limit=20, total=len(results), from_=None, next_=None)
+
+
+def test_watched_tasks_are_polled_together():
+    client = meilisearch.Client(BASE_URL, MASTER_KEY)
+    finished = set()
+    polled = []
+
+    def get_tasks(parameters):
+        uids = [int(uid) for uid in parameters["uids"].split(",")]
+        if "statuses" not in parameters:
+            return _results([_task(uid, "succeeded") for uid in uids])
+        polled.append(uids)
+        return _results([_task(uid, "processing") for uid in uids if uid not in finished])
+
+    with patch.object(client.task_handler, "get_tasks", side_effect=get_tasks):
+        futures = [client.watch_task(1), client.index("movies").watch_task(2)]
+        while [1, 2] not in polled:
+            time.sleep(0.01)
+        finished.add(1)
+        assert futures[0].result(timeout=5).uid == 1
+        assert not futures[1].done()
+        finished.add(2)
+        done = [future.result().uid for future in as_completed(futures, timeout=5)]
+        client.close()
+
+    assert sorted(done) == [1, 2]
+    assert polled[-1] == [2]
+
+
+def test_task_future_callbacks_timeouts_and_cancellation():
+    client = meilisearch.Client(BASE_URL, MASTER_KEY)
+    processing = _results([_task(1, "processing")])
+    called = []
+
+    with patch.object(client.task_handler, "get_tasks", return_value=processing):
+        future = client.watch_task(1)
+        future.add_done_callback(called.append)
+        with pytest.raises(FutureTimeoutError):
+            future.result(timeout=0.05)
+        client.close()
+
+    assert future.cancelled()
+    assert called == [future]
+    with pytest.raises(RuntimeError):
+        client.watch_task(1)
+
+
+def test_task_future_of_a_real_task(empty_index, small_movies):
+    index = empty_index()
+    future = index.watch_task(index.add_documents(small_movies))
+
+    assert future.result(timeout=10).status == "succeeded"
+    assert asyncio.run(_await(index.watch_task(future.task_uid))).uid == future.task_uid
+    with pytest.raises(MeilisearchError):
+        index.watch_task(10**9).result(timeout=10)
+
+
+async def _await(future):
+    return await future
+
+
+def test_watched_tasks_fail_with_unexpected_errors_and_polling_resumes():
+    client = meilisearch.Client(BASE_URL, MASTER_KEY)
+
+    def get_tasks(parameters):
+        return _results([] if "statuses" in parameters else [_task(1, "succeeded")])
+
+    with patch.object(client.task_handler, "get_tasks", side_effect=ValueError("bad payload")):
+        with pytest.raises(ValueError):
+            client.watch_task(1).result(timeout=5)
+    with patch.object(client.task_handler, "get_tasks", side_effect=get_tasks):
+        assert client.watch_task(1).result(timeout=5).uid == 1
+        client.close()
+
+
+def test_watched_tasks_survive_transient_errors():
+    client = meilisearch.Client(BASE_URL, MASTER_KEY)
+    calls = []
+
+    def get_tasks(parameters):
+        calls.append(parameters)
+        if len(calls) == 1:
+            raise MeilisearchTimeoutError("timed out")
+        return _results([] if "statuses" in parameters else [_task(123, "succeeded")])
+
+    with patch.object(client.task_handler, "get_tasks", side_effect=get_tasks):
+        assert client.watch_task(123).result(timeout=5).uid == 123
+        client.close()
+
+    assert len(calls) == 3
+
+
+def test_closing_does_not_wait_for_a_stuck_poll():
+    client = meilisearch.Client(BASE_URL, MASTER_KEY)
+    polling = threading.Event()
+    release = threading.Event()
+
+    def get_tasks(parameters):
+        polling.set()
+        release.wait(10)
+        return _results([])
+
+    with patch.object(client.task_handler, "get_tasks", side_effect=get_tasks):
+        future = client.watch_task(1)
+        polling.wait(5)
+        started = time.monotonic()
+        client.close()
+        release.set()
+
+    assert time.monotonic() - started < 5
+    assert future.cancelled()
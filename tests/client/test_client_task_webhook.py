@@ -0,0 +1,156 @@
+import asyncio
+import gzip
+import http.client
+import json
+import threading
+from unittest.mock import patch
+from urllib.parse import urlsplit
+
+import requests
+
+import meilisearch
+from meilisearch.models.task import Task, TaskResults
+from meilisearch.webhook_receiver import TaskWebhookReceiver
+from tests import BASE_URL, MASTER_KEY
+
+
+def _task(uid, status):
+    return {
+        "uid": uid,
+        "indexUid": "movies",
+        "status": status,
+        "type": "documentAdditionOrUpdate",
+        "enqueuedAt": "2024-01-01T00:00:00.000000Z",
+    }
+
+
+def _notify(receiver, *tasks, delay=0.0):
+    body = gzip.compress(b"\n".join(json.dumps(task).encode() for task in tasks) + b"\n")
+
+    def send():
+        requests.post(
+            receiver.url,
+            data=body,
+            headers={"Authorization": f"Bearer {receiver.token}", "Content-Encoding": "gzip"},
+            timeout=5,
+        )
+
+    threading.Timer(delay, send).start()
+
+
+def test_receiver_parses_notifications():
+    receiver = TaskWebhookReceiver()
+    receiver.start()
+    try:
+        assert requests.post(receiver.url, data=b"{}", timeout=5).status_code == 401
+        _notify(receiver, _task(1, "succeeded"), _task(2, "processing"), _task(3, "failed"))
+
+        received = receiver.wait([1, 2, 3], timeout=5)
+        assert {uid: task.status for uid, task in received.items()} == {
+            1: "succeeded",
+            3: "failed",
+        }
+        assert receiver.wait([2], timeout=0.05) == {}
+        assert receiver.wait([3], timeout=0)[3].status == "failed"
+    finally:
+        receiver.close()
+
+
+def test_receiver_reads_chunked_notifications():
+    receiver = TaskWebhookReceiver()
+    receiver.start()
+    try:
+        body = gzip.compress(json.dumps(_task(7, "succeeded")).encode() + b"\n")
+        response = requests.post(
+            receiver.url,
+            data=iter([body[:10], body[10:]]),
+            headers={"Authorization": f"Bearer {receiver.token}", "Content-Encoding": "gzip"},
+            timeout=5,
+        )
+        assert response.status_code == 200
+        assert receiver.wait([7], timeout=0)[7].status == "succeeded"
+
+        url = urlsplit(receiver.url)
+        connection = http.client.HTTPConnection(url.hostname, url.port, timeout=5)
+        connection.putrequest("POST", url.path or "/")
+        connection.putheader("Authorization", f"Bearer {receiver.token}")
+        connection.endheaders()
+        assert connection.getresponse().status == 411
+        connection.close()
+    finally:
+        receiver.close()
+
+
+def test_wait_for_task_is_resolved_by_the_webhook():
+    client = meilisearch.Client(BASE_URL, MASTER_KEY)
+    receiver = client.listen_for_tasks()
+    assert receiver.url in [webhook.url for webhook in client.get_webhooks().results]
+    processing = Task(**_task(1, "processing"))
+    watched = TaskResults(
+        results=[_task(2, "processing")], limit=20, total=1, from_=None, next_=None
+    )
+
+    with (
+        patch.object(client.task_handler, "get_task", return_value=processing) as get_task,
+        patch.object(client.task_handler, "get_tasks", return_value=watched),
+    ):
+        _notify(receiver, _task(1, "succeeded"), delay=0.05)
+        assert client.wait_for_task(1, timeout_in_ms=5000).status == "succeeded"
+        _notify(receiver, _task(2, "failed"), delay=0.05)
+        assert client.index("movies").watch_task(2).result(timeout=5).status == "failed"
+
+    assert get_task.call_count == 1
+    uuid = receiver.webhook_uuid
+    client.close()
+    webhooks = meilisearch.Client(BASE_URL, MASTER_KEY).get_webhooks().results
+    assert uuid not in [webhook.uuid for webhook in webhooks]
+
+
+def test_waiting_falls_back_to_polling():
+    client = meilisearch.Client(BASE_URL, MASTER_KEY)
+    client.listen_for_tasks(TaskWebhookReceiver(fallback_after=0.05))
+    statuses = ["processing", "succeeded"]
+
+    def get_task(uid):
+        return Task(**_task(uid, statuses.pop(0)))
+
+    with patch.object(client.task_handler, "get_task", side_effect=get_task):
+        assert client.wait_for_task(1, timeout_in_ms=5000).status == "succeeded"
+    client.close()
+
+
+def test_async_wait_for_task_is_resolved_by_the_webhook():
+    async def run():
+        async with meilisearch.AsyncClient(BASE_URL, MASTER_KEY) as client:
+            receiver = await client.listen_for_tasks()
+            processing = Task(**_task(1, "processing"))
+            with patch.object(client.task_handler, "get_task", return_value=processing):
+                _notify(receiver, _task(1, "succeeded"), _task(2, "succeeded"), delay=0.05)
+                future = client.watch_task(2)
+                task = await client.wait_for_task(1, timeout_in_ms=5000)
+                assert (await asyncio.wait_for(future, 5)).uid == 2
+        return task
+
+    assert asyncio.run(run()).status == "succeeded"
+
+
+def test_tasks_finished_before_being_watched_are_resolved_early():
+    client = meilisearch.Client(BASE_URL, MASTER_KEY)
+    receiver = client.listen_for_tasks(TaskWebhookReceiver(fallback_after=30))
+    _notify(receiver, _task(1, "succeeded"))
+    receiver.wait([1], timeout=5)
+
+    def get_tasks(parameters):
+        uids = [int(uid) for uid in parameters["uids"].split(",")]
+        if "statuses" in parameters:
+            results = [_task(uid, "processing") for uid in uids if uid != 2]
+        else:
+            results = [_task(uid, "succeeded") for uid in uids]
+        return TaskResults(results=results, limit=20, total=len(results), from_=None, next_=None)
+
+    with patch.object(client.task_handler, "get_tasks", side_effect=get_tasks):
+        assert client.watch_task(1).done()
+        processing = client.watch_task(3)
+        assert client.watch_task(2).result(timeout=5).status == "succeeded"
+        assert not processing.done()
+    client.close()
@@ -1,7 +1,28 @@
+import gzip
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
 import requests
 
+import meilisearch
 from meilisearch._httprequests import HttpRequests
+from meilisearch.circuit_breaker import CircuitBreaker
 from meilisearch.config import Config
+from meilisearch.errors import (
+    MeilisearchApiError,
+    MeilisearchCircuitOpenError,
+    MeilisearchCommunicationError,
+)
+from meilisearch.hedging import HedgingPolicy
+from meilisearch.json_codec import JsonCodec
+from meilisearch.retry import RetryBudget, RetryPolicy
 from meilisearch.version import qualified_version
 from tests import BASE_URL, MASTER_KEY
 
@@ -33,13 +54,433 @@ def test_get_headers_with_multiple_user_agent():
 
 
 def test_reset_content_type_header():
-    """Tests that the content type header is reset when no content type is provided."""
+    """Tests that the content type header is not sent when no content type is provided."""
     config = Config(BASE_URL, MASTER_KEY, timeout=None)
     http = HttpRequests(config=config)
+    http.post("indexes", {"uid": "movies"})
 
-    http.headers["Content-Type"] = "application/json"
-    assert http.headers["Content-Type"] == "application/json"
-
-    http.send_request(http_method=requests.get, path="health")
+    with patch("requests.Session.get") as mock_get:
+        mock_get.configure_mock(__name__="get")
+        mock_get.return_value = _json_response(b'{"status": "available"}')
+        http.send_request(http_method=http.session.get, path="health")
 
+    assert "Content-Type" not in mock_get.call_args.kwargs["headers"]
     assert "Content-Type" not in http.headers
+
+
+def _json_response(content: bytes, status_code: int = 200) -> requests.Response:
+    response = requests.models.Response()
+    response.status_code = status_code
+    response._content = content  # pylint: disable=protected-access
+    return response
+
+
+def test_concurrent_requests_send_their_own_content_type():
+    """Tests that a shared client never mixes up headers of concurrent requests."""
+    client = meilisearch.Client(BASE_URL, MASTER_KEY)
+    index = client.index("movies")
+    sent = []
+
+    def post(url, **kwargs):
+        sent.append((url, kwargs["headers"].get("Content-Type")))
+        if url.endswith("/search"):
+            return _json_response(b'{"hits": []}')
+        return _json_response(
+            b'{"taskUid": 1, "indexUid": "movies", "status": "enqueued",'
+            b' "type": "documentAdditionOrUpdate", "enqueuedAt": "2024-01-01T00:00:00.000000Z"}'
+        )
+
+    def run(i):
+        if i % 2:
+            index.search("wonder")
+        else:
+            index.add_documents_csv(b"id,title\n1,Wonder Woman\n")
+
+    with patch.object(client.http.session, "post", side_effect=post) as mock_post:
+        mock_post.configure_mock(__name__="post")
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(run, range(2000)))
+
+    assert len(sent) == 2000
+    for url, content_type in sent:
+        expected = "application/json" if url.endswith("/search") else "text/csv"
+        assert content_type == expected
+    assert "Content-Type" not in client.http.headers
+
+
+_DECOMPRESS = {
+    "gzip": gzip.decompress,
+    "zstd": lambda data: (
+        pytest.importorskip("zstandard").ZstdDecompressor().decompressobj().decompress(data)
+    ),
+    "br": lambda data: pytest.importorskip("brotli").decompress(data),
+}
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "zstd", "br"])
+def test_document_bodies_are_compressed(encoding, small_movies):
+    pytest.importorskip({"gzip": "gzip", "zstd": "zstandard", "br": "brotli"}[encoding])
+    metrics = []
+    client = meilisearch.Client(
+        BASE_URL, MASTER_KEY, compression=encoding, on_request_metrics=metrics.append
+    )
+
+    with patch.object(client.http.session, "post") as mock_post:
+        mock_post.configure_mock(__name__="post")
+        mock_post.return_value = _json_response(
+            b'{"taskUid": 1, "indexUid": "movies", "status": "enqueued",'
+            b' "type": "documentAdditionOrUpdate", "enqueuedAt": "2024-01-01T00:00:00.000000Z"}'
+        )
+        client.index("movies").add_documents(small_movies)
+
+    kwargs = mock_post.call_args.kwargs
+    assert kwargs["headers"]["Content-Encoding"] == encoding
+    assert json.loads(_DECOMPRESS[encoding](kwargs["data"])) == small_movies
+    assert metrics[0].content_encoding == encoding
+    assert metrics[0].sent_size == len(kwargs["data"])
+    assert metrics[0].compression_ratio > 2
+
+
+def test_search_and_small_bodies_are_not_compressed():
+    client = meilisearch.Client(BASE_URL, MASTER_KEY, compression="gzip")
+
+    with patch.object(client.http.session, "post") as mock_post:
+        mock_post.configure_mock(__name__="post")
+        mock_post.return_value = _json_response(b'{"hits": []}')
+        client.index("movies").search("x" * 2000)
+        client.index("documents").search("x" * 2000)
+        client.index("settings").search("x" * 2000)
+        client.http.post("indexes/movies/documents", [{"id": 1}])
+
+    for call in mock_post.call_args_list:
+        assert "Content-Encoding" not in call.kwargs["headers"]
+
+
+def test_unknown_compression():
+    with pytest.raises(ValueError):
+        meilisearch.Client(BASE_URL, MASTER_KEY, compression="deflate")
+
+
+def test_compressed_file_upload(empty_index, songs_ndjson, tmp_path):
+    path = tmp_path / "songs.ndjson"
+    path.write_bytes(songs_ndjson)
+    metrics = []
+    client = meilisearch.Client(
+        BASE_URL, MASTER_KEY, compression="gzip", on_request_metrics=metrics.append
+    )
+    index = client.index(empty_index().uid)
+
+    task = index.wait_for_task(index.add_documents_from_file(path).task_uid)
+
+    assert task.status == "succeeded"
+    upload = next(m for m in metrics if m.method == "POST")
+    assert upload.body_size == len(songs_ndjson)
+    assert upload.compression_ratio > 2
+    assert index.get_stats().number_of_documents == len(songs_ndjson.splitlines())
+
+
+def test_request_metrics():
+    metrics = []
+    client = meilisearch.Client(BASE_URL, MASTER_KEY, on_request_metrics=metrics.append)
+    client.health()
+
+    assert metrics[0].method == "GET"
+    assert metrics[0].path == "health"
+    assert metrics[0].status_code == 200
+    assert metrics[0].elapsed > 0
+    assert metrics[0].compression_ratio is None
+
+
+@pytest.mark.parametrize("codec", ["stdlib", "orjson", "msgspec", "auto"])
+def test_json_codec_encodes_without_serializer(codec, empty_index):
+    if codec in ("orjson", "msgspec"):
+        pytest.importorskip(codec)
+    client = meilisearch.Client(BASE_URL, MASTER_KEY, json_codec=codec)
+    index = client.index(empty_index().uid)
+    document_id = uuid4()
+    when = datetime(2024, 5, 17, 12, 30)
+    task = index.add_documents(
+        [{"id": document_id, "title": "café", "when": when, "price": Decimal("9.99")}]
+    )
+    index.wait_for_task(task.task_uid)
+
+    document = index.get_document(str(document_id))
+    assert document.title == "café"
+    assert document.when == when.isoformat()
+    assert document.price == "9.99"
+    assert client.index(index.uid).search("")["hits"][0]["id"] == str(document_id)
+
+
+def test_custom_json_codec():
+    class CountingCodec(JsonCodec):
+        def __init__(self):
+            self.encoded = 0
+            self.decoded = 0
+
+        def encode(self, obj):
+            self.encoded += 1
+            return super().encode(obj)
+
+        def decode(self, data):
+            self.decoded += 1
+            return super().decode(data)
+
+    codec = CountingCodec()
+    client = meilisearch.Client(BASE_URL, MASTER_KEY, json_codec=codec)
+    client.create_index("movies")
+    client.health()
+
+    assert client.config.json_codec is codec
+    assert codec.encoded == 1
+    assert codec.decoded == 2
+
+
+def test_unknown_json_codec():
+    with pytest.raises(ValueError):
+        meilisearch.Client(BASE_URL, MASTER_KEY, json_codec="simplejson")
+
+
+_TASK = (
+    b'{"taskUid": 1, "indexUid": "movies", "status": "enqueued",'
+    b' "type": "documentAdditionOrUpdate", "enqueuedAt": "2024-01-01T00:00:00.000000Z"}'
+)
+
+
+def test_retry_searches_on_unavailable():
+    metrics = []
+    client = meilisearch.Client(
+        BASE_URL,
+        MASTER_KEY,
+        retry=RetryPolicy(max_attempts=3, backoff_factor=0),
+        on_request_metrics=metrics.append,
+    )
+    unavailable = _json_response(b'{"message": "unavailable"}', 503)
+
+    with patch.object(client.http.session, "post") as mock_post:
+        mock_post.configure_mock(__name__="post")
+        mock_post.side_effect = [unavailable, unavailable, _json_response(b'{"hits": []}')]
+        assert client.index("movies").search("wonder") == {"hits": []}
+
+    assert mock_post.call_count == 3
+    assert metrics[0].attempts == 3
+    assert metrics[0].status_code == 200
+
+
+def test_retry_gives_up_after_max_attempts():
+    client = meilisearch.Client(
+        BASE_URL, MASTER_KEY, retry=RetryPolicy(max_attempts=2, backoff_factor=0)
+    )
+
+    with patch.object(client.http.session, "get") as mock_get:
+        mock_get.configure_mock(__name__="get")
+        mock_get.return_value = _json_response(b'{"message": "unavailable"}', 503)
+        with pytest.raises(MeilisearchApiError):
+            client.health()
+
+    assert mock_get.call_count == 2
+
+
+def test_document_writes_are_not_retried_after_being_sent():
+    client = meilisearch.Client(
+        BASE_URL, MASTER_KEY, retry=RetryPolicy(max_attempts=3, backoff_factor=0)
+    )
+
+    with patch.object(client.http.session, "post") as mock_post:
+        mock_post.configure_mock(__name__="post")
+        mock_post.return_value = _json_response(b'{"message": "unavailable"}', 503)
+        with pytest.raises(MeilisearchApiError):
+            client.index("movies").add_documents([{"id": 1}])
+        mock_post.side_effect = requests.exceptions.ReadTimeout("read timed out")
+        with pytest.raises(meilisearch.errors.MeilisearchTimeoutError):
+            client.index("movies").add_documents([{"id": 1}])
+
+    assert mock_post.call_count == 2
+
+
+def test_document_writes_are_retried_when_not_sent(tmp_path):
+    path = tmp_path / "movies.json"
+    path.write_bytes(b'[{"id": 1}]')
+    client = meilisearch.Client(
+        BASE_URL, MASTER_KEY, retry=RetryPolicy(max_attempts=3, backoff_factor=0)
+    )
+    sent = []
+
+    def post(url, **kwargs):
+        data = kwargs["data"]
+        sent.append(data if isinstance(data, bytes) else data.read())
+        if len(sent) % 2:
+            raise requests.exceptions.ConnectTimeout("connect timed out")
+        return _json_response(_TASK)
+
+    with patch.object(client.http.session, "post", side_effect=post) as mock_post:
+        mock_post.configure_mock(__name__="post")
+        client.index("movies").add_documents([{"id": 1}])
+        client.index("movies").add_documents_from_file(path)
+
+    assert sent == [b'[{"id": 1}]'] * 4
+
+
+def test_retry_after_header():
+    client = meilisearch.Client(
+        BASE_URL, MASTER_KEY, retry=RetryPolicy(max_attempts=2, max_backoff=1)
+    )
+    throttled = _json_response(b'{"message": "too many requests"}', 429)
+    throttled.headers["Retry-After"] = "0.2"
+
+    with patch.object(client.http.session, "get") as mock_get, patch("time.sleep") as sleep:
+        mock_get.configure_mock(__name__="get")
+        mock_get.side_effect = [throttled, _json_response(b'{"status": "available"}')]
+        assert client.health() == {"status": "available"}
+        sleep.assert_called_once_with(pytest.approx(0.2, abs=0.1))
+
+        # Waiting longer than max_backoff is not worth it: the error is raised right away.
+        throttled.headers["Retry-After"] = "60"
+        mock_get.side_effect = [throttled]
+        with pytest.raises(MeilisearchApiError):
+            client.health()
+
+
+def test_retry_budget_limits_retries():
+    budget = RetryBudget(max_tokens=4, token_ratio=1)
+    client = meilisearch.Client(
+        BASE_URL, MASTER_KEY, retry=RetryPolicy(max_attempts=10, backoff_factor=0, budget=budget)
+    )
+
+    with patch.object(client.http.session, "get") as mock_get:
+        mock_get.configure_mock(__name__="get")
+        mock_get.side_effect = requests.exceptions.ConnectionError("connection reset")
+        with pytest.raises(MeilisearchCommunicationError):
+            client.health()
+
+    # Retries stop once half of the tokens are spent.
+    assert mock_get.call_count == 2
+    assert budget.tokens == 2
+
+    with patch.object(client.http.session, "get") as mock_get:
+        mock_get.configure_mock(__name__="get")
+        mock_get.return_value = _json_response(b'{"status": "available"}')
+        client.health()
+
+    assert budget.tokens == 3
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_circuit_breaker_opens_on_errors_and_probes_health():
+    clock = _Clock()
+    breaker = CircuitBreaker(minimum_calls=4, open_timeout=10, clock=clock)
+    client = meilisearch.Client(BASE_URL, MASTER_KEY, circuit_breaker=breaker)
+    unavailable = _json_response(b'{"message": "unavailable"}', 503)
+
+    with patch.object(client.http.session, "post") as mock_post:
+        mock_post.configure_mock(__name__="post")
+        mock_post.return_value = unavailable
+        for _ in range(4):
+            with pytest.raises(MeilisearchApiError):
+                client.index("movies").search("wonder")
+        assert breaker.state(BASE_URL) == "open"
+
+        with pytest.raises(MeilisearchCircuitOpenError) as error:
+            client.index("movies").search("wonder")
+        assert error.value.retry_in == 10
+        assert mock_post.call_count == 4
+
+        with patch.object(client.http.session, "get") as mock_get:
+            # A failed probe keeps the circuit open for another open_timeout.
+            clock.now = 10
+            mock_get.return_value = unavailable
+            with pytest.raises(MeilisearchCircuitOpenError):
+                client.index("movies").search("wonder")
+            assert breaker.state(BASE_URL) == "open"
+
+            clock.now = 20
+            mock_get.return_value = _json_response(b'{"status": "available"}')
+            mock_post.return_value = _json_response(b'{"hits": []}')
+            assert client.index("movies").search("wonder") == {"hits": []}
+            assert breaker.state(BASE_URL) == "closed"
+
+        assert [call.args[0] for call in mock_get.call_args_list] == [f"{BASE_URL}/health"] * 2
+        assert mock_post.call_count == 5
+
+
+def test_circuit_breaker_opens_on_latency():
+    breaker = CircuitBreaker(slow_call_duration=1, minimum_calls=4)
+
+    for elapsed in (0.1, 2, 0.1):
+        breaker.record(BASE_URL, elapsed, failed=False)
+    assert breaker.state(BASE_URL) == "closed"
+    breaker.record(BASE_URL, 3, failed=False)
+
+    assert breaker.state(BASE_URL) == "open"
+    assert breaker.state("http://127.0.0.1:7701") == "closed"
+    with pytest.raises(MeilisearchCircuitOpenError):
+        breaker.acquire(BASE_URL)
+
+
+def test_hedged_search():
+    hedging = HedgingPolicy(delay=0.05)
+    client = meilisearch.Client(BASE_URL, MASTER_KEY, hedging=hedging)
+    calls = []
+    lock = threading.Lock()
+
+    def post(url, **kwargs):
+        with lock:
+            calls.append(url)
+            call = len(calls)
+        if call == 1:
+            time.sleep(0.5)
+            return _json_response(b'{"hits": ["slow"]}')
+        return _json_response(b'{"hits": ["hedge"]}')
+
+    with patch.object(client.http.session, "post", side_effect=post) as mock_post:
+        mock_post.configure_mock(__name__="post")
+        started = time.monotonic()
+        assert client.index("movies").search("wonder") == {"hits": ["hedge"]}
+        assert time.monotonic() - started < 0.4
+        # Fast responses are not hedged.
+        assert client.index("movies").search("wonder") == {"hits": ["hedge"]}
+
+    assert calls == [f"{BASE_URL}/indexes/movies/search"] * 3
+    assert (hedging.fired, hedging.won) == (1, 1)
+    client.close()
+
+
+def test_searches_are_not_hedged_when_no_thread_is_free():
+    hedging = HedgingPolicy(delay=0.01)
+    client = meilisearch.Client(BASE_URL, MASTER_KEY, hedging=hedging, pool_maxsize=1)
+    slots = client.http._hedging_slots  # pylint: disable=protected-access
+
+    def post(url, **kwargs):
+        time.sleep(0.1)
+        return _json_response(b'{"hits": []}')
+
+    with patch.object(client.http.session, "post", side_effect=post) as mock_post:
+        mock_post.configure_mock(__name__="post")
+        slots.acquire()  # pylint: disable=consider-using-with
+        client.index("movies").search("wonder")
+        assert (mock_post.call_count, hedging.fired) == (1, 0)
+        slots.acquire()  # pylint: disable=consider-using-with
+        client.index("movies").search("wonder")
+        assert (mock_post.call_count, hedging.fired) == (2, 0)
+        slots.release()
+        slots.release()
+        client.index("movies").search("wonder")
+        assert (mock_post.call_count, hedging.fired) == (4, 1)
+    client.close()
+
+
+def test_hedging_delay_follows_observed_latencies():
+    hedging = HedgingPolicy(percentile=95, min_samples=50)
+    for i in range(49):
+        hedging.record(i / 100)
+    assert hedging.hedge_delay() is None
+
+    for i in range(49, 100):
+        hedging.record(i / 100)
+    assert hedging.hedge_delay() == 0.95
@@ -20,7 +20,7 @@ def test_meilisearch_api_error_wrong_master_key():
         client.create_index("some_index")
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_meilisearch_api_error_no_code(mock_post):
     """Here to test for regressions related to https://github.com/meilisearch/meilisearch-python/issues/305."""
     mock_post.configure_mock(__name__="post")
@@ -33,7 +33,7 @@ def test_meilisearch_api_error_no_code(mock_post):
         client.create_index("some_index")
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_meilisearch_api_error_falls_back_to_raw_message_for_non_json_response(mock_post):
     """Uses raw response text when an API error body is not valid JSON."""
     mock_post.configure_mock(__name__="post")
@@ -53,7 +53,7 @@ def test_meilisearch_api_error_falls_back_to_raw_message_for_non_json_response(m
     assert exc.value.type is None
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_meilisearch_api_error_falls_back_to_raw_message_for_non_object_json_response(mock_post):
     """Uses raw response text when parsed JSON is not an object."""
     mock_post.configure_mock(__name__="post")
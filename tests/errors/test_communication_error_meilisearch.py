@@ -8,7 +8,7 @@ from meilisearch.errors import MeilisearchCommunicationError
 from tests import MASTER_KEY
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_meilisearch_communication_error_host(mock_post):
     mock_post.configure_mock(__name__="post")
     mock_post.side_effect = requests.exceptions.ConnectionError()
@@ -17,7 +17,7 @@ def test_meilisearch_communication_error_host(mock_post):
         client.create_index("some_index")
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_meilisearch_communication_error_no_protocol(mock_post):
     mock_post.configure_mock(__name__="post")
     mock_post.side_effect = requests.exceptions.InvalidSchema()
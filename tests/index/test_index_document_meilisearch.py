@@ -10,6 +10,7 @@ import pytest
 from meilisearch.errors import MeilisearchApiError
 from meilisearch.models.document import Document
 from meilisearch.models.task import TaskInfo
+from tests.common import INDEX_UID
 
 
 class CustomEncoder(JSONEncoder):
@@ -76,6 +77,105 @@ def test_add_documents_in_batches(
     assert index.get_primary_key() == expected_primary_key
 
 
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_add_documents_in_batches_concurrently(max_concurrency, empty_index, small_movies):
+    index = empty_index()
+    response = index.add_documents_in_batches(
+        small_movies, batch_size=5, max_concurrency=max_concurrency
+    )
+    assert ceil(len(small_movies) / 5) == len(response)
+
+    for r in response:
+        assert index.wait_for_task(r.task_uid).status == "succeeded"
+    assert index.get_stats().number_of_documents == len(small_movies)
+
+
+def test_update_documents_in_batches_concurrently_keeps_order_per_document(empty_index):
+    index = empty_index()
+    # Every batch rewrites the same document, so the last batch must be enqueued last.
+    documents = [{"id": 1, "title": f"title {i}"} for i in range(20)]
+    response = index.update_documents_in_batches(documents, batch_size=1, max_concurrency=8)
+
+    assert [r.task_uid for r in response] == sorted(r.task_uid for r in response)
+    index.wait_for_task(response[-1].task_uid)
+    assert index.get_document(1).title == "title 19"
+
+
+def test_update_documents_in_batches_concurrently_orders_by_the_index_primary_key(client):
+    task = client.create_index(INDEX_UID, {"primaryKey": "sku"})
+    client.wait_for_task(task.task_uid)
+    index = client.index(INDEX_UID)
+    # The id attribute looks like a primary key, but the index uses sku.
+    documents = [{"id": i, "sku": "a", "title": f"title {i}"} for i in range(20)]
+    response = index.update_documents_in_batches(documents, batch_size=1, max_concurrency=8)
+
+    assert [r.task_uid for r in response] == sorted(r.task_uid for r in response)
+    index.wait_for_task(response[-1].task_uid)
+    assert index.get_document("a").title == "title 19"
+
+
+def test_add_documents_in_batches_with_max_payload_size(empty_index, small_movies):
+    index = empty_index()
+    max_payload_size = 4096
+    response = index.add_documents_in_batches(small_movies, max_payload_size=max_payload_size)
+
+    assert len(response) > 1
+    for r in response:
+        assert index.wait_for_task(r.task_uid).status == "succeeded"
+    assert index.get_stats().number_of_documents == len(small_movies)
+
+
+def test_add_documents_in_batches_with_max_payload_size_never_exceeds_it(
+    empty_index, small_movies, monkeypatch
+):
+    index = empty_index()
+    payloads = []
+    send = index.http.post
+
+    def record(path, body=None, *args, **kwargs):
+        payloads.append(body)
+        return send(path, body, *args, **kwargs)
+
+    monkeypatch.setattr(index.http, "post", record)
+    index.add_documents_in_batches(small_movies, batch_size=15, max_payload_size=4096)
+
+    assert all(len(payload) <= 4096 for payload in payloads)
+    assert all(len(json.loads(payload)) <= 15 for payload in payloads)
+    assert sum(len(json.loads(payload)) for payload in payloads) == len(small_movies)
+
+
+def test_add_documents_stream(empty_index, small_movies):
+    index = empty_index()
+    consumed = []
+
+    def documents():
+        for movie in small_movies:
+            consumed.append(movie)
+            yield movie
+
+    stream = index.add_documents_stream(documents(), max_payload_size=4096)
+    first = next(stream)
+    assert isinstance(first, TaskInfo)
+    assert len(consumed) < len(small_movies)
+
+    response = [first, *stream]
+    assert len(response) > 1
+    for r in response:
+        assert index.wait_for_task(r.task_uid).status == "succeeded"
+    assert index.get_stats().number_of_documents == len(small_movies)
+
+
+def test_update_documents_stream(index_with_documents):
+    index = index_with_documents()
+    documents = ({"id": movie_id, "title": "updated"} for movie_id in ("166428", "287947"))
+    response = list(index.update_documents_stream(documents))
+
+    assert len(response) == 1
+    index.wait_for_task(response[0].task_uid)
+    assert index.get_document("166428").title == "updated"
+    assert index.get_document("287947").title == "updated"
+
+
 def test_add_documents_custom_serializer(empty_index):
     documents = [
         {"id": uuid4(), "title": "test 1", "when": datetime.now()},
@@ -358,6 +458,23 @@ def test_get_documents_filter_with_fields(index_with_documents):
     assert next(iter(genres)) == "action"
 
 
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_documents(index_with_documents, small_movies, prefetch):
+    index = index_with_documents()
+    documents = list(index.iter_documents(page_size=7, prefetch=prefetch))
+    assert len(documents) == len(small_movies)
+    assert all(isinstance(document, Document) for document in documents)
+    assert {document.id for document in documents} == {movie["id"] for movie in small_movies}
+
+
+def test_iter_documents_raw_with_fields(index_with_documents, small_movies):
+    index = index_with_documents()
+    documents = list(index.iter_documents(fields=["id"], page_size=10, raw=True))
+    assert documents == [{"id": movie["id"]} for movie in small_movies]
+    with pytest.raises(ValueError):
+        index.iter_documents(page_size=0)
+
+
 def test_get_similar_documents(empty_index):
     index = empty_index()
     index.update_embedders({"manual": {"source": "userProvided", "dimensions": 3}})
@@ -581,6 +698,169 @@ def test_add_documents_ndjson(empty_index, songs_ndjson):
     assert index.get_primary_key() == "id"
 
 
+def test_add_documents_ndjson_in_batches(empty_index, songs_ndjson):
+    index = empty_index()
+    response = index.add_documents_raw_in_batches(songs_ndjson, max_payload_size=1024)
+
+    assert len(response) > 1
+    for r in response:
+        assert index.wait_for_task(r.task_uid).status == "succeeded"
+    assert index.get_stats().number_of_documents == len(songs_ndjson.splitlines())
+
+
+def test_add_documents_csv_in_batches(empty_index, songs_csv):
+    index = empty_index()
+    response = index.add_documents_raw_in_batches(
+        songs_csv, max_payload_size=1024, content_type="text/csv"
+    )
+
+    assert len(response) > 1
+    for r in response:
+        assert index.wait_for_task(r.task_uid).status == "succeeded"
+    assert index.get_stats().number_of_documents == len(songs_csv.splitlines()) - 1
+
+
+def test_add_documents_csv_in_batches_keeps_quoted_newlines_and_header(empty_index):
+    index = empty_index()
+    bodies = []
+    index.add_documents_raw = lambda body, *args, **kwargs: bodies.append(body)
+    csv = b'id,title\n1,"first\nline"\n2,second\n3,"a ""quoted"" title"\n'
+
+    index.add_documents_raw_in_batches(csv, max_payload_size=1, content_type="text/csv")
+
+    assert bodies == [
+        b'id,title\n1,"first\nline"\n',
+        b"id,title\n2,second\n",
+        b'id,title\n3,"a ""quoted"" title"\n',
+    ]
+
+
+def test_add_documents_raw_in_batches_rejects_json(empty_index):
+    with pytest.raises(ValueError):
+        empty_index().add_documents_raw_in_batches(
+            b"[]", max_payload_size=1024, content_type="application/json"
+        )
+
+
+@pytest.mark.parametrize(
+    "file_name, fixture",
+    [
+        ("songs.ndjson", "songs_ndjson"),
+        ("songs.csv", "songs_csv"),
+        ("movies.json", "small_movies_json_file"),
+    ],
+)
+def test_add_documents_from_file(file_name, fixture, empty_index, tmp_path, request, monkeypatch):
+    path = tmp_path / file_name
+    path.write_bytes(request.getfixturevalue(fixture))
+    index = empty_index()
+    sent = []
+    send = index.http.session.post
+
+    # Named post since requests are told apart by the name of the session method.
+    def post(*args, **kwargs):
+        sent.append(kwargs["data"])
+        return send(*args, **kwargs)
+
+    monkeypatch.setattr(index.http.session, "post", post)
+    response = index.add_documents_from_file(path)
+
+    assert not isinstance(sent[0], bytes)
+    task = index.wait_for_task(response.task_uid)
+    assert task.status == "succeeded"
+    assert index.get_primary_key() == "id"
+
+
+def test_update_documents_from_file(index_with_documents, songs_ndjson, tmp_path):
+    path = tmp_path / "songs.jsonl"
+    path.write_bytes(songs_ndjson)
+    index = index_with_documents()
+    response = index.update_documents_from_file(path)
+
+    assert index.wait_for_task(response.task_uid).status == "succeeded"
+
+
+def test_add_documents_from_file_unknown_extension(empty_index, tmp_path):
+    path = tmp_path / "songs.txt"
+    path.write_bytes(b"")
+
+    with pytest.raises(ValueError):
+        empty_index().add_documents_from_file(path)
+
+
+@pytest.mark.parametrize("max_concurrency", [None, 4])
+def test_add_documents_from_file_in_batches_ndjson(
+    max_concurrency, empty_index, songs_ndjson, tmp_path
+):
+    path = tmp_path / "songs.ndjson"
+    path.write_bytes(songs_ndjson)
+    index = empty_index()
+    response = index.add_documents_from_file_in_batches(
+        path, max_payload_size=1024, max_concurrency=max_concurrency
+    )
+
+    assert len(response) > 1
+    for r in response:
+        assert index.wait_for_task(r.task_uid).status == "succeeded"
+    assert index.get_stats().number_of_documents == len(songs_ndjson.splitlines())
+
+
+def test_add_documents_from_file_in_batches_csv(empty_index, songs_csv, tmp_path):
+    path = tmp_path / "songs.csv"
+    path.write_bytes(songs_csv)
+    index = empty_index()
+    response = index.add_documents_from_file_in_batches(path, max_payload_size=1024)
+
+    assert len(response) > 1
+    for r in response:
+        assert index.wait_for_task(r.task_uid).status == "succeeded"
+    assert index.get_stats().number_of_documents == len(songs_csv.splitlines()) - 1
+
+
+def test_add_documents_from_file_in_batches_splits_on_csv_records(empty_index, tmp_path):
+    path = tmp_path / "documents.csv"
+    path.write_bytes(b'id;title\n1;"first\nline"\n2;second\n3;"a ""quoted"" title"')
+    index = empty_index()
+    calls = []
+    index.add_documents_raw = lambda body, *args, **kwargs: calls.append((body, args))
+
+    index.add_documents_from_file_in_batches(path, max_payload_size=20, csv_delimiter=";")
+
+    assert [body for body, _ in calls] == [
+        b'id;title\n1;"first\nline"\n',
+        b"id;title\n2;second\n",
+        b'id;title\n3;"a ""quoted"" title"',
+    ]
+    assert all(args == (None, "text/csv", ";") for _, args in calls)
+
+
+@pytest.mark.parametrize("max_payload_size", [5, 10])
+def test_csv_batches_smaller_than_a_record_send_each_record_on_its_own(
+    empty_index, tmp_path, max_payload_size
+):
+    content = b'id,title\n1,first\n2,"two\nlines"\n'
+    path = tmp_path / "documents.csv"
+    path.write_bytes(content)
+    index = empty_index()
+    calls = []
+    index.add_documents_raw = lambda body, *args, **kwargs: calls.append(body)
+    expected = [b"id,title\n1,first\n", b'id,title\n2,"two\nlines"\n']
+
+    index.add_documents_from_file_in_batches(path, max_payload_size=max_payload_size)
+    assert calls == expected
+    calls.clear()
+    index.add_documents_raw_in_batches(content, max_payload_size, content_type="text/csv")
+    assert calls == expected
+
+
+def test_add_documents_from_file_in_batches_rejects_json(empty_index, tmp_path):
+    path = tmp_path / "movies.json"
+    path.write_bytes(b"[]")
+
+    with pytest.raises(ValueError):
+        empty_index().add_documents_from_file_in_batches(path, max_payload_size=1024)
+
+
 def test_update_documents_ndjson(index_with_documents, songs_ndjson):
     """Tests updating a single document with ndjson string."""
     index = index_with_documents()
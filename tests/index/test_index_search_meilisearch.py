@@ -649,3 +649,27 @@ def test_get_similar_documents_show_performance_details(empty_index):
     assert "hits" in response
     assert response["id"] == "doc1"
     assert isinstance(response["performanceDetails"], dict)
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_search(index_with_documents, prefetch):
+    """Tests iterating over the hits of a search page by page."""
+    index = index_with_documents()
+    expected = index.search("", {"limit": 1000})["hits"]
+
+    hits = list(index.iter_search("", page_size=7, prefetch=prefetch))
+
+    assert hits == expected
+    assert len(hits) == 31
+
+
+def test_iter_search_with_offset_and_limit(index_with_documents):
+    """Tests that offset and limit bound the hits of an iterated search."""
+    index = index_with_documents()
+    expected = index.search("", {"limit": 1000})["hits"][3:15]
+
+    hits = index.iter_search("", {"offset": 3, "limit": 12}, page_size=5)
+
+    assert list(hits) == expected
+    with pytest.raises(ValueError):
+        index.iter_search("", {"hitsPerPage": 10})
@@ -1,9 +1,17 @@
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
 
-from meilisearch.errors import MeilisearchTimeoutError
-from meilisearch.models.task import Task
+import meilisearch
+from meilisearch._polling import PollingSchedule
+from meilisearch.errors import (
+    MeilisearchError,
+    MeilisearchTaskFailedError,
+    MeilisearchTimeoutError,
+)
+from meilisearch.models.task import Batch, Task, TaskResults
+from tests import BASE_URL, MASTER_KEY
 
 
 def test_wait_for_task_default(index_with_documents):
@@ -48,3 +56,130 @@ def test_wait_for_task_interval_zero(index_with_documents, small_movies):
     assert wait_update.status is not None
     assert wait_update.status != "enqueued"
     assert wait_update.status != "processing"
+
+
+def test_wait_for_tasks_polls_all_tasks_together(empty_index, small_movies):
+    metrics = []
+    index = empty_index()
+    index.http.config.on_request_metrics = metrics.append
+    uids = [index.add_documents(small_movies[i : i + 5]).task_uid for i in range(0, 30, 5)]
+
+    tasks = list(index.wait_for_tasks(uids, timeout_in_ms=10_000))
+
+    assert sorted(task.uid for task in tasks) == sorted(uids)
+    assert all(task.status == "succeeded" for task in tasks)
+    assert len([m for m in metrics if m.method == "GET" and m.path.startswith("tasks?")]) <= 2
+    index.http.config.on_request_metrics = None
+
+
+def _task(uid, status):
+    return {
+        "uid": uid,
+        "indexUid": "movies",
+        "status": status,
+        "type": "documentAdditionOrUpdate",
+        "enqueuedAt": "2024-01-01T00:00:00.000000Z",
+        "error": {"message": "invalid document"} if status == "failed" else None,
+    }
+
+
+def test_wait_for_tasks_yields_tasks_as_they_finish():
+    client = meilisearch.Client(BASE_URL, MASTER_KEY)
+    polls = [[_task(1, "processing"), _task(2, "enqueued")], [_task(2, "processing")], []]
+    finished = {1: _task(1, "succeeded"), 2: _task(2, "failed")}
+
+    def get_tasks(parameters):
+        if "statuses" in parameters:
+            results = polls.pop(0)
+        else:
+            results = [finished[int(uid)] for uid in parameters["uids"].split(",")]
+        return TaskResults(results=results, limit=20, total=len(results), from_=None, next_=None)
+
+    with patch.object(client.task_handler, "get_tasks", side_effect=get_tasks):
+        tasks = client.wait_for_tasks([1, 2], interval_in_ms=0)
+        assert next(tasks).uid == 1
+        assert len(polls) == 1
+        assert next(tasks).status == "failed"
+
+        polls = [[_task(1, "processing")], [], [_task(2, "enqueued")]]
+        tasks = client.wait_for_tasks([1, 2], interval_in_ms=0, fail_fast=True)
+        with pytest.raises(MeilisearchTaskFailedError) as error:
+            list(tasks)
+        assert error.value.task.uid == 2
+
+
+def test_wait_for_tasks_fails_on_unknown_tasks():
+    client = meilisearch.Client(BASE_URL, MASTER_KEY)
+
+    def get_tasks(parameters):
+        results = [] if "statuses" in parameters else [_task(1, "succeeded")]
+        return TaskResults(results=results, limit=20, total=len(results), from_=None, next_=None)
+
+    with patch.object(client.task_handler, "get_tasks", side_effect=get_tasks):
+        tasks = client.wait_for_tasks([1, 2], timeout_in_ms=60_000)
+        assert next(tasks).uid == 1
+        with pytest.raises(MeilisearchError, match="Task 2 was not found"):
+            next(tasks)
+
+
+def test_wait_for_tasks_timeout():
+    client = meilisearch.Client(BASE_URL, MASTER_KEY)
+    pending = TaskResults(
+        results=[_task(1, "processing")], limit=20, total=1, from_=None, next_=None
+    )
+
+    with patch.object(client.task_handler, "get_tasks", return_value=pending):
+        with pytest.raises(MeilisearchTimeoutError):
+            list(client.wait_for_tasks([1], timeout_in_ms=0))
+
+
+def test_wait_for_task_backs_off_exponentially():
+    client = meilisearch.Client(BASE_URL, MASTER_KEY)
+    statuses = ["enqueued", "processing", "processing", "processing", "succeeded"]
+
+    def get_task(uid):
+        return Task(**_task(uid, statuses.pop(0)))
+
+    with (
+        patch.object(client.task_handler, "get_task", side_effect=get_task),
+        patch("meilisearch.task.sleep") as mock_sleep,
+    ):
+        assert client.wait_for_task(1, max_interval_in_ms=30).status == "succeeded"
+
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [0.01, 0.02, 0.03, 0.03]
+
+
+def test_wait_for_task_polls_when_batch_progress_says_it_is_done():
+    client = meilisearch.Client(BASE_URL, MASTER_KEY)
+    statuses = ["processing", "processing", "succeeded"]
+    percentages = [10.0, 20.0]
+
+    def get_task(uid):
+        return Task(**_task(uid, statuses.pop(0)), batchUid=3)
+
+    def get_batch(uid):
+        return Batch(uid=uid, progress={"percentage": percentages.pop(0), "steps": []})
+
+    with (
+        patch.object(client.task_handler, "get_task", side_effect=get_task),
+        patch.object(client.task_handler, "get_batch", side_effect=get_batch) as mock_batch,
+        patch("meilisearch.task.sleep"),
+    ):
+        assert client.wait_for_task(1).status == "succeeded"
+
+    assert mock_batch.call_count == 2
+
+
+def test_polling_schedule_estimates_the_remaining_time():
+    now = [0.0]
+    schedule = PollingSchedule(max_interval_in_ms=60_000, clock=lambda: now[0])
+
+    assert schedule.next_delay(10.0) == 0.01
+    now[0] = 1.0
+    assert schedule.next_delay(20.0) == 8.0
+    now[0] = 2.0
+    assert schedule.next_delay(20.0) == 16.0
+
+    stalled = PollingSchedule(clock=lambda: now[0])
+    assert [stalled.next_delay(10.0) for _ in range(3)] == [0.01, 0.02, 0.04]
+    assert PollingSchedule(1000).next_delay(50.0) == 1.0